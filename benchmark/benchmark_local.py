@@ -0,0 +1,285 @@
+"""
+Offline benchmark of the estimators on the datasets bundled in `datasets/` and on
+seeded synthetic datasets. Nothing is downloaded, so it can run without network
+access:
+
+    python -m benchmark.benchmark_local --suite local synthetic \
+        --backend pandas pandas_pyarrow --repeat 3
+
+Each (dataset, estimator, backend) is fitted `repeat` times. Every run appends a
+row with its fit and predict times (seconds) and the peak RSS and the peak
+memory allocated by Python during fit and predict (bytes, measured in separate
+processes, see `benchmark.memory`) to `<output>/<platform>/results.csv`. The top
+allocation sites of each phase are appended to
+`<output>/<platform>/allocations.jsonl`, and the environment of the run is
+written to `<output>/<platform>/environment.json`.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import typing
+from dataclasses import asdict
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.metrics import accuracy_score, mean_absolute_error
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder
+
+from benchmark.memory import measure_memory
+from benchmark.synthetic import Synthetic
+from sklearnmodels.scikit.boosting_classification import (
+    NominalGradientBoostingClassifier,
+)
+from sklearnmodels.scikit.boosting_regression import NominalGradientBoostingRegressor
+from sklearnmodels.scikit.forest_classification import NominalRandomForestClassifier
+from sklearnmodels.scikit.forest_regression import NominalRandomForestRegressor
+from sklearnmodels.scikit.naive_bayes import NaiveBayesClassifier
+from sklearnmodels.scikit.rule_cn2 import CN2Classifier, CN2Regressor
+from sklearnmodels.scikit.rule_oner import OneRClassifier, OneRRegressor
+from sklearnmodels.scikit.rule_prism import PRISMClassifier
+from sklearnmodels.scikit.rule_zeror import ZeroRClassifier, ZeroRRegressor
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+
+datasets_path = Path("datasets")
+default_output = Path("benchmark/local")
+
+# estimator factories for each task
+estimators: dict[str, dict[str, typing.Callable]] = {
+    "tree": {"classification": TreeClassifier, "regression": TreeRegressor},
+    "oner": {"classification": OneRClassifier, "regression": OneRRegressor},
+    "zeror": {"classification": ZeroRClassifier, "regression": ZeroRRegressor},
+    "prism": {"classification": PRISMClassifier},
+    "cn2": {"classification": CN2Classifier, "regression": CN2Regressor},
+    "naive_bayes": {"classification": NaiveBayesClassifier},
+    "random_forest": {
+        "classification": partial(
+            NominalRandomForestClassifier, n_estimators=20, random_state=0
+        ),
+        "regression": partial(
+            NominalRandomForestRegressor, n_estimators=20, random_state=0
+        ),
+    },
+    "gradient_boosting": {
+        "classification": NominalGradientBoostingClassifier,
+        "regression": NominalGradientBoostingRegressor,
+    },
+}
+
+
+metrics = [
+    "fit_time",
+    "predict_time",
+    "fit_peak_rss",
+    "predict_peak_rss",
+    "fit_peak_memory",
+    "predict_peak_memory",
+]
+
+
+class Dataset(typing.NamedTuple):
+    suite: str
+    name: str
+    task: str
+    load: typing.Callable[[], tuple[pd.DataFrame, np.ndarray]]
+
+
+def read_csv(path: Path, task: str):
+    # the last column is the target; rows without a target are dropped
+    df = pd.read_csv(path)
+    df = df.dropna(subset=df.columns[-1:])
+    x = df.iloc[:, :-1]
+    y = df.iloc[:, -1]
+    if task == "classification":
+        y = LabelEncoder().fit_transform(y)
+    else:
+        y = y.to_numpy(dtype=float)
+    return x, y
+
+
+def local_datasets(path: Path = datasets_path) -> list[Dataset]:
+    return [
+        Dataset("local", f.stem, task, partial(read_csv, f, task))
+        for task in ["classification", "regression"]
+        for f in sorted((path / task).glob("*.csv"))
+    ]
+
+
+def synthetic_datasets(**params) -> list[Dataset]:
+    specs = [
+        Synthetic(task=task, **params) for task in ["classification", "regression"]
+    ]
+    return [Dataset("synthetic", s.name, s.task, s.generate) for s in specs]
+
+
+def score(task: str, y, y_pred) -> float:
+    if task == "classification":
+        return accuracy_score(y, y_pred)
+    return mean_absolute_error(y, y_pred)
+
+
+def measure_time(estimator, x_train, y_train, x_test) -> tuple[dict, np.ndarray]:
+    start = time.perf_counter()
+    estimator.fit(x_train, y_train)
+    fit_time = time.perf_counter() - start
+    start = time.perf_counter()
+    y_pred = estimator.predict(x_test)
+    predict_time = time.perf_counter() - start
+    return {"fit_time": fit_time, "predict_time": predict_time}, y_pred
+
+
+def run(
+    dataset: Dataset, estimator_name: str, backend: str, repeat: int
+) -> tuple[list[dict], list[dict]]:
+    # rows of the results and allocation sites of each repeat
+    factory = estimators[estimator_name][dataset.task]
+    x, y = dataset.load()
+    x_train, x_test, y_train, y_test = train_test_split(
+        x, y, train_size=0.8, shuffle=True, random_state=0
+    )
+    common = {
+        "suite": dataset.suite,
+        "dataset": dataset.name,
+        "task": dataset.task,
+        "estimator": estimator_name,
+        "backend": backend,
+        "samples": len(x_train),
+        "features": x.shape[1],
+        "classes": len(np.unique(y)) if dataset.task == "classification" else 0,
+    }
+    rows, allocations = [], []
+    for i in range(repeat):
+        estimator = factory().set_params(backend=backend)
+        try:
+            times, y_pred = measure_time(estimator, x_train, y_train, x_test)
+            memory, sites = measure_memory(estimator, x_train, y_train, x_test)
+            allocations.append({**common, "repeat": i, **sites})
+            result = {
+                **times,
+                **memory,
+                "score": score(dataset.task, y_test, y_pred),
+                "complexity": estimator.complexity(),
+                "error": "",
+            }
+        except Exception as e:
+            result = {
+                **dict.fromkeys(metrics, np.nan),
+                "error": f"{type(e).__name__}: {e}",
+            }
+        rows.append({**common, "repeat": i, **result})
+    return rows, allocations
+
+
+def platform_name() -> str:
+    try:
+        import cpuinfo
+
+        name = cpuinfo.get_cpu_info()["brand_raw"]
+    except ImportError:
+        name = platform.processor() or platform.machine()
+    name = "".join(name.split(" ")).replace("(R)", "").replace("(TM)", "")
+    return name.replace("/", "-").replace("_", "-")
+
+
+def git_commit() -> str:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+def environment() -> dict:
+    return {
+        "platform": platform_name(),
+        "python": sys.version.split(" ")[0],
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "commit": git_commit(),
+    }
+
+
+def benchmark(
+    datasets: list[Dataset],
+    estimator_names: list[str],
+    backends: list[str],
+    repeat: int,
+    output: Path,
+    verbose=True,
+) -> pd.DataFrame:
+    env = environment()
+    output = output / env["platform"]
+    output.mkdir(parents=True, exist_ok=True)
+    run_id = time.strftime("%Y%m%d-%H%M%S")
+    with open(output / "environment.json", "w") as f:
+        json.dump({**env, "run": run_id}, f, indent=2)
+
+    rows, allocations = [], []
+    for dataset in datasets:
+        for name in estimator_names:
+            if dataset.task not in estimators[name]:
+                continue
+            for backend in backends:
+                if verbose:
+                    print(f"{dataset.name}: {name}[{backend}]")
+                run_rows, run_allocations = run(dataset, name, backend, repeat)
+                rows += run_rows
+                allocations += run_allocations
+    df = pd.DataFrame.from_records(rows)
+    df.insert(0, "run", run_id)
+    df.insert(1, "commit", env["commit"])
+    results_path = output / "results.csv"
+    df.to_csv(results_path, mode="a", header=not results_path.exists(), index=False)
+    with open(output / "allocations.jsonl", "a") as f:
+        for a in allocations:
+            f.write(json.dumps({"run": run_id, "commit": env["commit"], **a}) + "\n")
+    return df
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--suite",
+        nargs="+",
+        default=["local", "synthetic"],
+        choices=["local", "synthetic"],
+    )
+    parser.add_argument(
+        "--estimator", nargs="+", default=list(estimators), choices=list(estimators)
+    )
+    parser.add_argument("--backend", nargs="+", default=["pandas"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=default_output)
+    synthetic = parser.add_argument_group("synthetic datasets")
+    for field, value in asdict(Synthetic()).items():
+        if field != "task":
+            name = "--" + field.replace("_", "-")
+            synthetic.add_argument(name, type=type(value), default=value)
+    args = parser.parse_args(args)
+
+    datasets = []
+    if "local" in args.suite:
+        datasets += local_datasets()
+    if "synthetic" in args.suite:
+        params = {
+            field: getattr(args, field)
+            for field in asdict(Synthetic())
+            if field != "task"
+        }
+        datasets += synthetic_datasets(**params)
+    df = benchmark(datasets, args.estimator, args.backend, args.repeat, args.output)
+    summary = df.groupby(["dataset", "estimator", "backend"])[metrics].median()
+    with pd.option_context("display.max_rows", None, "display.width", 120):
+        print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,9 @@ from sklearn.tree import DecisionTreeClassifier
 from sklearnmodels.scikit.tree_classification import TreeClassifier
 from sklearnmodels.tests import get_model_complexity
 
+from benchmark.memory import measure_memory
+from benchmark.plots import speedup_plot
+
 basepath = Path("benchmark/openml_cc18/")
 
 
@@ -171,12 +174,13 @@ def benchmark(
 
         pbar.set_postfix_str(f"{dataset.name}: input={n}x{m} => {classes} classes")
         model = model_generator(x, classes)
+        memory, _ = measure_memory(model, x, y, x)
         start = time.time_ns()
         model.fit(x, y)
-        train_elapsed = (time.time_ns() - start) / 10e9
+        train_elapsed = (time.time_ns() - start) / 1e9
         start = time.time_ns()
         y_pred = model.predict(x)
-        test_elapsed = (time.time_ns() - start) / 10e9
+        test_elapsed = (time.time_ns() - start) / 1e9
         acc = sklearn.metrics.accuracy_score(y, y_pred)
         complexity = get_model_complexity(model)
         benchmark_result.append(
@@ -191,6 +195,7 @@ def benchmark(
                 "features": m,
                 "classes": classes,
                 "complexity": complexity,
+                **memory,
             },
         )
 
@@ -237,17 +242,10 @@ def plot_results(df: pd.DataFrame):
         # for y in ["train_time", "test_time"]:
         #     plot = lp.ggplot(df, lp.aes(x=x, y=y, color="model")) + common_options
         #     save_plot(plot, f"{x}_{y}.png")
-        aes_speedup = lp.ylim(0, 1.5) + lp.geom_hline(
-            yintercept=1, color="black", linetype="longdash"
-        )
         for y in ["train_time", "test_time"]:
             speedup_y = f"speedup_{y}"
             df_others[speedup_y] = mix[f"{y}_ref"] / mix[y]
-            plot = (
-                lp.ggplot(df_others, lp.aes(x=x, y=speedup_y, color="model"))
-                + common_options
-                + aes_speedup
-            )
+            plot = speedup_plot(df_others, x, speedup_y)
             save_plot(plot, f"{x}_{speedup_y}.png")
 
 
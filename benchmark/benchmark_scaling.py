@@ -0,0 +1,231 @@
+"""
+Scaling curves of the main fit and predict paths on synthetic datasets. Each
+sweep varies one parameter (samples `n`, features `m`, nominal `cardinality` or
+tree `depth`) while keeping the others at their base values, and times each
+component at every value:
+
+    python -m benchmark.benchmark_scaling --sweep n m cardinality depth \
+        --repeat 3 --bound n=1.5 depth=1.5
+
+The empirical exponent of a component in a parameter is the slope of the least
+squares line through log(median time) vs log(value), so that time ~ value**k.
+An O(n log n) path has an exponent slightly above 1 in n, and a quadratic one an
+exponent close to 2. Components whose exponent exceeds the bound of the
+parameter are flagged and the command exits with status 1.
+
+Timings are written to `<output>/<platform>/timings.csv` and exponents to
+`<output>/<platform>/exponents.csv`. If `lets_plot` is installed, the log-log
+curves of each sweep are saved as `<output>/<platform>/scaling_<parameter>.png`.
+"""
+
+import argparse
+import sys
+import time
+import typing
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmark.benchmark_local import environment
+from benchmark.synthetic import Synthetic
+from sklearnmodels.scikit.naive_bayes import NaiveBayesClassifier
+from sklearnmodels.scikit.rule_cn2 import CN2Classifier
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+
+default_output = Path("benchmark/scaling")
+
+base = Synthetic(n=2000, m=8, cardinality=8, classes=3, nominal_fraction=0.5)
+base_depth = 8
+
+sweeps = {
+    "n": [500, 1000, 2000, 4000, 8000, 16000],
+    "m": [2, 4, 8, 16, 32],
+    "cardinality": [2, 4, 8, 16, 32, 64],
+    "depth": [2, 4, 6, 8, 10, 12],
+}
+
+default_bounds = {"n": 1.5, "m": 1.5, "cardinality": 1.5, "depth": 1.5}
+
+
+def fit_tree(x: pd.DataFrame, y: np.ndarray, depth: int) -> float:
+    model = TreeClassifier(max_depth=depth)
+    start = time.perf_counter()
+    model.fit(x, y)
+    return time.perf_counter() - start
+
+
+def predict_tree(x: pd.DataFrame, y: np.ndarray, depth: int) -> float:
+    # only Model.predict, without the validation of the input by the estimator
+    model = TreeClassifier(max_depth=depth).fit(x, y)
+    x = model.validate_data_predict(x)
+    start = time.perf_counter()
+    model.model_.predict(x)
+    return time.perf_counter() - start
+
+
+def train(estimator) -> typing.Callable[[pd.DataFrame, np.ndarray, int], float]:
+    # time only the fit of the trainer of a classifier, on its encoded dataset
+    def measure(x: pd.DataFrame, y: np.ndarray, depth: int) -> float:
+        d, class_weight = estimator.validate_data_fit_classification(x, y)
+        trainer = estimator.make_model(d, class_weight)
+        start = time.perf_counter()
+        trainer.fit(d)
+        return time.perf_counter() - start
+
+    return measure
+
+
+class Component(typing.NamedTuple):
+    name: str
+    # parameters that the component depends on
+    parameters: list[str]
+    measure: typing.Callable[[pd.DataFrame, np.ndarray, int], float]
+
+
+components = [
+    Component("TreeClassifier.fit", ["n", "m", "cardinality", "depth"], fit_tree),
+    Component("Model.predict", ["n", "m", "cardinality", "depth"], predict_tree),
+    Component("CN2.fit", ["n", "m", "cardinality"], train(CN2Classifier())),
+    Component(
+        "NaiveBayesTrainer.fit",
+        ["n", "m", "cardinality"],
+        train(NaiveBayesClassifier()),
+    ),
+]
+
+
+def sweep(
+    parameter: str, values: list, repeat: int, verbose=True
+) -> list[dict[str, typing.Any]]:
+    rows = []
+    for value in values:
+        if parameter == "depth":
+            spec, depth = base, value
+        else:
+            spec, depth = replace(base, **{parameter: value}), base_depth
+        x, y = spec.generate()
+        for component in components:
+            if parameter not in component.parameters:
+                continue
+            if verbose:
+                print(f"{component.name}: {parameter}={value}")
+            for i in range(repeat):
+                rows.append(
+                    {
+                        "parameter": parameter,
+                        "value": value,
+                        "component": component.name,
+                        "repeat": i,
+                        "time": component.measure(x, y, depth),
+                    }
+                )
+    return rows
+
+
+def fit_exponents(timings: pd.DataFrame, bounds: dict[str, float]) -> pd.DataFrame:
+    """
+    Slope of log(median time) vs log(value) for each (parameter, component),
+    with a `flagged` column for exponents above the bound of the parameter.
+    """
+    medians = timings.groupby(["parameter", "component", "value"], as_index=False)[
+        "time"
+    ].median()
+    rows = []
+    for (parameter, component), df in medians.groupby(["parameter", "component"]):
+        exponent, _ = np.polyfit(np.log(df["value"]), np.log(df["time"]), 1)
+        bound = bounds.get(parameter, np.inf)
+        rows.append(
+            {
+                "parameter": parameter,
+                "component": component,
+                "exponent": exponent,
+                "bound": bound,
+                "flagged": exponent > bound,
+            }
+        )
+    return pd.DataFrame.from_records(rows)
+
+
+def plot_curves(timings: pd.DataFrame, output: Path) -> list[Path]:
+    try:
+        import lets_plot as lp
+    except ImportError:
+        print("lets_plot is not installed, skipping plots")
+        return []
+    medians = timings.groupby(["parameter", "component", "value"], as_index=False)[
+        "time"
+    ].median()
+    paths = []
+    for parameter, df in medians.groupby("parameter"):
+        plot = (
+            lp.ggplot(df, lp.aes(x="value", y="time", color="component"))
+            + lp.geom_line()
+            + lp.geom_point()
+            + lp.scale_x_log10()
+            + lp.scale_y_log10()
+            + lp.xlab(parameter)
+            + lp.ylab("time (s)")
+            + lp.theme(legend_position="top")
+        )
+        path = (output / f"scaling_{parameter}.png").absolute()
+        lp.ggsave(plot, filename=str(path), w=8, h=5, unit="in", dpi=150)
+        paths.append(path)
+    return paths
+
+
+def parse_bounds(bounds: list[str]) -> dict[str, float]:
+    result = dict(default_bounds)
+    for b in bounds:
+        parameter, _, value = b.partition("=")
+        if parameter not in sweeps or not value:
+            raise ValueError(f"Invalid bound {b}, expected <parameter>=<exponent>")
+        result[parameter] = float(value)
+    return result
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sweep", nargs="+", default=list(sweeps), choices=list(sweeps)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--bound",
+        nargs="*",
+        default=[],
+        help="maximum exponent of a parameter, eg n=1.5",
+    )
+    parser.add_argument("--output", type=Path, default=default_output)
+    args = parser.parse_args(args)
+    bounds = parse_bounds(args.bound)
+
+    env = environment()
+    output = args.output / env["platform"]
+    output.mkdir(parents=True, exist_ok=True)
+
+    rows = []
+    for parameter in args.sweep:
+        rows += sweep(parameter, sweeps[parameter], args.repeat)
+    timings = pd.DataFrame.from_records(rows)
+    timings.insert(0, "commit", env["commit"])
+    timings.to_csv(output / "timings.csv", index=False)
+    exponents = fit_exponents(timings, bounds)
+    exponents.insert(0, "commit", env["commit"])
+    exponents.to_csv(output / "exponents.csv", index=False)
+    plot_curves(timings, output)
+
+    with pd.option_context("display.width", 120):
+        print(exponents.drop(columns="commit").to_string(index=False))
+    flagged = exponents[exponents["flagged"]]
+    for _, r in flagged.iterrows():
+        print(
+            f"{r['component']} grows as {r['parameter']}**{r['exponent']:.2f},"
+            f" above the bound {r['bound']:g}"
+        )
+    return 1 if len(flagged) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Compares a candidate benchmark run against a baseline and fails when a tracked
+metric regresses:
+
+    python -m benchmark.compare benchmark/local/<platform>/results.csv \
+        --baseline-commit a1b2c3d --candidate-commit e4f5a6b --threshold 0.1
+
+Both inputs are CSVs with one row per run, as written by
+`benchmark.benchmark_local` (several repeats per dataset) or
+`benchmark.benchmark_openml` (a single run per dataset). Rows of a file can be
+selected by commit, so that a single results file that accumulates runs can be
+compared with itself.
+
+For each (dataset, estimator, backend) and metric, the repeats are summarized by
+their median and interquartile range (IQR). A metric regresses when the median
+of the candidate exceeds that of the baseline both by more than `threshold`
+times the baseline and by more than the largest IQR of the two, so that noisy
+differences are not reported, or when the candidate fails where the baseline
+did not. The command exits with status 1 if any metric regresses.
+
+The speedups (baseline / candidate) of time metrics and the differences of
+memory metrics are written to `<output>/comparison.csv`. If `lets_plot` is
+installed, the speedups of each time metric are plotted by dataset.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+default_metrics = [
+    "fit_time",
+    "predict_time",
+    "fit_peak_rss",
+    "predict_peak_rss",
+    "fit_peak_memory",
+    "predict_peak_memory",
+    # benchmark_openml
+    "train_time",
+    "test_time",
+]
+default_keys = ["suite", "dataset", "task", "estimator", "backend", "model"]
+
+
+def load(path: Path, commit: str | None) -> pd.DataFrame:
+    df = pd.read_csv(path)
+    if commit is not None:
+        df = df[df["commit"].astype(str) == commit]
+        if len(df) == 0:
+            raise ValueError(f"No runs of commit {commit} in {path}")
+    return df
+
+
+def iqr(x: pd.Series) -> float:
+    q1, q3 = np.nanpercentile(x, [25, 75]) if x.notna().any() else (np.nan, np.nan)
+    return q3 - q1
+
+
+def summarize(df: pd.DataFrame, keys: list[str], metrics: list[str]):
+    # median and IQR of each metric over the repeats of each key
+    long = df.melt(id_vars=keys, value_vars=metrics, var_name="metric")
+    grouped = long.groupby(keys + ["metric"], dropna=False)["value"]
+    return grouped.agg(median="median", iqr=iqr).reset_index()
+
+
+def compare(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    metrics: list[str],
+    threshold: float,
+    keys: list[str] = None,
+) -> pd.DataFrame:
+    """
+    One row per key and metric present in both runs, with the median and IQR of
+    each run, the speedup (for times), the difference of the medians and whether
+    the metric regressed.
+    """
+    if keys is None:
+        keys = [k for k in default_keys if k in baseline and k in candidate]
+    metrics = [m for m in metrics if m in baseline and m in candidate]
+    if len(keys) == 0 or len(metrics) == 0:
+        raise ValueError("The runs have no common keys or metrics to compare")
+    df = summarize(baseline, keys, metrics).merge(
+        summarize(candidate, keys, metrics),
+        on=keys + ["metric"],
+        suffixes=("_baseline", "_candidate"),
+    )
+    b, c = df["median_baseline"], df["median_candidate"]
+    df["speedup"] = np.where(df["metric"].str.endswith("_time"), b / c, np.nan)
+    df["difference"] = c - b
+    noise = np.fmax(df["iqr_baseline"], df["iqr_candidate"]).fillna(0)
+    slower = (c - b > threshold * b) & (c - b > noise)
+    failed = c.isna() & b.notna()
+    df["regressed"] = slower | failed
+    return df
+
+
+def plot_speedups(df: pd.DataFrame, output: Path) -> list[Path]:
+    try:
+        from benchmark.plots import save_plot, speedup_plot
+    except ImportError:
+        print("lets_plot is not installed, skipping plots")
+        return []
+    df = df[df["speedup"].notna()].copy()
+    # one line for each combination of the keys that are not the dataset
+    model_keys = [k for k in ["estimator", "backend", "model"] if k in df]
+    df["model"] = df[model_keys].astype(str).agg(" ".join, axis=1)
+    paths = []
+    for metric, df_metric in df.groupby("metric"):
+        plot = speedup_plot(df_metric, "dataset", "speedup")
+        paths.append(save_plot(plot, output / f"dataset_speedup_{metric}.png"))
+    return paths
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument(
+        "candidate", type=Path, nargs="?", help="defaults to the baseline file"
+    )
+    parser.add_argument("--baseline-commit")
+    parser.add_argument("--candidate-commit")
+    parser.add_argument("--metric", nargs="+", default=default_metrics)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative increase of the median that is a regression",
+    )
+    parser.add_argument("--output", type=Path, default=Path("benchmark/comparison"))
+    args = parser.parse_args(args)
+
+    baseline = load(args.baseline, args.baseline_commit)
+    candidate = load(args.candidate or args.baseline, args.candidate_commit)
+    df = compare(baseline, candidate, args.metric, args.threshold)
+    args.output.mkdir(parents=True, exist_ok=True)
+    df.to_csv(args.output / "comparison.csv", index=False)
+    plot_speedups(df, args.output)
+
+    # geometric mean of the speedups of each time metric
+    speedups = df[df["speedup"] > 0].groupby("metric")["speedup"]
+    print(speedups.agg(lambda s: np.exp(np.log(s).mean())).to_string())
+    regressions = df[df["regressed"]]
+    if len(regressions) > 0:
+        print(f"{len(regressions)} regressions above {args.threshold:.0%}:")
+        with pd.option_context("display.width", 160):
+            print(regressions.to_string(index=False))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
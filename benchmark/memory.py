@@ -0,0 +1,124 @@
+"""
+Memory used by the fit and predict of an estimator, each measured in a new
+process so that the allocations and caches of one measurement (or of the
+benchmark itself) don't affect the next.
+
+For each phase, the peak resident set size (RSS) of the process, the peak of the
+memory allocated by Python as traced by `tracemalloc`, and the source lines
+that had allocated the most memory at that peak are reported. The peak RSS
+includes the interpreter, the libraries and the data, so it is the memory that
+a machine needs to run the phase; the `tracemalloc` peak is the memory allocated
+by the phase itself.
+"""
+
+import sys
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+from sklearn.base import clone
+
+try:
+    import resource
+except ImportError:  # windows
+    resource = None
+
+
+def peak_rss() -> float:
+    # peak resident set size of this process, in bytes
+    if resource is None:
+        return np.nan
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes in linux, bytes in macos
+    return float(rss if sys.platform == "darwin" else rss * 1024)
+
+
+class PeakSnapshot:
+    """
+    Takes a `tracemalloc` snapshot whenever the traced memory reaches a new
+    maximum, polling it every `interval` seconds from a thread, so that the
+    snapshot shows the allocations at (close to) the peak and not only those
+    that are still alive at the end of the phase.
+    """
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.snapshot = None
+        self.maximum = 0
+        self.stopped = threading.Event()
+
+    def poll(self):
+        while not self.stopped.wait(self.interval):
+            self.update()
+
+    def update(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.maximum:
+            self.maximum = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def __enter__(self):
+        tracemalloc.start()
+        self.thread = threading.Thread(target=self.poll, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stopped.set()
+        self.thread.join()
+        self.update()
+        _, self.peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    def top(self, n: int) -> list[dict]:
+        if self.snapshot is None:
+            return []
+        # without the allocations of the snapshots
+        snapshot = self.snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        statistics = snapshot.statistics("lineno")[:n]
+        return [
+            {"site": str(s.traceback), "size": s.size, "count": s.count}
+            for s in statistics
+        ]
+
+
+def measure_phase(f, top: int):
+    with PeakSnapshot() as snapshot:
+        result = f()
+    memory = {"peak_rss": peak_rss(), "peak_memory": snapshot.peak}
+    return memory, snapshot.top(top), result
+
+
+def fit_memory(estimator, x, y, top: int):
+    memory, sites, _ = measure_phase(lambda: estimator.fit(x, y), top)
+    return memory, sites, estimator
+
+
+def predict_memory(estimator, x, top: int):
+    memory, sites, _ = measure_phase(lambda: estimator.predict(x), top)
+    return memory, sites
+
+
+def run_isolated(f, *args):
+    # runs f in a new process, started from scratch
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(f, *args).result()
+
+
+def measure_memory(estimator, x_train, y_train, x_test, top=10) -> tuple[dict, dict]:
+    """
+    Fits a clone of `estimator` and predicts with it in two new processes.
+    Returns the `fit_` and `predict_` `peak_rss` and `peak_memory` (bytes), and
+    the `top` allocation sites of each phase.
+    """
+    fit, fit_sites, fitted = run_isolated(
+        fit_memory, clone(estimator), x_train, y_train, top
+    )
+    predict, predict_sites = run_isolated(predict_memory, fitted, x_test, top)
+    memory = {f"fit_{k}": v for k, v in fit.items()}
+    memory |= {f"predict_{k}": v for k, v in predict.items()}
+    return memory, {"fit": fit_sites, "predict": predict_sites}
@@ -0,0 +1,204 @@
+"""
+Microbenchmarks of the inner kernels of the trainers and models, on a seeded
+synthetic dataset. Runs offline:
+
+    python -m benchmark.microbenchmarks --kernel PandasDataset.filter \
+        --n 10000 --compare <commit>
+
+Each kernel is timed as in `timeit`: the number of calls per sample is chosen so
+that a sample takes at least 0.2 seconds, and the time per call of each of
+`repeat` samples is recorded. The median and minimum times per call are written
+to `<output>/<platform>/<commit>.json`, so that the results of each commit are
+kept side by side. With `--compare`, the ratios of the median times of this run
+to those of a previous commit are printed.
+"""
+
+import argparse
+import json
+import timeit
+import typing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmark.benchmark_local import environment
+from benchmark.synthetic import Synthetic
+from sklearnmodels.backend.conditions import RangeCondition, ValueCondition
+from sklearnmodels.backend.core import Dataset
+from sklearnmodels.scikit.rule_cn2 import CN2Classifier
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.shared import EntropyError
+from sklearnmodels.shared.column_error import NominalColumnError, NumericColumnError
+
+default_output = Path("benchmark/microbenchmarks")
+
+# a kernel receives the dataset and returns the function to time
+type Kernel = typing.Callable[["Data"], typing.Callable[[], typing.Any]]
+
+
+class Data(typing.NamedTuple):
+    x: pd.DataFrame
+    y: np.ndarray
+    # encoded as by the estimators, with nominal columns as categoricals
+    d: Dataset
+    class_weight: np.ndarray
+    numeric: str
+    nominal: str
+
+
+def make_data(spec: Synthetic) -> Data:
+    x, y = spec.generate()
+    d, class_weight = TreeClassifier().validate_data_fit_classification(x, y)
+    numeric = next(c for c in x.columns if c.startswith("numeric"))
+    nominal = next(c for c in x.columns if c.startswith("nominal"))
+    return Data(x, y, d, class_weight, numeric, nominal)
+
+
+def materialize(d: Dataset):
+    # datasets filter lazily, so access the rows to time the whole filter
+    return d.x, d.y
+
+
+def median_condition(data: Data) -> RangeCondition:
+    return RangeCondition(data.numeric, data.x[data.numeric].median(), less=True)
+
+
+def value_conditions(data: Data) -> list[ValueCondition]:
+    values = data.d.unique_values(data.nominal, False)
+    return [ValueCondition(data.nominal, v) for v in values]
+
+
+def dataset_filter(data: Data):
+    condition = median_condition(data)
+    return lambda: materialize(data.d.filter(condition))
+
+
+def dataset_split(data: Data):
+    conditions = value_conditions(data)
+    return lambda: [materialize(d) for d in data.d.split(conditions)]
+
+
+def dataset_subset(data: Data):
+    mask = median_condition(data).mask(data.d)
+    return lambda: materialize(data.d.subset(mask))
+
+
+def numeric_column_error(data: Data):
+    error = NumericColumnError(EntropyError(len(data.class_weight), data.class_weight))
+    return lambda: error.error(data.d, data.numeric)
+
+
+def nominal_column_error(data: Data):
+    error = NominalColumnError(EntropyError(len(data.class_weight), data.class_weight))
+    return lambda: error.error(data.d, data.nominal)
+
+
+def average_split(data: Data):
+    metric = EntropyError(len(data.class_weight), data.class_weight)
+    partition = data.d.split(value_conditions(data))
+    for d in partition:
+        materialize(d)
+    return lambda: metric.average_split(partition)
+
+
+def condition_call(data: Data):
+    condition = median_condition(data)
+    rows = [row for _, row in data.d.x.iterrows()]
+    return lambda: [condition(row) for row in rows]
+
+
+def condition_mask(data: Data):
+    condition = median_condition(data)
+    return lambda: condition.mask(data.d)
+
+
+def tree_predict_sample(data: Data):
+    model = TreeClassifier(max_depth=8).fit(data.x, data.y).model_
+    row = data.d.x.iloc[0]
+    return lambda: model.predict_sample(row)
+
+
+def rule_model_predict(data: Data):
+    estimator = CN2Classifier().fit(data.x, data.y)
+    x = estimator.validate_data_predict(data.x)
+    return lambda: estimator.model_.predict(x)
+
+
+kernels: dict[str, Kernel] = {
+    "PandasDataset.filter": dataset_filter,
+    "PandasDataset.split": dataset_split,
+    "PandasDataset.subset": dataset_subset,
+    "NumericColumnError.error": numeric_column_error,
+    "NominalColumnError.error": nominal_column_error,
+    "TargetError.average_split": average_split,
+    "Condition.__call__": condition_call,
+    "Condition.mask": condition_mask,
+    "Tree.predict_sample": tree_predict_sample,
+    "RuleModel.predict": rule_model_predict,
+}
+
+
+def measure(f: typing.Callable[[], typing.Any], repeat: int) -> dict[str, float]:
+    timer = timeit.Timer(f)
+    number, _ = timer.autorange()
+    number = max(number, 1)
+    times = np.array(timer.repeat(repeat=repeat, number=number)) / number
+    return {"median": float(np.median(times)), "min": float(times.min())}
+
+
+def compare(results: dict, previous: dict) -> pd.DataFrame:
+    rows = [
+        {
+            "kernel": kernel,
+            "median": r["median"],
+            "previous": previous[kernel]["median"],
+            "ratio": r["median"] / previous[kernel]["median"],
+        }
+        for kernel, r in results.items()
+        if kernel in previous
+    ]
+    return pd.DataFrame.from_records(rows)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--kernel", nargs="+", default=list(kernels), choices=list(kernels)
+    )
+    parser.add_argument("--n", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=default_output)
+    parser.add_argument("--compare", help="commit of a previous run")
+    args = parser.parse_args(args)
+
+    spec = Synthetic(n=args.n, m=8, cardinality=8, classes=3, missing_rate=0.05)
+    data = make_data(spec)
+    results = {}
+    for name in args.kernel:
+        results[name] = measure(kernels[name](data), args.repeat)
+        print(f"{name}: {results[name]['median'] * 1e6:.1f}us")
+
+    env = environment()
+    output = args.output / env["platform"]
+    output.mkdir(parents=True, exist_ok=True)
+    path = output / f"{env['commit'] or 'unknown'}.json"
+    previous_results = {}
+    if path.exists():
+        with open(path) as f:
+            stored = json.load(f)
+        # keep the results of kernels that were not run this time
+        if stored["dataset"] == spec.name:
+            previous_results = stored["results"]
+    with open(path, "w") as f:
+        content = {**env, "dataset": spec.name, "repeat": args.repeat}
+        json.dump({**content, "results": previous_results | results}, f, indent=2)
+
+    if args.compare is not None:
+        with open(output / f"{args.compare}.json") as f:
+            previous = json.load(f)["results"]
+        print(compare(results, previous).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
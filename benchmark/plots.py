@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import lets_plot as lp
+import pandas as pd
+
+
+def speedup_plot(df: pd.DataFrame, x: str, y: str, color: str = "model"):
+    # speedups against a reference, with a dashed line at 1 (same speed)
+    return (
+        lp.ggplot(df, lp.aes(x=x, y=y, color=color))
+        + lp.geom_line()
+        + lp.geom_point()
+        + lp.ylim(0, 1.5)
+        + lp.geom_hline(yintercept=1, color="black", linetype="longdash")
+    )
+
+
+def save_plot(plot, path: Path, w=12, h=4):
+    lp.ggsave(plot, filename=str(path.absolute()), w=w, h=h, unit="in", dpi=300)
+    return path
@@ -0,0 +1,84 @@
+"""
+Seeded synthetic datasets for the offline benchmarks, with mixed numeric and
+nominal columns and missing values.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Synthetic:
+    task: str = "classification"
+    n: int = 1000
+    m: int = 10
+    cardinality: int = 5
+    classes: int = 2
+    missing_rate: float = 0.0
+    nominal_fraction: float = 0.5
+    noise: float = 0.1
+    seed: int = 0
+
+    @property
+    def name(self):
+        name = f"synthetic_{self.task}_n{self.n}_m{self.m}_k{self.cardinality}"
+        if self.task == "classification":
+            name += f"_c{self.classes}"
+        return f"{name}_missing{self.missing_rate:g}_seed{self.seed}"
+
+    def generate(self) -> tuple[pd.DataFrame, np.ndarray]:
+        rng = np.random.default_rng(self.seed)
+        outputs = self.classes if self.task == "classification" else 1
+        x, score = make_features(
+            rng, self.n, self.m, self.cardinality, self.nominal_fraction, outputs
+        )
+        if self.task == "classification":
+            # gumbel noise, so that classes are sampled from the softmax of the
+            # score with temperature noise
+            score += self.noise * rng.gumbel(size=score.shape)
+            y = score.argmax(axis=1)
+        elif self.task == "regression":
+            y = score + self.noise * rng.normal(size=score.shape)
+        else:
+            raise ValueError(f"Unknown task {self.task}")
+        return add_missing(rng, x, self.missing_rate), y
+
+
+def make_features(
+    rng: np.random.Generator,
+    n: int,
+    m: int,
+    cardinality: int,
+    nominal_fraction: float,
+    outputs: int,
+) -> tuple[pd.DataFrame, np.ndarray]:
+    # columns and a (n x outputs) score that depends on all of them: a random
+    # effect per value of nominal columns, and a step and a slope for numeric ones
+    n_nominal = int(round(m * nominal_fraction))
+    columns = {}
+    score = np.zeros((n, outputs))
+    for j in range(m):
+        if j < n_nominal:
+            codes = rng.integers(0, cardinality, n)
+            effects = rng.normal(size=(cardinality, outputs))
+            score += effects[codes]
+            values = np.array([f"v{k}" for k in range(cardinality)], dtype=object)
+            columns[f"nominal_{j}"] = values[codes]
+        else:
+            values = rng.normal(size=n)
+            step, slope = rng.normal(size=(2, outputs))
+            score += np.outer(values > rng.normal(), step) + np.outer(values, slope)
+            columns[f"numeric_{j}"] = values
+    return pd.DataFrame(columns), score / np.sqrt(max(m, 1))
+
+
+def add_missing(rng: np.random.Generator, x: pd.DataFrame, missing_rate: float):
+    if missing_rate <= 0:
+        return x
+    x = x.copy()
+    for c in x.columns:
+        missing = rng.random(len(x)) < missing_rate
+        x.loc[missing, c] = None if x[c].dtype == object else np.nan
+    return x
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import numbers
+import os
+import time
+from dataclasses import dataclass
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+@dataclass
+class Truncation:
+    # why and when a fit stopped growing its model, see Budget
+    reason: str
+    # seconds since the start of the fit
+    elapsed: float
+    # nodes (or rules) of the model
+    nodes: int
+    # nodes that were left as leaves instead of being split
+    open: int = 0
+
+
+def current_rss() -> int | None:
+    # current resident set size of the process, in bytes, or None if unknown
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return None
+
+
+class Budget:
+    """
+    Limits of the resources of a fit: the time since the fit started (seconds),
+    the number of nodes of a tree (or rules of a rule model) and the resident
+    memory of the process (bytes). Trainers check the budget before growing their
+    model, and stop growing it once it runs out, so that the model is still valid
+    but smaller. The first limit that is reached is recorded as a `Truncation`.
+
+    The memory limit applies to the current resident set size (RSS) of the
+    process, read from /proc/self/statm (or with psutil, if installed), rather
+    than to its peak, so memory freed before a fit doesn't count against it.
+    """
+
+    def __init__(
+        self,
+        time_limit: float | None = None,
+        max_nodes: int | None = None,
+        memory_limit: int | None = None,
+    ):
+        if time_limit is not None and (
+            not isinstance(time_limit, numbers.Real) or time_limit <= 0
+        ):
+            raise ValueError(
+                f"Invalid value '{time_limit}' for time_limit; expected None or a"
+                " number of seconds > 0"
+            )
+        if max_nodes is not None and (
+            not isinstance(max_nodes, numbers.Integral) or max_nodes < 1
+        ):
+            raise ValueError(
+                f"Invalid value '{max_nodes}' for max_nodes; expected None or an"
+                " integer >= 1"
+            )
+        if memory_limit is not None:
+            if not isinstance(memory_limit, numbers.Real) or memory_limit <= 0:
+                raise ValueError(
+                    f"Invalid value '{memory_limit}' for memory_limit; expected None"
+                    " or a number of bytes > 0"
+                )
+            if current_rss() is None:
+                raise ValueError("memory_limit is not supported on this platform")
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+        self.memory_limit = memory_limit
+        self.start()
+
+    def __repr__(self):
+        return (
+            f"Budget(time_limit={self.time_limit},max_nodes={self.max_nodes},"
+            f"memory_limit={self.memory_limit})"
+        )
+
+    def start(self, nodes: int = 1):
+        # starts a fit whose model already has the given nodes (eg, a root)
+        self.started = time.perf_counter()
+        self.nodes = nodes
+        self.open = 0
+        self.truncation: Truncation | None = None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def stop(self, reason: str):
+        self.truncation = Truncation(reason, self.elapsed(), self.nodes)
+
+    def available(self) -> bool:
+        # whether the model can keep growing; once the budget runs out, it can't
+        if self.truncation is not None:
+            return False
+        if self.time_limit is not None and self.elapsed() > self.time_limit:
+            self.stop("time_limit")
+        elif self.memory_limit is not None and current_rss() > self.memory_limit:
+            self.stop("memory_limit")
+        return self.truncation is None
+
+    def spend(self, nodes: int) -> bool:
+        # adds nodes to the model, if they fit in the budget
+        if not self.available():
+            return False
+        if self.max_nodes is not None and self.nodes + nodes > self.max_nodes:
+            self.stop("max_nodes")
+            return False
+        self.nodes += nodes
+        return True
+
+    def leave_open(self, nodes: int = 1):
+        # count nodes that are left as leaves because the budget ran out
+        if self.truncation is not None:
+            self.truncation.open += nodes
@@ -1,52 +1,110 @@
 from __future__ import annotations
 
 import abc
+import weakref
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
 from sklearnmodels.backend import InputSample
 
+if TYPE_CHECKING:
+    from .core import Dataset
+
+
+# Shared instances of conditions, see Condition.intern
+_interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
 
 # A condition can filter rows of a Dataset
 # Returns a new boolean series
+# Conditions are immutable and compared by value, so they can be shared
 class Condition(abc.ABC):
+    __slots__ = ("column", "__weakref__")
 
     def __init__(self, column: str):
         super().__init__()
         self.column = column
 
+    @abc.abstractmethod
+    def key(self) -> tuple:
+        # values that identify the condition
+        pass
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash((type(self).__name__, self.key()))
+
+    def intern(self):
+        """
+        Returns a shared instance equal to this condition, so that equal conditions
+        of large models (for example, the same ValueCondition in many subtrees)
+        are stored only once.
+        """
+        return _interned.setdefault((type(self), self.key()), self)
+
     @abc.abstractmethod
     def __call__(self, x: InputSample) -> bool:
         pass
 
     @abc.abstractmethod
-    def short_description(self) -> str:
+    def mask(self, d: Dataset) -> np.ndarray:
+        """
+        Vectorized version of `__call__`: boolean array with the rows of `d` that
+        satisfy the condition. Missing values satisfy a Value or Range condition
+        only if its `missing` flag is set, as in the row-wise evaluation.
+        Column-level comparisons are delegated to the backend of `d`.
+        """
         pass
 
-    def na_to_false(self, s: bool | any):
-        if not isinstance(s, (bool, np.bool_)):
-            return False
-        else:
-            return s
+    @abc.abstractmethod
+    def short_description(self) -> str:
+        pass
 
     def is_similar(self, c: Condition):
         pass
 
 
+def missing_description(missing: bool):
+    return " or NA" if missing else ""
+
+
+# Value and Range conditions are not satisfied by missing values, unless
+# `missing` is set, in which case they are the default branch for them
 class ValueCondition(Condition):
-    def __init__(self, column: str, value):
+    __slots__ = ("value", "missing")
+
+    def __init__(self, column: str, value, missing: bool = False):
         super().__init__(column)
         self.value = value
+        self.missing = missing
+
+    def key(self):
+        return (self.column, self.value, self.missing)
+
+    def with_missing(self):
+        return ValueCondition(self.column, self.value, True).intern()
 
     def __call__(self, x: InputSample):
-        return self.na_to_false(x[self.column] == self.value)
+        value = x[self.column]
+        if pd.isna(value):
+            return self.missing
+        return bool(value == self.value)
+
+    def mask(self, d: Dataset):
+        mask = d.value_mask(self.column, self.value)
+        if self.missing:
+            mask = mask | d.missing_mask(self.column)
+        return mask
 
     def __repr__(self):
-        return f"{self.column}={self.value}"
+        return f"{self.column}={self.value}{missing_description(self.missing)}"
 
     def short_description(self):
-        return f"{self.value}"
+        return f"{self.value}{missing_description(self.missing)}"
 
     def is_similar(self, c: Condition):
         if isinstance(c, ValueCondition):
@@ -56,29 +114,50 @@ class ValueCondition(Condition):
 
 
 class RangeCondition(Condition):
-    def __init__(self, column: str, value: float, less: bool):
+    __slots__ = ("value", "less", "missing")
+
+    def __init__(self, column: str, value: float, less: bool, missing: bool = False):
         super().__init__(column)
         self.value = value
         self.less = less
+        self.missing = missing
+
+    def key(self):
+        return (self.column, self.value, self.less, self.missing)
+
+    def with_missing(self):
+        return RangeCondition(self.column, self.value, self.less, True).intern()
 
     @classmethod
-    def make(cls, column, value):
-        return [RangeCondition(column, value, t) for t in [True, False]]
+    def make(cls, column, value, missing_less: bool | None = None):
+        # missing values go to the <= (missing_less) or > branch, or to none
+        return [
+            RangeCondition(column, value, t, missing_less == t).intern()
+            for t in [True, False]
+        ]
 
     def __call__(self, x: InputSample):
-
+        value = x[self.column]
+        if pd.isna(value):
+            return self.missing
         if self.less:
-            return self.na_to_false(x[self.column] <= self.value)
+            return bool(value <= self.value)
         else:
-            return self.na_to_false(x[self.column] > self.value)
+            return bool(value > self.value)
+
+    def mask(self, d: Dataset):
+        mask = d.range_mask(self.column, self.value, self.less)
+        if self.missing:
+            mask = mask | d.missing_mask(self.column)
+        return mask
 
     def __repr__(self):
         op = "<=" if self.less else ">"
-        return f"{self.column} {op} {self.value:.4g}"
+        return f"{self.column} {op} {self.value:.4g}{missing_description(self.missing)}"
 
     def short_description(self):
         op = "<=" if self.less else ">"
-        return f"{op} {self.value:.4g}"
+        return f"{op} {self.value:.4g}{missing_description(self.missing)}"
 
     def is_similar(self, c: Condition):
         if isinstance(c, RangeCondition):
@@ -88,11 +167,16 @@ class RangeCondition(Condition):
 
 
 class AndCondition(Condition):
+    __slots__ = ("conditions",)
+
     def __init__(self, conditions: list[Condition]):
         column = ",".join([str(c.column) for c in conditions])
         super().__init__(column)
         self.conditions = conditions
 
+    def key(self):
+        return tuple(self.conditions)
+
     def short_description(self):
         descriptions = [c.short_description() for c in self.conditions]
         descriptions = ",".join(descriptions)
@@ -104,6 +188,12 @@ class AndCondition(Condition):
                 return False
         return True
 
+    def mask(self, d: Dataset):
+        result = np.ones(d.n, dtype=bool)
+        for c in self.conditions:
+            result &= c.mask(d)
+        return result
+
     def __repr__(self):
         conditions = [f"({c})" for c in self.conditions]
         descriptions = " AND ".join(conditions)
@@ -124,12 +214,20 @@ class AndCondition(Condition):
 
 
 class TrueCondition(Condition):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("")
 
+    def key(self):
+        return ()
+
     def __call__(self, x: InputSample):
         return True
 
+    def mask(self, d: Dataset):
+        return np.ones(d.n, dtype=bool)
+
     def short_description(self):
         return "True"
 
@@ -141,13 +239,21 @@ class TrueCondition(Condition):
 
 
 class NotCondition(Condition):
+    __slots__ = ("condition",)
+
     def __init__(self, condition: Condition):
         super().__init__(condition.column)
         self.condition = condition
 
+    def key(self):
+        return (self.condition,)
+
     def __call__(self, x: InputSample):
         return not self.condition(x)
 
+    def mask(self, d: Dataset):
+        return ~self.condition.mask(d)
+
     def short_description(self):
         return f"NOT {self.condition.short_description}"
 
@@ -31,6 +31,27 @@ class Dataset(abc.ABC):
     def filter(self, condition: Condition) -> Dataset:
         pass
 
+    @abc.abstractmethod
+    def subset(self, mask: np.ndarray) -> Dataset:
+        # rows of the dataset selected by a boolean mask
+        pass
+
+    @abc.abstractmethod
+    def value_mask(self, column: ColumnID, value) -> np.ndarray:
+        # rows where column == value; missing values are False
+        pass
+
+    @abc.abstractmethod
+    def missing_mask(self, column: ColumnID) -> np.ndarray:
+        # rows where column is missing
+        pass
+
+    @abc.abstractmethod
+    def range_mask(self, column: ColumnID, value: float, less: bool) -> np.ndarray:
+        # rows where column <= value (less) or column > value (not less);
+        # missing values are False
+        pass
+
     @property
     @abc.abstractmethod
     def x(
@@ -85,6 +106,28 @@ class Dataset(abc.ABC):
     def unique_values(self, column: str, sorted: bool) -> np.ndarray:
         pass
 
+    @abc.abstractmethod
+    def codes(self, column: ColumnID, sorted: bool) -> tuple[np.ndarray, np.ndarray]:
+        # code of the value of column for each row (-1 if missing) and the
+        # distinct values, in order of appearance or sorted
+        pass
+
+    @abc.abstractmethod
+    def value_class_counts(
+        self, column: ColumnID, classes: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # distinct (non missing) values of column, in order of appearance,
+        # and a (values x classes) table of counts computed in a single pass
+        pass
+
+    @abc.abstractmethod
+    def value_target_moments(
+        self, column: ColumnID
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # distinct (non missing) values of column, in order of appearance,
+        # and for each value the count, sum and sum of squares of y
+        pass
+
     @abc.abstractmethod
     def classes(self) -> list:
         pass
@@ -121,6 +164,7 @@ class Dataset(abc.ABC):
 
 
 class Model(abc.ABC):
+    __slots__ = ()
 
     @abc.abstractmethod
     def predict_sample(self, x: InputSample):
@@ -130,13 +174,28 @@ class Model(abc.ABC):
     def output_size(self):
         pass
 
-    def predict(self, x: Input):
-        n = x.shape[0]
-        predictions = np.zeros((n, self.output_size()))
-        for i, (idx, row) in enumerate(x.iterrows()):
-            predictions[i, :] = self.predict_sample(row)
+    def predict(self, x: Input | Dataset):
+        from .factory import as_dataset
+
+        d = as_dataset(x)
+        predictions = np.zeros((d.n, self.output_size()))
+        self.predict_dataset(d, np.arange(d.n), predictions)
         return predictions
 
+    def predict_dataset(self, d: Dataset, index: np.ndarray, predictions: np.ndarray):
+        # fill predictions[index] with the predictions for the rows of d
+        # row by row by default; models override it with vectorized versions
+        for i, (_, row) in zip(index, d.x.iterrows()):
+            predictions[i, :] = self.predict_sample(row)
+
+    def to_arrays(self) -> tuple[dict[str, np.ndarray], dict]:
+        # compact representation of the model, see backend.serialization
+        raise NotImplementedError(f"{type(self).__name__} can't be serialized")
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray], metadata: dict) -> Model:
+        raise NotImplementedError(f"{cls.__name__} can't be deserialized")
+
     @abc.abstractmethod
     def pretty_print(self, class_names: list[str] = None) -> str:
         pass
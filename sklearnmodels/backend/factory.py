@@ -34,3 +34,12 @@ def make_dataset(
         return PandasDataset(x, y)
     else:
         raise ValueError(f"Backend {backend} not supported")
+
+
+def as_dataset(x: pd.DataFrame | np.ndarray | Dataset) -> Dataset:
+    # input only dataset, used to evaluate models
+    if isinstance(x, Dataset):
+        return x
+    if not isinstance(x, pd.DataFrame):
+        x = pd.DataFrame(x)
+    return PandasDataset(x, None)
@@ -4,30 +4,27 @@ from typing import Generator, Iterable
 
 import numpy as np
 import pandas as pd
-from numpy import dtype, ndarray
-from scipy.special import y1
-
-from .conditions import (
-    AndCondition,
-    Condition,
-    NotCondition,
-    RangeCondition,
-    TrueCondition,
-    ValueCondition,
-)
+from numpy import ndarray
+
+from .conditions import Condition
 from .core import ColumnID, ColumnType, Dataset
 
 
+def to_mask(s: pd.Series) -> np.ndarray:
+    # comparisons with missing values (pd.NA) are False
+    return s.to_numpy(dtype=bool, na_value=False)
+
+
 class PandasDataset(Dataset):
 
-    def __init__(self, x: pd.DataFrame, y: np.ndarray, idx=None):
+    def __init__(self, x: pd.DataFrame, y: np.ndarray | None, idx=None):
         super().__init__()
         self._x: pd.DataFrame = x
         self._y: np.ndarray = y
         self.idx = idx
         # already filtered if idx is None
         self._x_subset = idx is None
-        self._y_subset = self._x_subset
+        self._y_subset = self._x_subset or y is None
 
     @property
     def x(self) -> pd.DataFrame:
@@ -56,46 +53,68 @@ class PandasDataset(Dataset):
 
     def unique_values(self, column: ColumnID, sorted=False) -> np.ndarray:
         result = self.values(column).unique()
+        if isinstance(result, pd.Categorical):
+            result = np.asarray(result)
         if sorted:
             result.sort()
         return result
 
-    def indices(self, condition: Condition):
-        if isinstance(condition, RangeCondition):
-            rc: RangeCondition = condition
-            if rc.less:
-                idx = self.x[rc.column] <= rc.value
-            else:
-                idx = self.x[rc.column] > rc.value
-            idx.fillna(False, inplace=True)
-            return idx
-        elif isinstance(condition, ValueCondition):
-            vc: ValueCondition = condition
-            idx = self.x[vc.column] == vc.value
-            idx.fillna(False, inplace=True)
-            return idx
-        elif isinstance(condition, TrueCondition):
-            return None
-        elif isinstance(condition, NotCondition):
-            return ~self.indices(condition.condition)
-        elif isinstance(condition, AndCondition):
-            idx = None
-            for c in condition.conditions:
-                c_idx = self.indices(c)
-                if idx is None:
-                    idx = c_idx
-                else:
-                    idx = idx & c_idx
-            return idx
+    def codes(self, column: ColumnID, sorted=False):
+        codes, values = pd.factorize(self.x[column], sort=sorted, use_na_sentinel=True)
+        return codes, np.asarray(values)
+
+    def factorize(self, column: ColumnID):
+        # codes of the non missing values, in order of appearance
+        codes, values = self.codes(column)
+        present = codes >= 0
+        return codes[present], values, present
+
+    def value_class_counts(self, column: ColumnID, classes: int):
+        codes, values, present = self.factorize(column)
+        y = self.y[present]
+        counts = np.bincount(codes * classes + y, minlength=len(values) * classes)
+        return values, counts.reshape(len(values), classes)
+
+    def value_target_moments(self, column: ColumnID):
+        codes, values, present = self.factorize(column)
+        # accumulate in float64, even for float32 targets
+        y = self.y[present].astype(np.float64)
+        y = y.reshape(len(y), -1)
+        k = len(values)
+        n = np.bincount(codes, minlength=k)
+
+        def sum_by_value(v: np.ndarray):
+            sums = [
+                np.bincount(codes, weights=v[:, j], minlength=k)
+                for j in range(v.shape[1])
+            ]
+            return np.stack(sums, axis=1)
+
+        return values, n, sum_by_value(y), sum_by_value(y**2)
+
+    def value_mask(self, column: ColumnID, value):
+        return to_mask(self.x[column] == value)
+
+    def missing_mask(self, column: ColumnID):
+        return self.x[column].isna().to_numpy()
+
+    def range_mask(self, column: ColumnID, value: float, less: bool):
+        if less:
+            return to_mask(self.x[column] <= value)
         else:
-            raise ValueError(f"Invalid condition: {condition}")
+            return to_mask(self.x[column] > value)
+
+    def subset(self, mask: np.ndarray):
+        return PandasDataset(self.x, self.y, idx=mask)
 
     def filter(self, condition: Condition):
-        idx = self.indices(condition)
-        return PandasDataset(self.x, self.y, idx=idx)
+        return self.subset(condition.mask(self))
 
     @property
     def n(self):
+        if self._y is None:
+            # input only dataset, eg, for prediction
+            return len(self.x)
         return self.y.shape[0]
 
     @property
@@ -144,14 +163,14 @@ class PandasDataset(Dataset):
     def mean_y(
         self,
     ) -> np.ndarray:
-        return self.y.mean(axis=0)
+        return self.y.mean(axis=0, dtype=np.float64)
 
     def std_y(
         self,
     ) -> float:
         if self.y.shape[0] == 0:
             return np.inf
-        return np.sum(np.std(self.y, axis=0))
+        return np.sum(np.std(self.y, axis=0, dtype=np.float64))
 
     def mean_x(self, col: ColumnID) -> float:
         return self.x[col].mean()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Any, Callable, NamedTuple
+
+# receives a dict for each timed call, see FitStats
+type EventSink = Callable[[dict[str, Any]], None]
+
+
+class Profiled(NamedTuple):
+    """
+    A method of an object used by a trainer, timed as a phase of the fit while
+    profiling. `phase` is the name of the phase, or a function of the arguments
+    of the call that returns it. `rows` is a function of the arguments of the
+    call that returns the number of rows it scans. Generator methods are timed
+    while they produce each value.
+    """
+
+    target: object
+    method: str
+    phase: str | Callable[..., str]
+    rows: Callable[..., int] | None = None
+    generator: bool = False
+
+
+def dataset_rows(d, *args, **kwargs) -> int:
+    # rows scanned by a method whose first argument is a Dataset
+    return d.n
+
+
+class PhaseStats:
+    __slots__ = ("calls", "time", "rows")
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.rows = 0
+
+    def as_dict(self):
+        return {"calls": self.calls, "time": self.time, "rows": self.rows}
+
+    def __repr__(self):
+        return f"PhaseStats(calls={self.calls},time={self.time:.4f},rows={self.rows})"
+
+
+class FitStats:
+    """
+    Number of calls, time and rows scanned of each phase of a fit. Trainers list
+    the methods that implement their phases with `profiled()`, and `instrument`
+    replaces them with timed versions only for the duration of the fit, so
+    trainers run unchanged (without any checks) when profiling is off.
+
+    Phases can be nested (eg, the error computation of the candidate splits is
+    part of the split search), so their times are inclusive and don't add up to
+    the time of the fit. If `events` is given, it receives a dict with the
+    `phase`, `start` (seconds since the creation of the stats), `time` and
+    `rows` of each call as it ends.
+    """
+
+    def __init__(self, events: EventSink | None = None):
+        self.phases: dict[str, PhaseStats] = {}
+        self.events = events
+        self.start = time.perf_counter()
+
+    def add(self, phase: str, start: float, elapsed: float, rows: int = 0):
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = PhaseStats()
+        stats.calls += 1
+        stats.time += elapsed
+        stats.rows += rows
+        if self.events is not None:
+            event = {
+                "phase": phase,
+                "start": start - self.start,
+                "time": elapsed,
+                "rows": rows,
+            }
+            self.events(event)
+
+    @contextmanager
+    def phase(self, name: str, rows: int = 0):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter() - start, rows)
+
+    def timed(self, f: Callable, p: Profiled) -> Callable:
+        @wraps(f)
+        def timed_f(*args, **kwargs):
+            phase = p.phase if isinstance(p.phase, str) else p.phase(*args, **kwargs)
+            rows = 0 if p.rows is None else p.rows(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                self.add(phase, start, time.perf_counter() - start, rows)
+
+        @wraps(f)
+        def timed_generator(*args, **kwargs):
+            phase = p.phase if isinstance(p.phase, str) else p.phase(*args, **kwargs)
+            rows = 0 if p.rows is None else p.rows(*args, **kwargs)
+            start = time.perf_counter()
+            elapsed = 0.0
+            values = f(*args, **kwargs)
+            try:
+                while True:
+                    resume = time.perf_counter()
+                    try:
+                        value = next(values)
+                    except StopIteration:
+                        return
+                    finally:
+                        elapsed += time.perf_counter() - resume
+                    yield value
+            finally:
+                values.close()
+                self.add(phase, start, elapsed, rows)
+
+        return timed_generator if p.generator else timed_f
+
+    @contextmanager
+    def instrument(self, trainer):
+        """
+        Times the methods listed by `trainer.profiled()` (if any) and the whole
+        fit, restoring the original methods afterwards.
+        """
+        profiled = trainer.profiled() if hasattr(trainer, "profiled") else []
+        patched = []
+        try:
+            for p in profiled:
+                if any(p.target is t and p.method == m for t, m, _ in patched):
+                    continue
+                # methods stored in the object itself are put back after the fit
+                original = vars(p.target).get(p.method)
+                f = getattr(p.target, p.method)
+                setattr(p.target, p.method, self.timed(f, p))
+                patched.append((p.target, p.method, original))
+            with self.phase("fit"):
+                yield self
+        finally:
+            for target, method, original in patched:
+                if original is None:
+                    delattr(target, method)
+                else:
+                    setattr(target, method, original)
+
+    def __getitem__(self, phase: str) -> PhaseStats:
+        return self.phases[phase]
+
+    def __contains__(self, phase: str):
+        return phase in self.phases
+
+    def as_dict(self) -> dict[str, dict]:
+        return {phase: stats.as_dict() for phase, stats in self.phases.items()}
+
+    def __repr__(self):
+        phases = "\n".join(
+            f"  {phase}: {stats.calls} calls, {stats.time:.4f}s, {stats.rows} rows"
+            for phase, stats in self.phases.items()
+        )
+        return f"FitStats(\n{phases}\n)"
+
+
+class NoFitStats:
+    # stand-in for FitStats when profiling is off
+
+    def phase(self, name: str, rows: int = 0):
+        return nullcontext()
+
+    def instrument(self, trainer):
+        return nullcontext()
+
+
+def make_fit_stats(profile: bool | EventSink) -> FitStats | NoFitStats:
+    # profile can be a bool, or an EventSink that also enables profiling
+    if callable(profile):
+        return FitStats(profile)
+    if profile:
+        return FitStats()
+    return NoFitStats()
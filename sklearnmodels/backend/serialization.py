@@ -0,0 +1,168 @@
+"""
+Compact serialization of fitted models.
+
+A model is stored as a handful of contiguous arrays plus a small metadata
+dictionary (model class, column names and the category dictionary used to
+encode nominal values as integer codes). `save` writes them to a directory with
+one `.npy` file per array and a `model.json` file, so that `load` can memory map
+the arrays with `np.load(mmap_mode="r")` instead of copying them.
+"""
+
+from __future__ import annotations
+
+import enum
+import importlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .conditions import Condition, RangeCondition, ValueCondition
+
+FORMAT_VERSION = 1
+METADATA_FILENAME = "model.json"
+
+type Arrays = dict[str, np.ndarray]
+
+
+class ConditionKind(enum.IntEnum):
+    Value = 0
+    Less = 1
+    Greater = 2
+
+
+def to_python(x):
+    # numpy scalars to python values, so that they can be stored as json
+    if isinstance(x, np.generic):
+        return x.item()
+    return x
+
+
+class ConditionEncoder:
+    """
+    Encodes Value and Range conditions as rows of arrays (kind, column,
+    threshold, code, missing) and back. Columns are stored as indices into
+    `columns`, and the values of ValueConditions as codes into the category list
+    of their column.
+    """
+
+    def __init__(self, columns: list = None, categories: list[list] = None):
+        self.columns = [] if columns is None else list(columns)
+        if categories is None:
+            categories = [[] for _ in self.columns]
+        self.categories = [list(c) for c in categories]
+        self.column_index = {c: i for i, c in enumerate(self.columns)}
+        self.codes = [{v: j for j, v in enumerate(c)} for c in self.categories]
+
+    def column(self, column) -> int:
+        if column not in self.column_index:
+            self.column_index[column] = len(self.columns)
+            self.columns.append(column)
+            self.categories.append([])
+            self.codes.append({})
+        return self.column_index[column]
+
+    def code(self, column: int, value) -> int:
+        codes = self.codes[column]
+        if value not in codes:
+            codes[value] = len(codes)
+            self.categories[column].append(value)
+        return codes[value]
+
+    def encode(self, conditions: list[Condition], prefix: str = "") -> Arrays:
+        kind, column, threshold, code, missing = [], [], [], [], []
+        for c in conditions:
+            if isinstance(c, ValueCondition):
+                kind.append(ConditionKind.Value)
+                column.append(self.column(c.column))
+                threshold.append(np.nan)
+                code.append(self.code(column[-1], c.value))
+                missing.append(c.missing)
+            elif isinstance(c, RangeCondition):
+                kind.append(ConditionKind.Less if c.less else ConditionKind.Greater)
+                column.append(self.column(c.column))
+                threshold.append(c.value)
+                code.append(-1)
+                missing.append(c.missing)
+            else:
+                raise ValueError(f"Can't serialize condition {c}")
+        return {
+            f"{prefix}kind": np.array(kind, dtype=np.int8),
+            f"{prefix}column": np.array(column, dtype=np.int32),
+            f"{prefix}threshold": np.array(threshold, dtype=np.float64),
+            f"{prefix}code": np.array(code, dtype=np.int32),
+            f"{prefix}missing": np.array(missing, dtype=bool),
+        }
+
+    def decode(self, arrays: Arrays, prefix: str = "") -> list[Condition]:
+        kinds = arrays[f"{prefix}kind"].tolist()
+        columns = arrays[f"{prefix}column"].tolist()
+        thresholds = arrays[f"{prefix}threshold"].tolist()
+        codes = arrays[f"{prefix}code"].tolist()
+        missing = arrays[f"{prefix}missing"].tolist()
+        conditions = []
+        rows = zip(kinds, columns, thresholds, codes, missing)
+        for kind, column, threshold, code, m in rows:
+            name = self.columns[column]
+            if kind == ConditionKind.Value:
+                c = ValueCondition(name, self.categories[column][code], m)
+            else:
+                c = RangeCondition(name, threshold, kind == ConditionKind.Less, m)
+            conditions.append(c.intern())
+        return conditions
+
+    def metadata(self) -> dict:
+        return {
+            "columns": [to_python(c) for c in self.columns],
+            "categories": [[to_python(v) for v in c] for c in self.categories],
+        }
+
+    @classmethod
+    def from_metadata(cls, metadata: dict) -> ConditionEncoder:
+        return ConditionEncoder(metadata["columns"], metadata["categories"])
+
+
+def save(model, path: Path):
+    """
+    Save a fitted model (Tree, RuleModel or NaiveBayes) to the directory `path`.
+    """
+    arrays, metadata = model.to_arrays()
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    model_class = type(model)
+    metadata = {
+        "format": FORMAT_VERSION,
+        "model": f"{model_class.__module__}:{model_class.__qualname__}",
+        "arrays": list(arrays.keys()),
+        **metadata,
+    }
+    for name, array in arrays.items():
+        np.save(path / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+    with open(path / METADATA_FILENAME, "w") as f:
+        json.dump(metadata, f)
+
+
+def load_arrays(path: Path, mmap_mode: str | None = "r") -> tuple[Arrays, dict]:
+    path = Path(path)
+    with open(path / METADATA_FILENAME) as f:
+        metadata = json.load(f)
+    if metadata["format"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported model format {metadata['format']}")
+    arrays = {
+        name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+        for name in metadata["arrays"]
+    }
+    return arrays, metadata
+
+
+def load(path: Path, mmap_mode: str | None = "r"):
+    """
+    Load a model saved with `save`. With the default `mmap_mode="r"`, arrays are
+    memory mapped read-only, so loading does not copy them.
+    """
+    arrays, metadata = load_arrays(path, mmap_mode)
+    module, name = metadata["model"].split(":")
+    if module.split(".")[0] != "sklearnmodels":
+        raise ValueError(f"Invalid model class {metadata['model']}")
+    model_class = getattr(importlib.import_module(module), name)
+    return model_class.from_arrays(arrays, metadata)
@@ -34,9 +34,17 @@ class ColumnSplit(Split):
 
 
 class RangeSplit(ColumnSplit):
-    def __init__(self, column: str, value: float, x: pd.DataFrame, y: np.ndarray):
+    def __init__(
+        self,
+        column: str,
+        value: float,
+        x: pd.DataFrame,
+        y: np.ndarray,
+        missing_less: bool | None = None,
+    ):
         super().__init__(column)
         self.value = value
+        self.missing_less = missing_less
         self._partition = list(self.split(x, y))
 
     @property
@@ -45,12 +53,18 @@ class RangeSplit(ColumnSplit):
 
     @property
     def conditions(self):
-        return [RangeCondition(self.column, self.value, t) for t in [True, False]]
+        return RangeCondition.make(self.column, self.value, self.missing_less)
 
     def split(self, x: pd.DataFrame, y: np.ndarray):
-        idx = x[self.column] <= self.value
-        not_idx = (~idx).fillna(False)
-        idx = idx.fillna(False)
+        values = x[self.column]
+        missing = values.isna().to_numpy()
+        idx = (values <= self.value).to_numpy(dtype=bool, na_value=False)
+        not_idx = ~idx & ~missing
+        # missing values go to the default branch, if any
+        if self.missing_less is True:
+            idx |= missing
+        elif self.missing_less is False:
+            not_idx |= missing
 
         yield x.loc[idx], y[idx]
         yield x.loc[not_idx], y[not_idx]
@@ -1,9 +1,10 @@
 from abc import ABC
 import abc
 
-from scipy.stats import norm
 from sklearnmodels.backend import Input, InputSample
-from sklearnmodels.backend.core import Model
+from sklearnmodels.backend.core import Dataset, Model
+from sklearnmodels.backend.factory import as_dataset
+from sklearnmodels.backend.serialization import ConditionEncoder, to_python
 
 
 import numpy as np
@@ -24,8 +25,11 @@ class Variable(ABC):
 class GaussianVariable(Variable):
 
     def __init__(self, mu: float, std: float, smoothing: float = 0) -> None:
+        from scipy.stats import norm
+
         self.mu = mu
         self.std = std
+        self.smoothing = smoothing
         self.normal = norm(mu, std + smoothing)
 
     def predict(self, x: pd.Series):
@@ -91,8 +95,8 @@ class NaiveBayes(Model):
         y = self.predict(df)
         return df.iloc[0, :]
 
-    def predict(self, x: Input):
-
+    def predict(self, x: Input | Dataset):
+        x = as_dataset(x).x
         n = len(x)
         classes = self.class_names
         results = np.zeros((n, len(classes)))
@@ -146,5 +150,85 @@ class NaiveBayes(Model):
     def complexity(self) -> int:
         return max([m.complexity() for m in self.class_models])
 
+    def to_arrays(self):
+        encoder = ConditionEncoder()
+        variables = self.class_models[0].variables
+        numeric = [isinstance(v, GaussianVariable) for v in variables.values()]
+        gaussian = [
+            [
+                [v.mu, v.std, v.smoothing]
+                for v in m.variables.values()
+                if isinstance(v, GaussianVariable)
+            ]
+            for m in self.class_models
+        ]
+        # categorical probabilities of all nominal variables, concatenated
+        nominal = [
+            encoder.column(c)
+            for c, is_numeric in zip(variables, numeric)
+            if not is_numeric
+        ]
+        for m in self.class_models:
+            for column in nominal:
+                variable = m.variables[encoder.columns[column]]
+                for value in variable.probabilities:
+                    encoder.code(column, value)
+        category_start = np.cumsum([0] + [len(encoder.categories[c]) for c in nominal])
+        categorical = np.zeros((len(self.class_models), category_start[-1]))
+        for i, m in enumerate(self.class_models):
+            for j, column in enumerate(nominal):
+                variable = m.variables[encoder.columns[column]]
+                for value, p in variable.probabilities.items():
+                    categorical[i, category_start[j] + encoder.code(column, value)] = p
+        class_probability = [
+            self.class_probabilities.probabilities[c] for c in self.class_names
+        ]
+        arrays = {
+            "class_probability": np.array(class_probability, dtype=np.float64),
+            "numeric": np.array(numeric, dtype=bool),
+            "gaussian": (
+                np.array(gaussian, dtype=np.float64).reshape(
+                    len(self.class_models), sum(numeric), 3
+                )
+            ),
+            "category_start": category_start.astype(np.int64),
+            "categorical": categorical,
+        }
+        metadata = {
+            "class_names": [to_python(c) for c in self.class_names],
+            "variables": [to_python(c) for c in variables],
+            **encoder.metadata(),
+        }
+        return arrays, metadata
+
+    @classmethod
+    def from_arrays(cls, arrays, metadata):
+        encoder = ConditionEncoder.from_metadata(metadata)
+        class_names = metadata["class_names"]
+        numeric = arrays["numeric"].tolist()
+        gaussian = arrays["gaussian"].tolist()
+        categorical = arrays["categorical"]
+        category_start = arrays["category_start"].tolist()
+        class_models = []
+        for i in range(len(class_names)):
+            variables = {}
+            numeric_index = nominal_index = 0
+            for name, is_numeric in zip(metadata["variables"], numeric):
+                if is_numeric:
+                    mu, std, smoothing = gaussian[i][numeric_index]
+                    variables[name] = GaussianVariable(mu, std, smoothing)
+                    numeric_index += 1
+                else:
+                    categories = encoder.categories[encoder.column(name)]
+                    start = category_start[nominal_index]
+                    p = categorical[i, start : start + len(categories)].tolist()
+                    variables[name] = CategoricalVariable(dict(zip(categories, p)))
+                    nominal_index += 1
+            class_models.append(NaiveBayesSingleClass(variables))
+        class_probabilities = CategoricalVariable(
+            dict(zip(class_names, arrays["class_probability"].tolist()))
+        )
+        return cls(class_names, class_models, class_probabilities)
+
     def output_size(self) -> int:
         return len(self.class_names)
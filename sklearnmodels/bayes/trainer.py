@@ -1,16 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import Any
 import numpy as np
-from pyparsing import col
-from scipy.stats import norm
 import pandas as pd
 
 from pandas.api.types import is_string_dtype, is_numeric_dtype, is_bool_dtype
 from pandas.api.types import is_numeric_dtype
-from sklearn.dummy import class_distribution
 
 from sklearnmodels.backend.conditions import ValueCondition
 from sklearnmodels.backend.core import ColumnID, ColumnType, Dataset, Trainer
+from sklearnmodels.backend.profiling import Profiled, dataset_rows
 from sklearnmodels.bayes.model import NaiveBayes
 
 from sklearnmodels.bayes.model import (
@@ -25,6 +23,14 @@ class NaiveBayesTrainer(Trainer):
         self.smoothing = smoothing
         self.class_weight = class_weight
 
+    def profiled(self) -> list[Profiled]:
+        # methods timed as phases of the fit, see backend.profiling
+        return [
+            Profiled(self, "fit_class", "classes", dataset_rows),
+            Profiled(self, "fit_numeric", "columns.numeric", dataset_rows),
+            Profiled(self, "fit_nominal", "columns.nominal", dataset_rows),
+        ]
+
     def fit_column(self, d: Dataset, column: ColumnID, nominal_values: dict):
         if d.types_dict[column] == ColumnType.Numeric:
             return self.fit_numeric(d, column)
@@ -0,0 +1,8 @@
+from .boosting import (
+    GradientBoosting,
+    GradientBoostingTrainer,
+    LogLoss,
+    Loss,
+    SquaredLoss,
+)
+from .forest import Forest, ForestTrainer
@@ -0,0 +1,201 @@
+import abc
+
+import numpy as np
+import pandas as pd
+
+from sklearnmodels.backend.core import Dataset, Model, Trainer
+from sklearnmodels.tree import (
+    CompiledTree,
+    EncodedDataset,
+    LevelTreeTrainer,
+    PackedTrees,
+    TreeCreationCallbackResult,
+)
+
+
+class Loss(abc.ABC):
+
+    @abc.abstractmethod
+    def outputs(self, y: np.ndarray) -> int:
+        # number of raw outputs of the model
+        pass
+
+    @abc.abstractmethod
+    def baseline(self, y: np.ndarray) -> np.ndarray:
+        # constant raw prediction that minimizes the loss
+        pass
+
+    @abc.abstractmethod
+    def gradients(self, y: np.ndarray, raw: np.ndarray, out: np.ndarray):
+        # fill out with the gradients of the loss for each output, followed by
+        # its hessians, at the raw predictions
+        pass
+
+    @abc.abstractmethod
+    def transform(self, raw: np.ndarray) -> np.ndarray:
+        # predictions of the model from its raw predictions
+        pass
+
+    def __repr__(self):
+        return self.__class__.__name__
+
+
+class SquaredLoss(Loss):
+    def outputs(self, y: np.ndarray):
+        return y.shape[1]
+
+    def baseline(self, y: np.ndarray):
+        return y.mean(axis=0)
+
+    def gradients(self, y: np.ndarray, raw: np.ndarray, out: np.ndarray):
+        k = raw.shape[1]
+        np.subtract(raw, y, out=out[:, :k])
+        out[:, k:] = 1
+
+    def transform(self, raw: np.ndarray):
+        return raw
+
+
+class LogLoss(Loss):
+    """
+    Multiclass cross entropy of the softmax of the raw predictions, with one
+    output per class. Rows are weighted by the weight of their class.
+    """
+
+    def __init__(self, class_weight: np.ndarray):
+        self.class_weight = class_weight
+
+    def outputs(self, y: np.ndarray):
+        return len(self.class_weight)
+
+    def baseline(self, y: np.ndarray):
+        counts = np.bincount(y, minlength=len(self.class_weight)) * self.class_weight
+        p = np.maximum(counts / counts.sum(), 1e-16)
+        return np.log(p)
+
+    def gradients(self, y: np.ndarray, raw: np.ndarray, out: np.ndarray):
+        k = raw.shape[1]
+        g, h = out[:, :k], out[:, k:]
+        np.subtract(raw, raw.max(axis=1, keepdims=True), out=g)
+        np.exp(g, out=g)
+        g /= g.sum(axis=1, keepdims=True)
+        np.multiply(g, 1 - g, out=h)
+        g[np.arange(len(y)), y] -= 1
+        weight = self.class_weight[y][:, np.newaxis]
+        out *= weight
+
+    def transform(self, raw: np.ndarray):
+        p = np.exp(raw - raw.max(axis=1, keepdims=True))
+        return p / p.sum(axis=1, keepdims=True)
+
+
+class GradientBoosting(Model):
+    """
+    Sum of a baseline and the predictions of a sequence of trees, packed in a
+    `PackedTrees`, scaled by the learning rate. Predictions are the raw sums
+    transformed by the loss (eg, class probabilities for `LogLoss`).
+    """
+
+    def __init__(
+        self,
+        baseline: np.ndarray,
+        packed: PackedTrees,
+        learning_rate: float,
+        loss: Loss,
+    ):
+        self.baseline = baseline
+        self.packed = packed
+        self.learning_rate = learning_rate
+        self.loss = loss
+
+    def output_size(self):
+        return len(self.baseline)
+
+    @property
+    def trees(self) -> list[CompiledTree]:
+        return self.packed.trees()
+
+    def n_trees(self):
+        return self.packed.n_trees()
+
+    def complexity(self):
+        return self.packed.complexity()
+
+    def __repr__(self):
+        return f"GradientBoosting(trees={self.n_trees()},loss={self.loss})"
+
+    def pretty_print(self, class_names=None):
+        return f"baseline {self.baseline}\n{self.packed.pretty_print()}"
+
+    def predict_sample(self, x: pd.Series):
+        return self.predict(pd.DataFrame([x]))[0, :]
+
+    def predict_raw(self, d: Dataset) -> np.ndarray:
+        total = np.zeros((d.n, self.output_size()))
+        self.packed.predict_dataset(d, np.arange(d.n), total)
+        total *= self.learning_rate
+        total += self.baseline
+        return total
+
+    def predict_dataset(self, d: Dataset, index: np.ndarray, predictions: np.ndarray):
+        predictions[index, :] = self.loss.transform(self.predict_raw(d))
+
+
+class GradientBoostingTrainer(Trainer):
+    """
+    Fits each tree of a `GradientBoosting` model to the gradients and hessians of
+    the loss at the current predictions, with a `LevelTreeTrainer` whose target
+    error is a `shared.GradientError`. The dataset is encoded once, and the
+    gradients, hessians and predictions are kept in arrays that are updated in
+    place in each round. The predictions of a tree for the training rows are
+    collected from the rows of its nodes as they are created, so the dataset is
+    never evaluated with the trees.
+    """
+
+    def __init__(
+        self,
+        trainer: LevelTreeTrainer,
+        loss: Loss,
+        n_estimators: int,
+        learning_rate: float,
+    ):
+        self.trainer = trainer
+        self.loss = loss
+        self.n_estimators = n_estimators
+        self.learning_rate = learning_rate
+
+    def __repr__(self):
+        return (
+            f"GradientBoostingTrainer(trees={self.n_estimators},{self.loss},"
+            f"{self.trainer})"
+        )
+
+    def fit(self, d: Dataset) -> GradientBoosting:
+        data = EncodedDataset(d)
+        y = data.y
+        k = self.loss.outputs(y)
+        baseline = self.loss.baseline(y)
+        raw = np.tile(baseline, (d.n, 1))
+        # targets of the trees: gradients followed by hessians
+        data.y = np.zeros((d.n, 2 * k))
+        step = np.zeros((d.n, k))
+        rows = np.arange(d.n)
+
+        def record_step(r: TreeCreationCallbackResult):
+            # nodes are created top down, so rows end with the step of their leaf
+            step[r.task.rows] = r.tree.prediction
+
+        callback = self.trainer.tree_creation_callback
+        self.trainer.tree_creation_callback = record_step
+        trees = []
+        try:
+            for _ in range(self.n_estimators):
+                self.loss.gradients(y, raw, data.y)
+                tree = self.trainer.build_rows(data, rows, 1)
+                step *= self.learning_rate
+                raw += step
+                trees.append(tree.compile())
+        finally:
+            self.trainer.tree_creation_callback = callback
+        packed = PackedTrees.from_trees(trees)
+        return GradientBoosting(baseline, packed, self.learning_rate, self.loss)
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.utils import check_random_state
+
+from sklearnmodels.backend.core import Dataset, Model, Trainer
+from sklearnmodels.tree import (
+    CompiledTree,
+    EncodedDataset,
+    LevelTreeTrainer,
+    PackedTrees,
+)
+
+
+class Forest(Model):
+    """
+    Ensemble of trees, whose prediction is the average of the predictions of the
+    trees (class probabilities for classification). The trees are packed in a
+    single `PackedTrees`, which predicts with all of them at once.
+    """
+
+    def __init__(self, packed: PackedTrees):
+        self.packed = packed
+
+    @property
+    def trees(self) -> list[CompiledTree]:
+        return self.packed.trees()
+
+    def output_size(self):
+        return self.packed.output_size()
+
+    def n_trees(self):
+        return self.packed.n_trees()
+
+    def complexity(self):
+        return self.packed.complexity()
+
+    def __repr__(self):
+        return f"Forest(trees={self.n_trees()})"
+
+    def pretty_print(self, class_names=None):
+        return self.packed.pretty_print(class_names=class_names)
+
+    def predict_sample(self, x: pd.Series):
+        return self.predict(pd.DataFrame([x]))[0, :]
+
+    def predict_dataset(self, d: Dataset, index: np.ndarray, predictions: np.ndarray):
+        self.packed.predict_dataset(d, index, predictions)
+        predictions[index, :] /= self.n_trees()
+
+
+def bootstrap(n: int, seed: int) -> np.ndarray:
+    # sorted indices of a sample with replacement of the rows
+    rows = np.random.RandomState(seed).randint(0, n, n)
+    rows.sort()
+    return rows
+
+
+def fit_tree(
+    trainer: LevelTreeTrainer, data: EncodedDataset, rows: np.ndarray | int
+) -> CompiledTree:
+    # rows is an array of rows or the seed of a bootstrap sample, drawn in the
+    # process of the tree
+    if not isinstance(rows, np.ndarray):
+        rows = bootstrap(data.n, rows)
+    return trainer.build_rows(data, rows, 1).compile()
+
+
+class ForestTrainer(Trainer):
+    """
+    Trains each tree of a `Forest` with its own `LevelTreeTrainer` on a bootstrap
+    sample of the rows of the dataset. The dataset is encoded once and shared by
+    all trees, and samples are arrays of row indices, so the data is never
+    copied. With `n_jobs`, trees are trained in parallel processes, which receive
+    the encoded columns as shared memory maps.
+    """
+
+    def __init__(
+        self,
+        trainers: list[LevelTreeTrainer],
+        bootstrap: bool = True,
+        n_jobs: int | None = None,
+        random_state=None,
+    ):
+        assert len(trainers) > 0
+        self.trainers = trainers
+        self.bootstrap = bootstrap
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def __repr__(self):
+        return f"ForestTrainer(trees={len(self.trainers)},{self.trainers[0]})"
+
+    def fit(self, d: Dataset) -> Forest:
+        data = EncodedDataset(d)
+        if self.bootstrap:
+            rng = check_random_state(self.random_state)
+            samples = rng.randint(np.iinfo(np.int32).max, size=len(self.trainers))
+        else:
+            samples = [np.arange(d.n)] * len(self.trainers)
+        trees = Parallel(n_jobs=self.n_jobs)(
+            delayed(fit_tree)(trainer, data, rows)
+            for trainer, rows in zip(self.trainers, samples)
+        )
+        return Forest(PackedTrees.from_trees(trees))
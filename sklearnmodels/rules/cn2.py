@@ -3,8 +3,8 @@ from dataclasses import dataclass
 from typing import Generator
 
 import numpy as np
-from h11 import Data
 
+from sklearnmodels.backend.budget import Budget
 from sklearnmodels.backend.conditions import (
     AndCondition,
     Condition,
@@ -14,6 +14,7 @@ from sklearnmodels.backend.conditions import (
     ValueCondition,
 )
 from sklearnmodels.backend.core import ColumnID, ColumnType, Dataset
+from sklearnmodels.backend.profiling import Profiled, dataset_rows
 from sklearnmodels.rules.model import PredictionRule, RuleModel
 
 from sklearnmodels.shared.target_error import TargetError
@@ -23,15 +24,17 @@ from sklearnmodels.shared.target_error import TargetError
 class ConditionProposal:
     error: float
     condition: Condition
-    dataset: Dataset
+    n: int
     drop: bool
+    # only available if it was needed to compute the error
+    dataset: Dataset | None = None
 
 
 def is_close(a: float, b: float):
     return abs(a - b) < 1e-32
 
 
-ConditionGenerator = Generator[None, None, tuple[Condition, bool]]
+ConditionGenerator = Generator[ConditionProposal, None, None]
 
 
 class CN2:
@@ -43,26 +46,55 @@ class CN2:
         max_rules: int,
         min_rule_support: int,
         max_error_per_rule: float,
+        budget: Budget | None = None,
     ):
         self.max_length_per_rule = max_length_per_rule
         self.min_rule_support = min_rule_support
         self.max_rules = max_rules
         self.max_error_per_rule = max_error_per_rule
+        # no more rules (or conditions) are added once the budget runs out
+        self.budget = budget
         self.error = error
 
     def fit(self, d: Dataset):
+        if self.budget is not None:
+            self.budget.start(0)
         rules = []
         while d.n > self.min_rule_support and len(rules) < self.max_rules:
+            if not self.available():
+                break
             rule = self.generate_rule(d, self.error)
             if rule is None:
                 break  # unable to generate rule; stop process
             rules.append(rule)
+            if self.budget is not None:
+                self.budget.spend(1)
             condition, prediction = rule
-            # keep samples that do not match the condition
-            d = d.filter(NotCondition(condition))
+            d = self.remove_covered(d, condition)
         model = RuleModel(rules, self.error.prediction(d))
         return model
 
+    def available(self) -> bool:
+        return self.budget is None or self.budget.available()
+
+    def remove_covered(self, d: Dataset, condition: Condition) -> Dataset:
+        # keep samples that do not match the condition
+        return d.filter(NotCondition(condition))
+
+    def profiled(self) -> list[Profiled]:
+        # methods timed as phases of the fit, see backend.profiling
+        def column_phase(d: Dataset, column: ColumnID, *args):
+            return f"condition_search.{d.types_dict[column].name.lower()}"
+
+        return [
+            Profiled(self, "generate_rule", "rules", dataset_rows),
+            Profiled(self, "propose_condition", "condition_search", dataset_rows),
+            Profiled(
+                self, "generate_conditions", column_phase, dataset_rows, generator=True
+            ),
+            Profiled(self, "remove_covered", "partitioning", dataset_rows),
+        ]
+
     def remove_similar(condition: Condition, conditions: list[Condition]):
         # remove range conditions that are similar
         if not isinstance(condition, RangeCondition):
@@ -84,17 +116,17 @@ class CN2:
 
         conditions = []
         error = np.inf
-        while len(conditions) < self.max_length_per_rule:
+        while len(conditions) < self.max_length_per_rule and self.available():
             p = self.propose_condition(d, error, target_error)
             if p is None:
                 # could not propose an improvement
                 # retain current conditions as is
                 break
-            d = p.dataset
-            if d.n < self.min_rule_support:
+            if p.n < self.min_rule_support:
                 # Adding condition would drop support below minimum
                 # retain current conditions as is
                 break
+            d = d.filter(p.condition) if p.dataset is None else p.dataset
             if p.drop:
                 d = d.drop(p.condition.column)
             else:
@@ -111,18 +143,27 @@ class CN2:
         condition = AndCondition(conditions)
         return (condition, target_error.prediction(d))
 
-    def generate_conditions(self, d: Dataset, column: ColumnID) -> ConditionGenerator:
+    def generate_conditions(
+        self, d: Dataset, column: ColumnID, target_error: TargetError
+    ) -> ConditionGenerator:
         column_index = list(d.columns).index(column)
         column_type = d.types[column_index]
         if column_type == ColumnType.Nominal:
-            for v in d.values(column):
-                yield (ValueCondition(column, v), True)
+            # score each distinct value once, directly from per value statistics
+            values, errors, counts = target_error.errors_by_value(d, column)
+            for v, error, n in zip(values, errors, counts):
+                yield ConditionProposal(error, ValueCondition(column, v), n, True)
         elif column_type == ColumnType.Numeric:
             # binary split of numeric column based on mean
             v = d.mean_x(column)
             l = [False, True]
             for less in l:
-                yield (RangeCondition(column, v, less), False)
+                condition = RangeCondition(column, v, less)
+                d_condition = d.filter(condition)
+                error = target_error(d_condition)
+                yield ConditionProposal(
+                    error, condition, d_condition.n, False, d_condition
+                )
         else:
             raise ValueError(f"Invalid column type")
 
@@ -131,18 +172,15 @@ class CN2:
     ):
         best = None
         for column in d.columns:
-            for condition, drop in self.generate_conditions(d, column):
-                d_condition = d.filter(condition)
-                if d_condition.n < self.min_rule_support:
+            for p in self.generate_conditions(d, column, target_error):
+                if p.n < self.min_rule_support:
                     continue
-                error = target_error(d_condition)
-                if error >= base_error:
+                if p.error >= base_error:
                     continue
-
                 if (
                     best is None
-                    or error < best.error
-                    or (is_close(error, best.error) and best.dataset.n < d_condition.n)
+                    or p.error < best.error
+                    or (is_close(p.error, best.error) and best.n < p.n)
                 ):
-                    best = ConditionProposal(error, condition, d_condition, drop)
+                    best = p
         return best
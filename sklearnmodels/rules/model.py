@@ -2,8 +2,9 @@ import numpy as np
 import pandas as pd
 
 from sklearnmodels.backend import Input, InputSample, Output
-from sklearnmodels.backend.conditions import Condition
-from sklearnmodels.backend.core import Model
+from sklearnmodels.backend.conditions import AndCondition, Condition, TrueCondition
+from sklearnmodels.backend.core import Dataset, Model
+from sklearnmodels.backend.serialization import ConditionEncoder
 
 PredictionRule = tuple[Condition, Output]
 
@@ -26,9 +27,62 @@ class RuleModel(Model):
                 return p
         return self.default_prediction
 
+    def predict_dataset(self, d: Dataset, index: np.ndarray, predictions: np.ndarray):
+        # as in predict_sample, each row is predicted by the first rule it satisfies
+        remaining = np.ones(len(index), dtype=bool)
+        for condition, p in self.rules:
+            mask = condition.mask(d) & remaining
+            predictions[index[mask], :] = p
+            remaining &= ~mask
+        predictions[index[remaining], :] = self.default_prediction
+
     def __repr__(self):
         return f"RuleModel(rules={len(self.rules)},p={self.default_prediction})"
 
+    def to_arrays(self):
+        encoder = ConditionEncoder()
+        # each rule is a conjunction of terms; rules whose condition is not an
+        # AndCondition have a single term (or none, for TrueCondition)
+        terms: list[Condition] = []
+        term_start = [0]
+        conjunction = []
+        for condition, _ in self.rules:
+            if isinstance(condition, AndCondition):
+                terms += condition.conditions
+            elif not isinstance(condition, TrueCondition):
+                terms.append(condition)
+            term_start.append(len(terms))
+            conjunction.append(isinstance(condition, AndCondition))
+        default_prediction = np.asarray(self.default_prediction)
+        predictions = np.zeros((len(self.rules), len(default_prediction)))
+        for i, (_, p) in enumerate(self.rules):
+            predictions[i, :] = p
+        arrays = {
+            "prediction": predictions,
+            "default_prediction": default_prediction,
+            "conjunction": np.array(conjunction, dtype=bool),
+            "term_start": np.array(term_start, dtype=np.int64),
+            **encoder.encode(terms, prefix="term_"),
+        }
+        return arrays, encoder.metadata()
+
+    @classmethod
+    def from_arrays(cls, arrays, metadata):
+        encoder = ConditionEncoder.from_metadata(metadata)
+        terms = encoder.decode(arrays, prefix="term_")
+        term_start = arrays["term_start"].tolist()
+        rules = []
+        for i, conjunction in enumerate(arrays["conjunction"].tolist()):
+            rule_terms = terms[term_start[i] : term_start[i + 1]]
+            if conjunction:
+                condition = AndCondition(rule_terms)
+            elif len(rule_terms) == 0:
+                condition = TrueCondition()
+            else:
+                condition = rule_terms[0]
+            rules.append((condition, arrays["prediction"][i]))
+        return cls(rules, arrays["default_prediction"])
+
     def complexity(self):
         return len(self.rules) + 1
 
@@ -21,6 +21,10 @@ class OneR:
             rules = []
         else:
             # Generate rules for best column based on its values
-            rules = [(e, pred(p)) for e, p in zip(e.conditions, e.partition)]
+            if e.predictions is None:
+                predictions = [pred(p) for p in e.partition]
+            else:
+                predictions = e.predictions
+            rules = list(zip(e.conditions, predictions))
 
         return RuleModel(rules, default_prediction=pred(d))
@@ -3,8 +3,8 @@ from dataclasses import dataclass
 from typing import Generator
 
 import numpy as np
-from h11 import Data
 
+from sklearnmodels.backend.budget import Budget
 from sklearnmodels.backend.conditions import (
     AndCondition,
     Condition,
@@ -14,6 +14,7 @@ from sklearnmodels.backend.conditions import (
     ValueCondition,
 )
 from sklearnmodels.backend.core import ColumnID, ColumnType, Dataset
+from sklearnmodels.backend.profiling import Profiled, dataset_rows
 from sklearnmodels.rules.model import PredictionRule, RuleModel
 from sklearnmodels.shared.target_error import FixedClassAccuracyError, TargetError
 
@@ -22,11 +23,13 @@ from sklearnmodels.shared.target_error import FixedClassAccuracyError, TargetErr
 class ConditionProposal:
     error: float
     condition: Condition
-    dataset: Dataset
+    n: int
     drop: bool
+    # only available if it was needed to compute the error
+    dataset: Dataset | None = None
 
 
-ConditionGenerator = Generator[None, None, tuple[Condition, bool]]
+ConditionGenerator = Generator[ConditionProposal, None, None]
 
 
 class PRISM:
@@ -38,14 +41,19 @@ class PRISM:
         max_rules_per_class: int = 10000,
         min_rule_support: int = 1,
         max_error_per_rule: float = 0.1,
+        budget: Budget | None = None,
     ):
         self.max_length_per_rule = max_length_per_rule
         self.max_rules_per_class = max_rules_per_class
         self.min_rule_support = min_rule_support
         self.max_error_per_rule = max_error_per_rule
+        # no more rules (or conditions) are added once the budget runs out
+        self.budget = budget
         self.class_weight = class_weight
 
     def fit(self, d: Dataset):
+        if self.budget is not None:
+            self.budget.start(0)
         rules = []
         classes = d.classes()
         for klass in classes:
@@ -58,15 +66,39 @@ class PRISM:
     def fit_dataset(self, d: Dataset, error: TargetError):
         rules = []
         while d.n > self.min_rule_support and len(rules) < self.max_rules_per_class:
+            if not self.available():
+                break
             rule = self.generate_rule(d, error)
             if rule is None:
                 break  # unable to generate rule; stop process
             rules.append(rule)
+            if self.budget is not None:
+                self.budget.spend(1)
             condition, prediction = rule
-            # keep samples that do not match the condition
-            d = d.filter(NotCondition(condition))
+            d = self.remove_covered(d, condition)
         return rules
 
+    def available(self) -> bool:
+        return self.budget is None or self.budget.available()
+
+    def remove_covered(self, d: Dataset, condition: Condition) -> Dataset:
+        # keep samples that do not match the condition
+        return d.filter(NotCondition(condition))
+
+    def profiled(self) -> list[Profiled]:
+        # methods timed as phases of the fit, see backend.profiling
+        def column_phase(d: Dataset, column: ColumnID, *args):
+            return f"condition_search.{d.types_dict[column].name.lower()}"
+
+        return [
+            Profiled(self, "generate_rule", "rules", dataset_rows),
+            Profiled(self, "propose_condition", "condition_search", dataset_rows),
+            Profiled(
+                self, "generate_conditions", column_phase, dataset_rows, generator=True
+            ),
+            Profiled(self, "remove_covered", "partitioning", dataset_rows),
+        ]
+
     def remove_similar(condition: Condition, conditions: list[Condition]):
         # remove range conditions that are similar
         if not isinstance(condition, RangeCondition):
@@ -88,17 +120,17 @@ class PRISM:
 
         conditions: list[Condition] = []
         error = np.inf
-        while len(conditions) < self.max_length_per_rule:
+        while len(conditions) < self.max_length_per_rule and self.available():
             p = self.propose_condition(d, error, target_error)
             if p is None:
                 # could not propose an improvement
                 # retain current conditions as is
                 break
-            d = p.dataset
-            if d.n < self.min_rule_support:
+            if p.n < self.min_rule_support:
                 # Adding condition would drop support below minimum
                 # retain current conditions as is
                 break
+            d = d.filter(p.condition) if p.dataset is None else p.dataset
             if p.drop:
                 d = d.drop(p.condition.column)
             else:
@@ -115,18 +147,27 @@ class PRISM:
         condition = AndCondition(conditions)
         return (condition, target_error.prediction(d))
 
-    def generate_conditions(self, d: Dataset, column: ColumnID) -> ConditionGenerator:
+    def generate_conditions(
+        self, d: Dataset, column: ColumnID, target_error: TargetError
+    ) -> ConditionGenerator:
         column_index = list(d.columns).index(column)
         column_type = d.types[column_index]
         if column_type == ColumnType.Nominal:
-            for v in d.values(column):
-                yield (ValueCondition(column, v), True)
+            # score each distinct value once, directly from per value statistics
+            values, errors, counts = target_error.errors_by_value(d, column)
+            for v, error, n in zip(values, errors, counts):
+                yield ConditionProposal(error, ValueCondition(column, v), n, True)
         elif column_type == ColumnType.Numeric:
             # binary split of numeric column based on mean
             v = d.mean_x(column)
             l = [False, True]
             for less in l:
-                yield (RangeCondition(column, v, less), False)
+                condition = RangeCondition(column, v, less)
+                d_condition = d.filter(condition)
+                error = target_error(d_condition)
+                yield ConditionProposal(
+                    error, condition, d_condition.n, False, d_condition
+                )
         else:
             raise ValueError(f"Invalid column type")
 
@@ -135,13 +176,11 @@ class PRISM:
     ):
         best = None
         for column in d.columns:
-            for condition, drop in self.generate_conditions(d, column):
-                d_condition = d.filter(condition)
-                if d_condition.n < self.min_rule_support:
+            for p in self.generate_conditions(d, column, target_error):
+                if p.n < self.min_rule_support:
                     continue
-                error = target_error(d_condition)
-                if error >= base_error:
+                if p.error >= base_error:
                     continue
-                if best is None or error < best.error:
-                    best = ConditionProposal(error, condition, d_condition, drop)
+                if best is None or p.error < best.error:
+                    best = p
         return best
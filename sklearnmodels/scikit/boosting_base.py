@@ -0,0 +1,79 @@
+import numbers
+
+import numpy as np
+from sklearn.utils import check_random_state
+
+from .. import ensemble, shared, tree
+from .tree_base import BaseTree
+
+
+class BaseBoosting(BaseTree):
+
+    def __init__(
+        self,
+        n_estimators=100,
+        learning_rate=0.1,
+        splitter="best",
+        max_depth=3,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        min_error_decrease=0.0,
+        l2_regularization=0.0,
+        max_features=None,
+        random_state=None,
+    ):
+        self.n_estimators = n_estimators
+        self.learning_rate = learning_rate
+        self.splitter = splitter
+        self.max_depth = max_depth
+        self.min_samples_split = min_samples_split
+        self.min_samples_leaf = min_samples_leaf
+        self.min_error_decrease = min_error_decrease
+        self.l2_regularization = l2_regularization
+        self.max_features = max_features
+        self.random_state = random_state
+
+    def build_attribute_penalizer(self):
+        return shared.NoPenalization()
+
+    def make_boosting_trainer(
+        self, loss: ensemble.Loss
+    ) -> ensemble.GradientBoostingTrainer:
+        if (
+            not isinstance(self.n_estimators, (int, np.integer))
+            or self.n_estimators < 1
+        ):
+            raise ValueError(
+                f"Invalid value '{self.n_estimators}' for n_estimators; expected an"
+                " integer >= 1"
+            )
+        if not isinstance(self.learning_rate, numbers.Real) or self.learning_rate <= 0:
+            raise ValueError(
+                f"Invalid value '{self.learning_rate}' for learning_rate; expected a"
+                " number > 0"
+            )
+        if (
+            not isinstance(self.l2_regularization, numbers.Real)
+            or self.l2_regularization < 0
+        ):
+            raise ValueError(
+                f"Invalid value '{self.l2_regularization}' for l2_regularization;"
+                " expected a number >= 0"
+            )
+        error = shared.GradientError(self.l2_regularization)
+        rng = check_random_state(self.random_state)
+        scorers = self.build_splitter(error, self.build_attribute_penalizer(), rng)
+        scorer = self.make_scorer(error, scorers, rng)
+        trainer = tree.LevelTreeTrainer(
+            scorer, self.make_prune_criteria(), dtype=self.dtype
+        )
+        return ensemble.GradientBoostingTrainer(
+            trainer, loss, self.n_estimators, self.learning_rate
+        )
+
+    def compile(self):
+        # trees of boosting models are always compiled
+        return self
+
+    def get_tree(self, index: int = 0) -> tree.Tree:
+        return self.model_.trees[index].to_tree()
@@ -0,0 +1,50 @@
+import numpy as np
+from sklearn.base import BaseEstimator
+
+from sklearnmodels.backend.core import Dataset
+
+from .. import ensemble
+from ..scikit.nominal_model import NominalClassifier
+from .boosting_base import BaseBoosting
+
+
+class NominalGradientBoostingClassifier(NominalClassifier, BaseBoosting, BaseEstimator):
+    def __init__(
+        self,
+        n_estimators=100,
+        learning_rate=0.1,
+        splitter="best",
+        max_depth=3,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        min_error_decrease=0.0,
+        l2_regularization=0.0,
+        max_features=None,
+        random_state=None,
+        class_weight=None,
+        backend="pandas",
+        dtype=None,
+    ):
+        super().__init__(
+            class_weight=class_weight,
+            n_estimators=n_estimators,
+            learning_rate=learning_rate,
+            splitter=splitter,
+            max_depth=max_depth,
+            min_samples_split=min_samples_split,
+            min_samples_leaf=min_samples_leaf,
+            min_error_decrease=min_error_decrease,
+            l2_regularization=l2_regularization,
+            max_features=max_features,
+            random_state=random_state,
+            backend=backend,
+            dtype=dtype,
+        )
+
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags.classifier_tags.poor_score = True
+        return tags
+
+    def make_model(self, d: Dataset, class_weight: np.ndarray):
+        return self.make_boosting_trainer(ensemble.LogLoss(class_weight))
@@ -0,0 +1,42 @@
+from sklearn.base import BaseEstimator
+
+from sklearnmodels.backend.core import Dataset
+
+from .. import ensemble
+from ..scikit.nominal_model import NominalRegressor
+from .boosting_base import BaseBoosting
+
+
+class NominalGradientBoostingRegressor(NominalRegressor, BaseBoosting, BaseEstimator):
+    def __init__(
+        self,
+        n_estimators=100,
+        learning_rate=0.1,
+        splitter="best",
+        max_depth=3,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        min_error_decrease=0.0,
+        l2_regularization=0.0,
+        max_features=None,
+        random_state=None,
+        backend="pandas",
+        dtype=None,
+    ):
+        super().__init__(
+            n_estimators=n_estimators,
+            learning_rate=learning_rate,
+            splitter=splitter,
+            max_depth=max_depth,
+            min_samples_split=min_samples_split,
+            min_samples_leaf=min_samples_leaf,
+            min_error_decrease=min_error_decrease,
+            l2_regularization=l2_regularization,
+            max_features=max_features,
+            random_state=random_state,
+            backend=backend,
+            dtype=dtype,
+        )
+
+    def make_model(self, d: Dataset):
+        return self.make_boosting_trainer(ensemble.SquaredLoss())
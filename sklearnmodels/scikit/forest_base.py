@@ -0,0 +1,64 @@
+import numpy as np
+from sklearn.utils import check_random_state
+
+from .. import ensemble, shared, tree
+from .tree_base import BaseTree
+
+
+class BaseForest(BaseTree):
+
+    def __init__(
+        self,
+        n_estimators=100,
+        criterion="",
+        splitter="best",
+        max_depth=None,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        min_error_decrease=0.0,
+        max_features="sqrt",
+        bootstrap=True,
+        n_jobs=None,
+        random_state=None,
+    ):
+        self.n_estimators = n_estimators
+        self.criterion = criterion
+        self.splitter = splitter
+        self.max_depth = max_depth
+        self.min_samples_split = min_samples_split
+        self.min_samples_leaf = min_samples_leaf
+        self.min_error_decrease = min_error_decrease
+        self.max_features = max_features
+        self.bootstrap = bootstrap
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def make_forest_trainer(self, e: shared.TargetError) -> ensemble.ForestTrainer:
+        if (
+            not isinstance(self.n_estimators, (int, np.integer))
+            or self.n_estimators < 1
+        ):
+            raise ValueError(
+                f"Invalid value '{self.n_estimators}' for n_estimators; expected an"
+                " integer >= 1"
+            )
+        rng = check_random_state(self.random_state)
+        seeds = rng.randint(np.iinfo(np.int32).max, size=self.n_estimators)
+        penalization = self.build_attribute_penalizer()
+        prune_criteria = self.make_prune_criteria()
+        trainers = []
+        for seed in seeds:
+            # each tree has its own random choices of columns and thresholds
+            tree_rng = np.random.RandomState(seed)
+            scorers = self.build_splitter(e, penalization, tree_rng)
+            scorer = self.make_scorer(e, scorers, tree_rng)
+            trainer = tree.LevelTreeTrainer(scorer, prune_criteria, dtype=self.dtype)
+            trainers.append(trainer)
+        return ensemble.ForestTrainer(trainers, self.bootstrap, self.n_jobs, rng)
+
+    def compile(self):
+        # trees of forests are always compiled
+        return self
+
+    def get_tree(self, index: int = 0) -> tree.Tree:
+        return self.model_.trees[index].to_tree()
@@ -0,0 +1,52 @@
+import numpy as np
+from sklearn.base import BaseEstimator
+
+from sklearnmodels.backend.core import Dataset
+
+from ..scikit.nominal_model import NominalClassifier
+from .forest_base import BaseForest
+
+
+class NominalRandomForestClassifier(NominalClassifier, BaseForest, BaseEstimator):
+    def __init__(
+        self,
+        n_estimators=100,
+        criterion="entropy",
+        splitter="best",
+        max_depth=None,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        min_error_decrease=1e-16,
+        max_features="sqrt",
+        bootstrap=True,
+        n_jobs=None,
+        random_state=None,
+        class_weight=None,
+        backend="pandas",
+        dtype=None,
+    ):
+        super().__init__(
+            class_weight=class_weight,
+            n_estimators=n_estimators,
+            criterion=criterion,
+            splitter=splitter,
+            max_depth=max_depth,
+            min_samples_split=min_samples_split,
+            min_samples_leaf=min_samples_leaf,
+            min_error_decrease=min_error_decrease,
+            max_features=max_features,
+            bootstrap=bootstrap,
+            n_jobs=n_jobs,
+            random_state=random_state,
+            backend=backend,
+            dtype=dtype,
+        )
+
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags.classifier_tags.poor_score = True
+        return tags
+
+    def make_model(self, d: Dataset, class_weight: np.ndarray):
+        error = self.build_error(self.criterion, class_weight)
+        return self.make_forest_trainer(error)
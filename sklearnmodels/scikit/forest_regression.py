@@ -0,0 +1,44 @@
+from sklearn.base import BaseEstimator
+
+from sklearnmodels.backend.core import Dataset
+
+from ..scikit.nominal_model import NominalRegressor
+from .forest_base import BaseForest
+
+
+class NominalRandomForestRegressor(NominalRegressor, BaseForest, BaseEstimator):
+    def __init__(
+        self,
+        n_estimators=100,
+        criterion="std",
+        splitter="best",
+        max_depth=None,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        min_error_decrease=1e-16,
+        max_features=1.0,
+        bootstrap=True,
+        n_jobs=None,
+        random_state=None,
+        backend="pandas",
+        dtype=None,
+    ):
+        super().__init__(
+            n_estimators=n_estimators,
+            criterion=criterion,
+            splitter=splitter,
+            max_depth=max_depth,
+            min_samples_split=min_samples_split,
+            min_samples_leaf=min_samples_leaf,
+            min_error_decrease=min_error_decrease,
+            max_features=max_features,
+            bootstrap=bootstrap,
+            n_jobs=n_jobs,
+            random_state=random_state,
+            backend=backend,
+            dtype=dtype,
+        )
+
+    def make_model(self, d: Dataset):
+        error = self.build_error(self.criterion)
+        return self.make_forest_trainer(error)
@@ -13,9 +13,17 @@ class NaiveBayesClassifier(NominalClassifier, BaseEstimator):
         tags.classifier_tags.poor_score = True
         return tags
 
-    def __init__(self, smoothing=0, backend=DEFAULT_BACKEND, class_weight=None):
-        super().__init__(backend=backend, class_weight=class_weight)
+    def __init__(
+        self,
+        smoothing=0,
+        backend=DEFAULT_BACKEND,
+        class_weight=None,
+        dtype=None,
+        profile=False,
+    ):
+        super().__init__(backend=backend, dtype=dtype, class_weight=class_weight)
         self.smoothing = smoothing
+        self.profile = profile
 
     def make_model(self, d: Dataset, class_weight: np.ndarray):
         return NaiveBayesTrainer(class_weight, smoothing=self.smoothing)
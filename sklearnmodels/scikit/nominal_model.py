@@ -1,13 +1,10 @@
 import abc
-from socket import has_dualstack_ipv6
 
-from matplotlib.pylab import isinteractive
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
-import scipy
+import scipy.sparse
 from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
-from sklearn.calibration import LabelEncoder
 from sklearn.exceptions import NotFittedError
 from sklearn.utils._tags import (
     ClassifierTags,
@@ -19,10 +16,13 @@ from sklearn.utils._tags import (
 )
 from sklearn.utils.multiclass import check_classification_targets
 from sklearn.utils.validation import _check_y, validate_data
+from sklearn.preprocessing import LabelEncoder
 from sklearn.utils import compute_class_weight, validation
 
 from sklearnmodels.backend import Input, Output
+from sklearnmodels.backend.budget import Budget
 from sklearnmodels.backend.factory import make_dataset
+from sklearnmodels.backend.profiling import FitStats, NoFitStats, make_fit_stats
 from sklearnmodels.shared.target_error import TargetError
 
 from .. import shared, tree
@@ -30,6 +30,10 @@ from ..backend.core import Dataset, Model
 from ..backend.pandas import PandasDataset
 
 
+def is_arrow_table(x) -> bool:
+    return type(x).__module__.split(".")[0] == "pyarrow" and hasattr(x, "to_pandas")
+
+
 def atleast_2d(x):
     x = np.asanyarray(x)
     if x.ndim == 0:
@@ -43,10 +47,22 @@ def atleast_2d(x):
 
 class NominalModel(metaclass=abc.ABCMeta):
     check_parameters = {"dtype": None}
-
-    def __init__(self, backend: str = "pandas", *args, **kwargs):
+    # estimators with a `profile` parameter record the phases of their fit in
+    # `fit_stats_` (see backend.profiling); it's None otherwise
+    profile = False
+    # estimators with `time_limit`, `max_nodes` or `memory_limit` parameters
+    # stop growing their model when the first limit is reached, and record it in
+    # `truncation_` (see backend.budget); it's None if the model is complete
+    time_limit = None
+    max_nodes = None
+    memory_limit = None
+
+    def __init__(self, backend: str = "pandas", dtype=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.backend = backend
+        # eg, "float32" to store numeric features, targets and predictions
+        # with less memory; None keeps the dtypes of the input
+        self.dtype = dtype
 
     def complexity(self):
         self.check_is_fitted()
@@ -71,23 +87,61 @@ class NominalModel(metaclass=abc.ABCMeta):
         if not self.is_fitted_:
             raise NotFittedError()
 
-    def validate_data_predict(self, x):
-        dtypes = self.get_dtypes(x)
+    def validate_data_predict(self, x) -> pd.DataFrame:
+        """
+        Adapt prediction input (DataFrame, ndarray or Arrow table) to a DataFrame
+        with the fitted columns. DataFrames and Arrow tables keep their columns and
+        dtypes, and are only checked against the fitted schema, so that they are
+        not converted to an object ndarray and back.
+        """
         self.check_is_fitted()
-        x = validate_data(
-            self,
-            x,
-            reset=False,
-            dtype=None,
-            ensure_all_finite=False,
-            accept_sparse=False,
-        )
-        n = len(x)
-        if n == 0:
+        if is_arrow_table(x):
+            x = x.to_pandas(types_mapper=pd.ArrowDtype)
+        if isinstance(x, pd.DataFrame):
+            validate_data(self, x, reset=False, skip_check_array=True)
+            df = x
+            if self.get_feature_names() is None:
+                # fitted without names, columns are referenced by position
+                df = x.copy(deep=False)
+                df.columns = range(x.shape[1])
+        else:
+            x = validate_data(
+                self,
+                x,
+                reset=False,
+                dtype=None,
+                ensure_all_finite=False,
+                accept_sparse=False,
+            )
+            df = pd.DataFrame(x, columns=self.get_feature_names(), copy=False)
+        if len(df) == 0:
             raise ValueError(f"Input contains 0 samples.")
-        df = pd.DataFrame(x, columns=self.get_feature_names())
-        df.astype(dtypes)
-        return df
+        return self.encode_categories(df, reset=False)
+
+    def encode_categories(self, x: pd.DataFrame, reset: bool) -> pd.DataFrame:
+        """
+        Encode nominal (non numeric) columns as pandas categoricals, so that
+        trainers and models compare small integer codes instead of objects.
+        The categories of each column seen during fit are stored in
+        `categories_`; when predicting, unknown values get the missing code (-1).
+        """
+        if reset:
+            nominal = x.select_dtypes(exclude="number").columns
+            self.categories_ = {c: pd.Categorical(x[c]).categories for c in nominal}
+        x = x.copy(deep=False)
+        for c, categories in self.categories_.items():
+            x[c] = pd.Categorical(x[c], categories=categories)
+        return self.encode_numeric(x)
+
+    def encode_numeric(self, x: pd.DataFrame) -> pd.DataFrame:
+        # apply the dtype policy to numeric columns
+        if self.dtype is None:
+            return x
+        numeric = x.select_dtypes(include="number").columns
+        return x.astype({c: self.dtype for c in numeric})
+
+    def encode_dataset(self, d: Dataset) -> Dataset:
+        return PandasDataset(self.encode_categories(d.x, reset=True), d.y)
 
     def get_dtypes(self, x):
         if isinstance(x, pd.DataFrame):
@@ -117,6 +171,21 @@ class NominalModel(metaclass=abc.ABCMeta):
         self.model_: Model = model
         self.is_fitted_ = True
 
+    def make_budget(self) -> Budget | None:
+        limits = [self.time_limit, self.max_nodes, self.memory_limit]
+        if all(limit is None for limit in limits):
+            return None
+        return Budget(self.time_limit, self.max_nodes, self.memory_limit)
+
+    def fit_trainer(self, trainer, d: Dataset, stats: FitStats | NoFitStats):
+        with stats.instrument(trainer):
+            model = trainer.fit(d)
+        self.set_model(model)
+        self.fit_stats_ = stats if isinstance(stats, FitStats) else None
+        budget = getattr(trainer, "budget", None)
+        self.truncation_ = None if budget is None else budget.truncation
+        return self
+
 
 class NominalClassifier(NominalModel):
     def __init__(self, class_weight=None, *args, **kwargs):
@@ -151,12 +220,12 @@ class NominalClassifier(NominalModel):
             raise ValueError("Can't train classifier with one class.")
         # dtype = x_original.dtype
         class_weight = self.get_class_weights(y)
-        return (
-            make_dataset(
-                self.backend, x, self.get_y(y), self.get_feature_names(), dtypes
-            ),
-            class_weight,
-        )
+        y = self.get_y(y)
+        if self.dtype is not None:
+            # smallest integer type for the class codes
+            y = y.astype(np.min_scalar_type(len(self.classes_) - 1))
+        d = make_dataset(self.backend, x, y, self.get_feature_names(), dtypes)
+        return self.encode_dataset(d), class_weight
 
     def get_y(self, y):
         y = _check_y(y, multi_output=True, y_numeric=False, estimator=self)
@@ -170,12 +239,11 @@ class NominalClassifier(NominalModel):
         pass
 
     def fit(self, x: Input, y: Output):
-        d, class_weight = self.validate_data_fit_classification(x, y)
-
+        stats = make_fit_stats(self.profile)
+        with stats.phase("schema"):
+            d, class_weight = self.validate_data_fit_classification(x, y)
         trainer = self.make_model(d, class_weight)
-        model = trainer.fit(d)
-        self.set_model(model)
-        return self
+        return self.fit_trainer(trainer, d, stats)
 
     def get_class_weights(self, y):
         return compute_class_weight(
@@ -235,7 +303,10 @@ class NominalRegressor(NominalModel, RegressorMixin):
         y = _check_y(y, multi_output=True, y_numeric=True, estimator=self)
         self._y_original_shape = y.shape
         y = atleast_2d(y)
-        return make_dataset(self.backend, x, y, self.get_feature_names(), dtypes)
+        if self.dtype is not None:
+            y = y.astype(self.dtype)
+        d = make_dataset(self.backend, x, y, self.get_feature_names(), dtypes)
+        return self.encode_dataset(d)
 
     def build_error(self, criterion: str):
         errors = {
@@ -258,8 +329,8 @@ class NominalRegressor(NominalModel, RegressorMixin):
         pass
 
     def fit(self, x: Input, y: Output):
-        d = self.validate_data_fit_regression(x, y)
+        stats = make_fit_stats(self.profile)
+        with stats.phase("schema"):
+            d = self.validate_data_fit_regression(x, y)
         trainer = self.make_model(d)
-        model = trainer.fit(d)
-        self.set_model(model)
-        return self
+        return self.fit_trainer(trainer, d, stats)
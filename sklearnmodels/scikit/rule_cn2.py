@@ -1,6 +1,5 @@
 import sys
 
-from scipy.odr import Output
 from sklearn.base import BaseEstimator
 from sklearn.utils import compute_class_weight
 from sklearnmodels.backend import Input
@@ -27,13 +26,20 @@ class CN2Classifier(NominalClassifier, BaseEstimator):
         max_error_per_rule=0.99,
         backend=DEFAULT_BACKEND,
         class_weight: np.ndarray | None = None,
+        dtype=None,
+        profile=False,
+        time_limit=None,
+        memory_limit=None,
     ):
-        super().__init__(backend=backend, class_weight=class_weight)
+        super().__init__(backend=backend, dtype=dtype, class_weight=class_weight)
         self.max_rule_length = max_rule_length
         self.max_rules = max_rules
         self.min_rule_support = min_rule_support
         self.max_error_per_rule = max_error_per_rule
         self.criterion = criterion
+        self.profile = profile
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
 
     def make_model(self, d: Dataset, class_weight: np.ndarray):
         error = self.build_error(self.criterion, class_weight)
@@ -43,6 +49,7 @@ class CN2Classifier(NominalClassifier, BaseEstimator):
             self.max_rules,
             self.min_rule_support,
             self.max_error_per_rule,
+            self.make_budget(),
         )
 
 
@@ -55,13 +62,20 @@ class CN2Regressor(NominalRegressor, BaseEstimator):
         min_rule_support=10,
         max_error_per_rule=0.99,
         backend=DEFAULT_BACKEND,
+        dtype=None,
+        profile=False,
+        time_limit=None,
+        memory_limit=None,
     ):
-        super().__init__(backend=backend)
+        super().__init__(backend=backend, dtype=dtype)
         self.max_rule_length = max_rule_length
         self.max_rules = max_rules
         self.min_rule_support = min_rule_support
         self.max_error_per_rule = max_error_per_rule
         self.criterion = criterion
+        self.profile = profile
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
 
     def make_model(self, d: Dataset):
         error = self.build_error(self.criterion)
@@ -71,4 +85,5 @@ class CN2Regressor(NominalRegressor, BaseEstimator):
             self.max_rules,
             self.min_rule_support,
             self.max_error_per_rule,
+            self.make_budget(),
         )
@@ -1,4 +1,3 @@
-from scipy.odr import Output
 from sklearn.base import BaseEstimator
 from sklearn.utils import compute_class_weight
 from sklearnmodels.backend import Input
@@ -21,8 +20,14 @@ class OneRClassifier(NominalClassifier, BaseEstimator):
         tags.classifier_tags.poor_score = True
         return tags
 
-    def __init__(self, criterion="entropy", backend=DEFAULT_BACKEND, class_weight=None):
-        super().__init__(backend=backend, class_weight=class_weight)
+    def __init__(
+        self,
+        criterion="entropy",
+        backend=DEFAULT_BACKEND,
+        class_weight=None,
+        dtype=None,
+    ):
+        super().__init__(backend=backend, dtype=dtype, class_weight=class_weight)
         self.criterion = criterion
 
     def make_model(self, d: Dataset, class_weight: np.ndarray):
@@ -37,8 +42,8 @@ class OneRRegressor(NominalRegressor, BaseEstimator):
         tags.regressor_tags.poor_score = True
         return tags
 
-    def __init__(self, criterion="std", backend=DEFAULT_BACKEND):
-        super().__init__(backend=backend)
+    def __init__(self, criterion="std", backend=DEFAULT_BACKEND, dtype=None):
+        super().__init__(backend=backend, dtype=dtype)
         self.criterion = criterion
 
     def make_model(self, d: Dataset):
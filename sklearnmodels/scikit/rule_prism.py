@@ -1,6 +1,5 @@
 import sys
 
-from scipy.odr import Output
 from sklearn.base import BaseEstimator
 from sklearn.utils import compute_class_weight
 from sklearnmodels.backend import Input
@@ -25,12 +24,19 @@ class PRISMClassifier(NominalClassifier, BaseEstimator):
         max_error_per_rule=eps,
         backend=DEFAULT_BACKEND,
         class_weight: np.ndarray | None = None,
+        dtype=None,
+        profile=False,
+        time_limit=None,
+        memory_limit=None,
     ):
-        super().__init__(backend=backend, class_weight=class_weight)
+        super().__init__(backend=backend, dtype=dtype, class_weight=class_weight)
         self.max_rule_length = max_rule_length
         self.max_rules_per_class = max_rules_per_class
         self.min_rule_support = min_rule_support
         self.max_error_per_rule = max_error_per_rule
+        self.profile = profile
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
 
     def make_model(self, d: Dataset, class_weight: np.ndarray):
         return PRISM(
@@ -39,4 +45,5 @@ class PRISMClassifier(NominalClassifier, BaseEstimator):
             self.max_rules_per_class,
             self.min_rule_support,
             self.max_error_per_rule,
+            self.make_budget(),
         )
@@ -17,8 +17,14 @@ class ZeroRClassifier(NominalClassifier, BaseEstimator):
         tags.classifier_tags.poor_score = True
         return tags
 
-    def __init__(self, criterion="entropy", backend=DEFAULT_BACKEND, class_weight=None):
-        super().__init__(backend=backend, class_weight=class_weight)
+    def __init__(
+        self,
+        criterion="entropy",
+        backend=DEFAULT_BACKEND,
+        class_weight=None,
+        dtype=None,
+    ):
+        super().__init__(backend=backend, dtype=dtype, class_weight=class_weight)
         self.criterion = criterion
 
     def make_model(self, d: Dataset, class_weight: np.ndarray):
@@ -33,8 +39,8 @@ class ZeroRRegressor(NominalRegressor, BaseEstimator):
         tags.regressor_tags.poor_score = True
         return tags
 
-    def __init__(self, criterion="std", backend=DEFAULT_BACKEND):
-        super().__init__(backend=backend)
+    def __init__(self, criterion="std", backend=DEFAULT_BACKEND, dtype=None):
+        super().__init__(backend=backend, dtype=dtype)
         self.criterion = criterion
 
     def make_model(self, d: Dataset):
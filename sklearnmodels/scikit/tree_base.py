@@ -16,6 +16,10 @@ class BaseTree:
         min_samples_split=2,
         min_samples_leaf=1,
         min_error_decrease=0.0,
+        max_leaf_nodes=None,
+        growth="depth",
+        max_features=None,
+        random_state=None,
     ):
         self.criterion = criterion
         self.splitter = splitter
@@ -23,6 +27,10 @@ class BaseTree:
         self.min_samples_leaf = min_samples_leaf
         self.min_samples_split = min_samples_split
         self.min_error_decrease = min_error_decrease
+        self.max_leaf_nodes = max_leaf_nodes
+        self.growth = growth
+        self.max_features = max_features
+        self.random_state = random_state
 
     def build_attribute_penalizer(self):
         if self.criterion == "gain_ratio":
@@ -30,22 +38,36 @@ class BaseTree:
         else:
             return shared.NoPenalization()
 
-    def build_splitter(self, e: shared.TargetError, p: shared.ColumnPenalization):
-        if self.splitter == "best":
-            max_evals = np.iinfo(np.int64).max
+    def build_splitter(
+        self,
+        e: shared.TargetError,
+        p: shared.ColumnPenalization,
+        rng: np.random.RandomState = None,
+    ):
+        if self.splitter == "random":
+            numeric = shared.RandomNumericColumnError(e, p, random_state=rng)
+        elif self.splitter == "best":
+            numeric = shared.NumericColumnError(e, p)
         elif isinstance(self.splitter, int):
-            max_evals = self.splitter
+            numeric = shared.NumericColumnError(e, p, max_evals=self.splitter)
         else:
             raise ValueError(
-                f"Invalid value '{self.splitter}' for splitter; expected integer or"
-                " 'best'"
+                f"Invalid value '{self.splitter}' for splitter; expected integer,"
+                " 'best' or 'random'"
             )
         scorers = {
-            ColumnType.Numeric: shared.NumericColumnError(e, p, max_evals=max_evals),
+            ColumnType.Numeric: numeric,
             ColumnType.Nominal: shared.NominalColumnError(e, p),
         }
         return scorers
 
+    def make_scorer(
+        self, e: shared.TargetError, scorers: dict, rng: np.random.RandomState = None
+    ):
+        return shared.DefaultSplitter(
+            e, scorers, max_features=self.max_features, random_state=rng
+        )
+
     def make_prune_criteria(self):
         return PruneCriteria(
             max_height=self.max_depth,
@@ -54,19 +76,68 @@ class BaseTree:
             min_samples_split=self.min_samples_split,
         )
 
+    def make_trainer(
+        self, scorer: shared.DefaultSplitter, prune_criteria: PruneCriteria
+    ):
+        if self.growth not in ["depth", "level"]:
+            raise ValueError(
+                f"Invalid value '{self.growth}' for growth; expected 'depth' or"
+                " 'level'"
+            )
+        budget = self.make_budget()
+        if self.max_leaf_nodes is None:
+            if self.growth == "level":
+                return tree.LevelTreeTrainer(
+                    scorer, prune_criteria, dtype=self.dtype, budget=budget
+                )
+            return tree.BaseTreeTrainer(
+                scorer, prune_criteria, dtype=self.dtype, budget=budget
+            )
+        if self.growth == "level":
+            raise ValueError("max_leaf_nodes is only supported with growth='depth'")
+        if (
+            not isinstance(self.max_leaf_nodes, (int, np.integer))
+            or self.max_leaf_nodes < 2
+        ):
+            raise ValueError(
+                f"Invalid value '{self.max_leaf_nodes}' for max_leaf_nodes; expected"
+                " None or an integer >= 2"
+            )
+        return tree.BestFirstTreeTrainer(
+            scorer, prune_criteria, self.max_leaf_nodes, dtype=self.dtype, budget=budget
+        )
+
+    def compile(self):
+        """
+        Replace the fitted tree by its array-backed `CompiledTree` form. Compiled
+        estimators predict faster, and their model can be shared between processes
+        by saving it with `backend.serialization.save` and loading it with
+        `backend.serialization.load(path, mmap_mode="r")`.
+        """
+        if isinstance(self.model_, tree.Tree):
+            self.model_ = self.model_.compile()
+        return self
+
+    def get_tree(self) -> tree.Tree:
+        if isinstance(self.model_, tree.CompiledTree):
+            return self.model_.to_tree()
+        return self.model_
+
     def pretty_print(self, class_names=None):
         return self.model_.pretty_print(class_names=class_names)
 
     def export_dot(self, class_names=None, title=""):
-        return tree.export_dot(self.model_, title=title, class_names=class_names)
+        return tree.export_dot(self.get_tree(), title=title, class_names=class_names)
 
     def export_dot_file(self, filepath, class_names=None, title=""):
         tree.export_dot_file(
-            self.model_, filepath, title=title, class_names=class_names
+            self.get_tree(), filepath, title=title, class_names=class_names
         )
 
     def export_image(self, filepath, class_names=None, title=""):
-        tree.export_image(self.model_, filepath, title=title, class_names=class_names)
+        tree.export_image(
+            self.get_tree(), filepath, title=title, class_names=class_names
+        )
 
     def display(self, class_names=None, title=""):
-        return tree.display(self.model_, title=title, class_names=class_names)
+        return tree.display(self.get_tree(), title=title, class_names=class_names)
@@ -1,6 +1,5 @@
-from scipy.odr import Output
 from sklearn.base import BaseEstimator
-from sklearn.utils import compute_class_weight
+from sklearn.utils import check_random_state, compute_class_weight
 from sklearnmodels.backend import Input
 from sklearnmodels.backend.core import Dataset
 from .tree_base import BaseTree
@@ -22,6 +21,15 @@ class TreeClassifier(NominalClassifier, BaseTree, BaseEstimator):
         min_error_decrease=1e-16,
         class_weight=None,
         backend="pandas",
+        dtype=None,
+        max_leaf_nodes=None,
+        growth="depth",
+        max_features=None,
+        random_state=None,
+        profile=False,
+        time_limit=None,
+        max_nodes=None,
+        memory_limit=None,
     ):
         super().__init__(
             class_weight=class_weight,
@@ -32,7 +40,16 @@ class TreeClassifier(NominalClassifier, BaseTree, BaseEstimator):
             min_samples_leaf=min_samples_leaf,
             min_error_decrease=min_error_decrease,
             backend=backend,
+            dtype=dtype,
+            max_leaf_nodes=max_leaf_nodes,
+            growth=growth,
+            max_features=max_features,
+            random_state=random_state,
         )
+        self.profile = profile
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+        self.memory_limit = memory_limit
 
     def __sklearn_tags__(self):
         tags = super().__sklearn_tags__()
@@ -43,14 +60,16 @@ class TreeClassifier(NominalClassifier, BaseTree, BaseEstimator):
         error = self.build_error(self.criterion, class_weight)
         column_penalization = self.build_attribute_penalizer()
 
-        scorers = self.build_splitter(error, column_penalization)
+        # shared by the random choices of the splitters
+        rng = check_random_state(self.random_state)
+        scorers = self.build_splitter(error, column_penalization, rng)
 
-        scorer = shared.DefaultSplitter(error, scorers)
+        scorer = self.make_scorer(error, scorers, rng)
         prune_criteria = tree.pruning.PruneCriteria(
             max_height=self.max_depth,
             min_samples_leaf=self.min_samples_leaf,
             min_error_decrease=self.min_error_decrease,
             min_samples_split=self.min_samples_split,
         )
-        trainer = tree.BaseTreeTrainer(scorer, prune_criteria)
+        trainer = self.make_trainer(scorer, prune_criteria)
         return trainer
@@ -1,5 +1,5 @@
-from scipy.odr import Output
 from sklearn.base import BaseEstimator
+from sklearn.utils import check_random_state
 from sklearnmodels.backend import Input
 from sklearnmodels.backend.core import Dataset
 from .tree_base import BaseTree
@@ -20,6 +20,15 @@ class TreeRegressor(NominalRegressor, BaseTree, BaseEstimator):
         min_samples_leaf=1,
         min_error_decrease=1e-16,
         backend="pandas",
+        dtype=None,
+        max_leaf_nodes=None,
+        growth="depth",
+        max_features=None,
+        random_state=None,
+        profile=False,
+        time_limit=None,
+        max_nodes=None,
+        memory_limit=None,
     ):
         super().__init__(
             criterion=criterion,
@@ -29,13 +38,24 @@ class TreeRegressor(NominalRegressor, BaseTree, BaseEstimator):
             min_samples_leaf=min_samples_leaf,
             min_error_decrease=min_error_decrease,
             backend=backend,
+            dtype=dtype,
+            max_leaf_nodes=max_leaf_nodes,
+            growth=growth,
+            max_features=max_features,
+            random_state=random_state,
         )
+        self.profile = profile
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+        self.memory_limit = memory_limit
 
     def make_model(self, d: Dataset):
         error = self.build_error(self.criterion)
         column_penalization = self.build_attribute_penalizer()
-        scorers = self.build_splitter(error, column_penalization)
-        scorer = shared.DefaultSplitter(error, scorers)
+        # shared by the random choices of the splitters
+        rng = check_random_state(self.random_state)
+        scorers = self.build_splitter(error, column_penalization, rng)
+        scorer = self.make_scorer(error, scorers, rng)
         prune_criteria = self.make_prune_criteria()
-        trainer = tree.BaseTreeTrainer(scorer, prune_criteria)
+        trainer = self.make_trainer(scorer, prune_criteria)
         return trainer
@@ -6,6 +6,7 @@ from .attribute_penalization import (
 from .column_error import (
     NominalColumnError,
     NumericColumnError,
+    RandomNumericColumnError,
     ColumnCallback,
     ColumnErrorResult,
     ColumnError,
@@ -18,6 +19,8 @@ from .target_error import (
     DeviationError,
     EntropyError,
     GiniError,
+    GradientError,
     RegressionError,
+    StatisticsError,
     TargetError,
 )
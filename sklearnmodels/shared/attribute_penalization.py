@@ -12,19 +12,29 @@ class ColumnPenalization(abc.ABC):
     def __init__(self):
         super().__init__()
 
-    abc.abstractmethod
-
+    @abc.abstractmethod
     def penalize(self, partition: Partition):
         pass
 
+    @abc.abstractmethod
+    def penalize_counts(self, counts: np.ndarray):
+        # penalization of partitions given the number of samples of their
+        # branches, along the last axis of counts
+        pass
+
 
 class NoPenalization(ColumnPenalization):
     def penalize(self, partition: Partition):
         return 1
 
+    def penalize_counts(self, counts: np.ndarray):
+        return 1
+
 
 class GainRatioPenalization(ColumnPenalization):
     def penalize(self, partition: Partition):
-        counts = np.array([d_i.n for d_i in partition], dtype="float64")
-        counts /= counts.sum()
-        return -np.sum(counts * log(counts, len(counts)))
+        return self.penalize_counts(np.array([d_i.n for d_i in partition]))
+
+    def penalize_counts(self, counts: np.ndarray):
+        p = counts / counts.sum(axis=-1, keepdims=True)
+        return -np.sum(p * log(p, counts.shape[-1]), axis=-1)
@@ -1,9 +1,9 @@
 import abc
 from typing import Callable
 
-from h11 import Data
 import numpy as np
 import pandas as pd
+from sklearn.utils import check_random_state
 
 from sklearnmodels.backend.conditions import Condition, RangeCondition, ValueCondition
 from sklearnmodels.backend.core import Dataset, Partition
@@ -11,7 +11,7 @@ from sklearnmodels.backend.split import RangeSplit, Split
 from .attribute_penalization import ColumnPenalization, NoPenalization
 from sklearnmodels.backend.split import ValueSplit
 
-from .target_error import TargetError
+from .target_error import StatisticsError, TargetError, average_errors
 
 type ColumnCallback = Callable[[ColumnErrorResult], None]
 
@@ -24,17 +24,32 @@ class ColumnErrorResult:
         conditions: list[Condition],
         partition: Partition,
         remove: bool = False,
+        errors: np.ndarray | None = None,
+        counts: np.ndarray | None = None,
+        predictions: np.ndarray | None = None,
     ):
         self.error = error
         self.conditions = conditions
         self.partition = partition
         self.column = column
         self.remove = remove
+        # error, samples and (optionally) prediction of each branch, computed
+        # while evaluating the split, see TargetError.split_errors
+        self.errors = errors
+        self.counts = counts
+        self.predictions = predictions
 
     def __repr__(self):
         return f"Score({self.column},{self.error},{len(self.conditions)} branches)"
 
 
+class MissingValues:
+    def __init__(self, mask: np.ndarray, n: int, statistics: np.ndarray):
+        self.mask = mask
+        self.n = n
+        self.statistics = statistics
+
+
 class ColumnError(abc.ABC):
 
     def __init__(
@@ -66,9 +81,65 @@ class ColumnError(abc.ABC):
         remove=False,
     ) -> ColumnErrorResult:
         partition = d.split(conditions)
-        error = self.metric.average_split(partition)
+        errors, counts, predictions = self.metric.split_errors(partition)
+        error = average_errors(errors, counts)
         error /= self.penalization.penalize(partition)
-        return ColumnErrorResult(column, error, conditions, partition, remove)
+        return ColumnErrorResult(
+            column, error, conditions, partition, remove, errors, counts, predictions
+        )
+
+    def evaluate_missing(
+        self,
+        d: Dataset,
+        conditions: list[Condition],
+        column: str,
+        missing: MissingValues,
+        remove=False,
+    ) -> ColumnErrorResult:
+        """
+        Evaluate conditions that split the rows of `d` without missing values in
+        `column`, sending the rows with missing values along the branch with the
+        lowest error. That branch's condition is marked as the default for
+        missing values. The error of each option is computed from the statistics
+        of the branches and of the missing rows, without building the datasets
+        of each option.
+        """
+        masks = [c.mask(d) for c in conditions]
+        partition = [d.subset(m) for m in masks]
+        statistics = np.stack([self.metric.statistics(p) for p in partition])
+        n = np.array([d_branch.n for d_branch in partition])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # empty branches have undefined errors, but zero weight
+            errors = self.metric.statistics_error(statistics)
+        errors = np.where(n > 0, n * errors, 0)
+        errors_missing = self.metric.statistics_error(statistics + missing.statistics)
+        # total error when adding the missing rows to each branch
+        options = errors.sum() - errors + (n + missing.n) * errors_missing
+        options /= n.sum() + missing.n
+        best = int(np.argmin(options))
+        statistics[best] += missing.statistics
+        branches = self.metric.table_errors(statistics)
+        conditions = list(conditions)
+        conditions[best] = conditions[best].with_missing()
+        partition[best] = d.subset(masks[best] | missing.mask)
+        error = options[best] / self.penalization.penalize(partition)
+        return ColumnErrorResult(
+            column, error, conditions, partition, remove, *branches
+        )
+
+    def missing_values(self, d: Dataset, column: str) -> MissingValues | None:
+        # rows with missing values in column, computed once per node and column
+        mask = d.missing_mask(column)
+        n = int(mask.sum())
+        if n == 0:
+            return None
+        if not isinstance(self.metric, StatisticsError):
+            raise ValueError(
+                f"Column {column} has missing values, which require a target error"
+                f" with statistics (a StatisticsError), but got {self.metric}"
+            )
+        statistics = self.metric.statistics(d.subset(mask))
+        return MissingValues(mask, n, statistics)
 
 
 class NumericColumnError(ColumnError):
@@ -104,23 +175,64 @@ class NumericColumnError(ColumnError):
         column: str,
     ) -> ColumnErrorResult | None:
         values = self.get_values(d, column)
+        missing = self.missing_values(d, column)
         # find best split value based on unique values of column
         best = None
         for i, v in enumerate(values):
             conditions = RangeCondition.make(column, v)
-            result = self.evaluate_conditions(d, conditions, column)
+            if missing is None:
+                result = self.evaluate_conditions(d, conditions, column)
+            else:
+                result = self.evaluate_missing(d, conditions, column, missing)
             self.do_callback(result)
             if best is None or result.error <= best.error:
                 best = result
         return best
 
 
+class RandomNumericColumnError(NumericColumnError):
+    """
+    Evaluates `n_thresholds` thresholds drawn uniformly between the minimum and
+    maximum values of the column, as in extremely randomized trees, instead of
+    the distinct values of the column. Drawing them requires a single pass over
+    the column, without sorting it.
+    """
+
+    def __init__(
+        self,
+        metric: TargetError,
+        penalization: ColumnPenalization = NoPenalization(),
+        callback=None,
+        n_thresholds: int = 1,
+        random_state=None,
+    ):
+        super().__init__(metric, penalization, callback=callback)
+        assert n_thresholds > 0
+        self.n_thresholds = n_thresholds
+        self.rng = check_random_state(random_state)
+
+    def get_values(self, d: Dataset, column: str):
+        values = d.values(column)
+        if len(values) == 0:
+            return []
+        low, high = values.min(), values.max()
+        if low == high:
+            return []
+        return self.rng.uniform(low, high, self.n_thresholds)
+
+
 class NominalColumnError(ColumnError):
 
     def error(self, d: Dataset, column: str) -> ColumnErrorResult | None:
         conditions: list[Condition] = [
-            ValueCondition(column, v) for v in d.unique_values(column, False)
+            ValueCondition(column, v).intern() for v in d.unique_values(column, False)
         ]
-        result = self.evaluate_conditions(d, conditions, column, remove=True)
+        missing = self.missing_values(d, column)
+        if missing is None:
+            result = self.evaluate_conditions(d, conditions, column, remove=True)
+        elif len(conditions) == 0:
+            return None
+        else:
+            result = self.evaluate_missing(d, conditions, column, missing, remove=True)
         self.do_callback(result)
         return result
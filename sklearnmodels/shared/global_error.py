@@ -1,9 +1,9 @@
 import abc
-from os import error
 from typing import Callable
 
 import numpy as np
 import pandas as pd
+from sklearn.utils import check_random_state
 
 from sklearnmodels.backend.conditions import Condition
 from sklearnmodels.backend.core import ColumnType, Dataset
@@ -18,6 +18,24 @@ from .column_error import (
 from .target_error import TargetError
 
 
+def n_features(max_features: int | float | str | None, n: int) -> int:
+    # number of columns evaluated at each node, see DefaultSplitter
+    if max_features is None:
+        return n
+    if max_features == "sqrt":
+        return max(1, int(np.sqrt(n)))
+    if max_features == "log2":
+        return max(1, int(np.log2(n)))
+    if isinstance(max_features, (int, np.integer)) and max_features >= 1:
+        return min(int(max_features), n)
+    if isinstance(max_features, (float, np.floating)) and 0 < max_features <= 1:
+        return max(1, int(max_features * n))
+    raise ValueError(
+        f"Invalid value '{max_features}' for max_features; expected None, an integer"
+        " >= 1, a float in (0, 1], 'sqrt' or 'log2'"
+    )
+
+
 # TODO simplify this
 class GlobalErrorResult:
     def __init__(
@@ -39,6 +57,9 @@ class Splitter(abc.ABC):
     def split_columns(self, d: Dataset) -> ColumnErrorResult | None:
         pass
 
+    def prediction(self, d: Dataset) -> np.ndarray:
+        return self.global_error(d).prediction
+
 
 class DefaultSplitter(Splitter):
 
@@ -46,6 +67,8 @@ class DefaultSplitter(Splitter):
         self,
         error_function: TargetError,
         column_splitters: dict[ColumnType, ColumnError] = None,
+        max_features: int | float | str | None = None,
+        random_state=None,
     ):
         if column_splitters is None:
             column_splitters = {
@@ -54,6 +77,9 @@ class DefaultSplitter(Splitter):
             }
         self.column_splitters = column_splitters
         self.target_error = error_function
+        # evaluate only a random subset of max_features columns at each node
+        self.max_features = max_features
+        self.rng = check_random_state(random_state)
 
     def __repr__(self):
         return f"Error({self.target_error})"
@@ -63,11 +89,22 @@ class DefaultSplitter(Splitter):
         global_prediction = self.target_error.prediction(d)
         return GlobalErrorResult(global_prediction, global_metric)
 
+    def prediction(self, d: Dataset):
+        return self.target_error.prediction(d)
+
     def split_columns(self, d: Dataset) -> ColumnErrorResult | None:
         best = None
-        for c, c_type in zip(d.columns, d.types):
+        for c, c_type in self.sample_columns(list(zip(d.columns, d.types))):
             result = self.column_splitters[c_type].error(d, c)
             update = best is None or (result is not None and result.error < best.error)
             if update:
                 best = result
         return best
+
+    def sample_columns(self, columns: list) -> list:
+        # random subset of the columns, in their original order
+        if self.max_features is None or len(columns) == 0:
+            return columns
+        k = n_features(self.max_features, len(columns))
+        chosen = np.sort(self.rng.choice(len(columns), k, replace=False))
+        return [columns[i] for i in chosen]
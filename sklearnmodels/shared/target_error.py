@@ -3,7 +3,8 @@ import abc
 import numpy as np
 import pandas as pd
 
-from sklearnmodels.backend.core import Dataset, Partition
+from sklearnmodels.backend.conditions import ValueCondition
+from sklearnmodels.backend.core import ColumnID, Dataset, Partition
 
 
 class TargetError(abc.ABC):
@@ -12,28 +13,113 @@ class TargetError(abc.ABC):
         pass
 
     def average_split(self, partition: list[Dataset]):
-        error = 0.0
-        n = 0
-        for d_branch in partition:
-            if d_branch.n == 0:
-                continue
-            branch_error = self(d_branch)
-            n_branch = d_branch.n
-            error += n_branch * branch_error
-            n += n_branch
-        if n == 0:
-            return np.inf
-        else:
-            return error / n
+        errors, counts, _ = self.split_errors(partition)
+        return average_errors(errors, counts)
+
+    def split_errors(
+        self, partition: list[Dataset]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        """
+        Error, number of samples and prediction of each branch of a partition, so
+        that the nodes created from the branches don't need to compute them again.
+        Empty branches have infinite error. The predictions are None unless they
+        can be computed along with the errors, as for a `StatisticsError`.
+        """
+        counts = np.array([d_branch.n for d_branch in partition])
+        errors = np.array(
+            [self(d_branch) if d_branch.n > 0 else np.inf for d_branch in partition],
+            dtype=float,
+        )
+        return errors, counts, None
 
     @abc.abstractmethod
     def prediction(self, d: Dataset):
         pass
 
+    def errors_by_value(
+        self, d: Dataset, column: ColumnID
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Error and number of samples of the subsets of `d` defined by each distinct
+        value of the nominal `column`. Subclasses override it to compute the errors
+        directly from per value statistics, without filtering the dataset.
+        """
+        values = d.unique_values(column, False)
+        partition = d.split([ValueCondition(column, v) for v in values])
+        errors = np.array([self(d_value) for d_value in partition], dtype=float)
+        counts = np.array([d_value.n for d_value in partition])
+        return values, errors, counts
+
     def __repr__(self):
         return self.__class__.__name__
 
 
+class StatisticsError(abc.ABC):
+    """
+    Target error computed from additive statistics of the target (eg, class
+    counts), so that the error of a union of subsets is computed by adding their
+    statistics, without scanning their rows again. Required to route missing
+    values to a default branch and to train trees level-wise.
+    """
+
+    @abc.abstractmethod
+    def statistics(self, d: Dataset) -> np.ndarray:
+        # additive statistics of the target of d
+        pass
+
+    @abc.abstractmethod
+    def statistics_error(self, statistics: np.ndarray) -> np.ndarray:
+        # error of each row of a (subsets x statistics) table
+        pass
+
+    @abc.abstractmethod
+    def grouped_statistics(
+        self, y: np.ndarray, groups: np.ndarray, n_groups: int
+    ) -> np.ndarray:
+        # (n_groups x statistics) table with the statistics of the rows of y in
+        # each group, computed in a single pass
+        pass
+
+    @abc.abstractmethod
+    def statistics_n(self, statistics: np.ndarray) -> np.ndarray:
+        # number of samples of each row of a (subsets x statistics) table
+        pass
+
+    @abc.abstractmethod
+    def statistics_prediction(self, statistics: np.ndarray) -> np.ndarray:
+        # prediction of each row of a (subsets x statistics) table
+        pass
+
+    def split_errors(self, partition: list[Dataset]):
+        # errors, counts and predictions from the statistics of each branch
+        statistics = np.stack([self.statistics(d_branch) for d_branch in partition])
+        return self.table_errors(statistics)
+
+    def table_errors(self, statistics: np.ndarray):
+        # split_errors of the branches of a (branches x statistics) table
+        counts = self.statistics_n(statistics)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            errors = self.statistics_error(statistics)
+            predictions = self.statistics_prediction(statistics)
+        errors[counts == 0] = np.inf
+        return errors, counts, predictions
+
+
+def average_errors(errors: np.ndarray, counts: np.ndarray):
+    # error of a partition, weighting the error of each branch by its samples
+    error = 0.0
+    n = 0
+    for branch_error, n_branch in zip(errors, counts):
+        if n_branch == 0:
+            continue
+        error += n_branch * branch_error
+        n += n_branch
+    if n == 0:
+        return np.inf
+    else:
+        return error / n
+
+
 eps = 1e-32
 
 
@@ -50,7 +136,7 @@ def log(x, base):
         return np.log(x) * lb
 
 
-class ClassificationError(TargetError):
+class ClassificationError(StatisticsError, TargetError):
     def __init__(self, classes: int, class_weight: np.ndarray):
         self.classes = classes
         self.class_weight = class_weight
@@ -63,6 +149,43 @@ class ClassificationError(TargetError):
             # Assumes classes start at 0
             return d.class_distribution(self.class_weight)
 
+    def distribution(self, counts: np.ndarray):
+        # class distribution of each row of a (values x classes) table of counts
+        p = counts * self.class_weight
+        return p / p.sum(axis=1, keepdims=True)
+
+    @abc.abstractmethod
+    def counts_error(self, counts: np.ndarray) -> np.ndarray:
+        # error of each row of a (values x classes) table of counts
+        pass
+
+    def errors_by_value(self, d: Dataset, column: ColumnID):
+        values, counts = d.value_class_counts(column, self.classes)
+        return values, self.counts_error(counts), counts.sum(axis=1)
+
+    def statistics(self, d: Dataset):
+        return np.bincount(d.y, minlength=self.classes)
+
+    def statistics_error(self, statistics: np.ndarray):
+        return self.counts_error(statistics)
+
+    def grouped_statistics(self, y: np.ndarray, groups: np.ndarray, n_groups: int):
+        counts = np.bincount(
+            groups * self.classes + y, minlength=n_groups * self.classes
+        )
+        return counts.reshape(n_groups, self.classes)
+
+    def statistics_n(self, statistics: np.ndarray):
+        return statistics.sum(axis=1)
+
+    def statistics_prediction(self, statistics: np.ndarray):
+        with np.errstate(invalid="ignore"):
+            predictions = self.distribution(statistics)
+        # empty subsets are predicted as in prediction
+        empty = statistics.sum(axis=1) == 0
+        predictions[empty] = self.class_weight / self.class_weight.sum()
+        return predictions
+
     def __repr__(self):
         return f"{super().__repr__()}(classes={self.classes})"
 
@@ -78,6 +201,10 @@ class EntropyError(ClassificationError):
 
         return -np.sum(p * log(p, self.classes))
 
+    def counts_error(self, counts: np.ndarray):
+        p = self.distribution(counts)
+        return -np.sum(p * log(p, self.classes), axis=1)
+
 
 class AccuracyError(ClassificationError):
     def __init__(self, classes: int, class_weight: np.ndarray):
@@ -88,6 +215,11 @@ class AccuracyError(ClassificationError):
         klass = p.argmax()
         return 1 - d.count_class(klass) / d.n
 
+    def counts_error(self, counts: np.ndarray):
+        klass = self.distribution(counts).argmax(axis=1)
+        n = counts.sum(axis=1)
+        return 1 - counts[np.arange(len(counts)), klass] / n
+
 
 class FixedClassAccuracyError(ClassificationError):
     """
@@ -108,6 +240,12 @@ class FixedClassAccuracyError(ClassificationError):
     def __call__(self, d: Dataset):
         return 1 - d.count_class(self.klass) / d.n
 
+    def counts_error(self, counts: np.ndarray):
+        return 1 - counts[:, self.klass] / counts.sum(axis=1)
+
+    def statistics_prediction(self, statistics: np.ndarray):
+        return np.tile(self._prediction, (len(statistics), 1))
+
 
 class GiniError(ClassificationError):
     def __init__(self, classes: int, class_weight: np.ndarray, base=2):
@@ -118,13 +256,17 @@ class GiniError(ClassificationError):
         p = self.prediction(d)
         return 1 - np.sum(p**2)
 
+    def counts_error(self, counts: np.ndarray):
+        p = self.distribution(counts)
+        return 1 - np.sum(p**2, axis=1)
+
 
 class RegressionError(TargetError):
     def prediction(self, d: Dataset):
         return d.mean_y()
 
 
-class DeviationError(RegressionError):
+class DeviationError(StatisticsError, RegressionError):
     def __call__(self, d: Dataset):
         if d.n == 0:
             return np.inf
@@ -132,3 +274,110 @@ class DeviationError(RegressionError):
             return 0
         else:
             return d.std_y()
+
+    def moments_error(self, n: np.ndarray, sums: np.ndarray, squares: np.ndarray):
+        n_column = n[:, np.newaxis]
+        mean = sums / n_column
+        variance = np.maximum(squares / n_column - mean**2, 0)
+        errors = np.sqrt(variance).sum(axis=1)
+        errors[n == 1] = 0
+        return errors
+
+    def errors_by_value(self, d: Dataset, column: ColumnID):
+        values, n, sums, squares = d.value_target_moments(column)
+        return values, self.moments_error(n, sums, squares), n
+
+    def statistics(self, d: Dataset):
+        # count, sums and sums of squares of each output
+        y = d.y if d.y.ndim == 2 else d.y[:, np.newaxis]
+        y = y.astype(np.float64)
+        return np.concatenate([[d.n], y.sum(axis=0), (y**2).sum(axis=0)])
+
+    def grouped_statistics(self, y: np.ndarray, groups: np.ndarray, n_groups: int):
+        y = y if y.ndim == 2 else y[:, np.newaxis]
+        y = y.astype(np.float64)
+        columns = [np.bincount(groups, minlength=n_groups)]
+        for v in [y, y**2]:
+            columns += [
+                np.bincount(groups, weights=v[:, j], minlength=n_groups)
+                for j in range(v.shape[1])
+            ]
+        return np.stack(columns, axis=1)
+
+    def statistics_n(self, statistics: np.ndarray):
+        return statistics[:, 0]
+
+    def statistics_prediction(self, statistics: np.ndarray):
+        outputs = (statistics.shape[1] - 1) // 2
+        return statistics[:, 1 : 1 + outputs] / statistics[:, :1]
+
+    def statistics_error(self, statistics: np.ndarray):
+        outputs = (statistics.shape[1] - 1) // 2
+        n = statistics[:, 0]
+        sums = statistics[:, 1 : 1 + outputs]
+        squares = statistics[:, 1 + outputs :]
+        return self.moments_error(n, sums, squares)
+
+
+class GradientError(StatisticsError, TargetError):
+    """
+    Error of a second order (Newton) step on a loss, for gradient boosting. The
+    target of each row holds the gradients of the loss for each output followed by
+    its hessians. Nodes predict the step -G/(H + l2_regularization), from the sums
+    of gradients G and hessians H of their rows, and their error is the weighted
+    deviation of the steps of the rows around it, sum(g²/h) - G²/(H + λ), per
+    sample. Splits that decrease this error decrease the approximated loss by the
+    same amount.
+    """
+
+    def __init__(self, l2_regularization: float = 0.0):
+        self.l2_regularization = l2_regularization
+
+    def __call__(self, d: Dataset):
+        return float(self.statistics_error(self.statistics(d)[np.newaxis])[0])
+
+    def prediction(self, d: Dataset):
+        return self.statistics_prediction(self.statistics(d)[np.newaxis])[0]
+
+    def statistics(self, d: Dataset):
+        return self.grouped_statistics(d.y, np.zeros(d.n, dtype=np.int64), 1)[0]
+
+    def grouped_statistics(self, y: np.ndarray, groups: np.ndarray, n_groups: int):
+        # count, and sums of gradients, hessians and g²/h of each output
+        outputs = y.shape[1] // 2
+        g, h = y[:, :outputs], y[:, outputs:]
+        q = g**2 / np.maximum(h, eps)
+        columns = [np.bincount(groups, minlength=n_groups)]
+        for v in [g, h, q]:
+            columns += [
+                np.bincount(groups, weights=v[:, j], minlength=n_groups)
+                for j in range(outputs)
+            ]
+        return np.stack(columns, axis=1)
+
+    def statistics_n(self, statistics: np.ndarray):
+        return statistics[:, 0]
+
+    def moments(self, statistics: np.ndarray):
+        outputs = (statistics.shape[1] - 1) // 3
+        g = statistics[:, 1 : 1 + outputs]
+        h = statistics[:, 1 + outputs : 1 + 2 * outputs]
+        q = statistics[:, 1 + 2 * outputs :]
+        return g, h + self.l2_regularization, q
+
+    def statistics_prediction(self, statistics: np.ndarray):
+        g, h, _ = self.moments(statistics)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            prediction = -g / h
+        prediction[h == 0] = 0
+        return prediction
+
+    def statistics_error(self, statistics: np.ndarray):
+        g, h, q = self.moments(statistics)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gain = np.where(h > 0, g**2 / h, 0)
+            errors = np.maximum(q - gain, 0).sum(axis=1) / statistics[:, 0]
+        return errors
+
+    def __repr__(self):
+        return f"{super().__repr__()}(l2_regularization={self.l2_regularization})"
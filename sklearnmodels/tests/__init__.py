@@ -1,6 +1,10 @@
 # Authors: scikit-learn-contrib developers
 # License: BSD 3 clause
 
+import string
+
+import numpy as np
+import pandas as pd
 from sklearn.pipeline import Pipeline
 from sklearn.tree import BaseDecisionTree
 
@@ -18,3 +22,29 @@ def get_model_complexity(model: NominalModel | BaseDecisionTree) -> int:
             return tree.n_leaves
 
     raise ValueError(f"Unsupported model {model}")
+
+
+def make_data(n=500, seed=0, nominal=True, numeric=0, missing=0.0, noise=0.0):
+    """
+    Classification data with a nominal column `a` (x/y/z), a numeric column `b`,
+    a nominal column `c` (u/v/w/q) if `nominal`, and `numeric` more normal
+    columns named with the following letters. A fraction `missing` of the values
+    of `a`, `b` and `c` is missing. The class is the xor of `a == "x"`, `b > 0.5`
+    (or missing) and `c == "u"` (if present), with a fraction `noise` of the
+    labels flipped.
+    """
+    rng = np.random.default_rng(seed)
+    x = pd.DataFrame({"a": rng.choice(["x", "y", "z"], n), "b": rng.normal(size=n)})
+    if nominal:
+        x["c"] = rng.choice(["u", "v", "w", "q"], n)
+    for name in string.ascii_lowercase[len(x.columns) :][:numeric]:
+        x[name] = rng.normal(size=n)
+    if missing > 0:
+        for name in x.columns[: 3 if nominal else 2]:
+            x.loc[rng.random(n) < missing, name] = None
+    y = (x["a"] == "x") ^ ((x["b"] > 0.5) | x["b"].isna())
+    if nominal:
+        y ^= x["c"] == "u"
+    y = y.to_numpy().astype(int)
+    y[rng.random(n) < noise] ^= 1
+    return x, y
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.tests import make_data
+
+
+@pytest.mark.parametrize("max_leaf_nodes", [2, 3, 5, 10, 20])
+@pytest.mark.parametrize("estimator", [TreeClassifier, TreeRegressor])
+def test_max_leaf_nodes(estimator, max_leaf_nodes):
+    x, y = make_data()
+    model = estimator(max_leaf_nodes=max_leaf_nodes).fit(x, y)
+    assert 1 < model.model_.n_leafs() <= max_leaf_nodes
+    assert len(model.predict(x)) == len(x)
+
+
+def test_best_first_is_greedy():
+    x, y = make_data()
+    errors = []
+    for max_leaf_nodes in [2, 4, 8, 16]:
+        model = TreeClassifier(max_leaf_nodes=max_leaf_nodes).fit(x, y)
+        errors.append(np.mean(model.predict(x) != y))
+    assert errors == sorted(errors, reverse=True)
+
+
+def test_unbounded_matches_depth_first():
+    x, y = make_data()
+    full = TreeClassifier().fit(x, y)
+    best_first = TreeClassifier(max_leaf_nodes=10_000).fit(x, y)
+    assert best_first.model_.n_leafs() == full.model_.n_leafs()
+    np.testing.assert_allclose(best_first.predict_proba(x), full.predict_proba(x))
+
+
+@pytest.mark.parametrize("max_leaf_nodes", [1, 2.5, "10"])
+def test_invalid_max_leaf_nodes(max_leaf_nodes):
+    x, y = make_data()
+    with pytest.raises(ValueError, match="max_leaf_nodes"):
+        TreeClassifier(max_leaf_nodes=max_leaf_nodes).fit(x, y)
@@ -0,0 +1,123 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearnmodels.backend.conditions import ValueCondition
+from sklearnmodels.backend.pandas import PandasDataset
+from sklearnmodels.ensemble import GradientBoosting, SquaredLoss
+from sklearnmodels.scikit.boosting_classification import (
+    NominalGradientBoostingClassifier,
+)
+from sklearnmodels.scikit.boosting_regression import NominalGradientBoostingRegressor
+from sklearnmodels.shared import GradientError
+from sklearnmodels.tests import make_data
+from sklearnmodels.tree import PackedTrees
+
+
+def test_gradient_error():
+    rng = np.random.default_rng(0)
+    g = rng.normal(size=(50, 2))
+    h = rng.uniform(0.5, 1, size=(50, 2))
+    x = pd.DataFrame({"a": rng.choice(["x", "y"], 50)})
+    d = PandasDataset(x, np.concatenate([g, h], axis=1))
+    error = GradientError(l2_regularization=1.0)
+    np.testing.assert_allclose(error.prediction(d), -g.sum(0) / (h.sum(0) + 1))
+    # weighted deviation of the steps of the rows around the step of the node
+    expected = (g**2 / h).sum() - (g.sum(0) ** 2 / (h.sum(0) + 1)).sum()
+    np.testing.assert_allclose(error(d), expected / 50)
+    groups = (x["a"] == "y").to_numpy().astype(int)
+    statistics = error.grouped_statistics(d.y, groups, 2)
+    partition = d.split([ValueCondition("a", "x"), ValueCondition("a", "y")])
+    errors, counts, predictions = error.split_errors(partition)
+    np.testing.assert_allclose(error.statistics_error(statistics), errors)
+    np.testing.assert_array_equal(error.statistics_n(statistics), counts)
+    np.testing.assert_allclose(error.statistics_prediction(statistics), predictions)
+    # splits never increase the error
+    assert np.sum(errors * counts) / 50 <= error(d)
+
+
+def test_gradient_error_squared_loss():
+    # with unit hessians, the error is the variance of the negative gradients
+    rng = np.random.default_rng(0)
+    g = rng.normal(size=(30, 1))
+    d = PandasDataset(
+        pd.DataFrame({"a": np.zeros(30)}), np.hstack([g, np.ones_like(g)])
+    )
+    np.testing.assert_allclose(GradientError()(d), g.var())
+
+
+class RecordingLoss(SquaredLoss):
+    def __init__(self):
+        self.raw = []
+
+    def gradients(self, y, raw, out):
+        self.raw.append(raw.copy())
+        super().gradients(y, raw, out)
+
+
+def test_training_predictions():
+    # predictions updated from the rows of the nodes match those of the trees,
+    # including rows with missing values and rows of pruned branches
+    x, y = make_data(300, missing=0.1, noise=0.1)
+    estimator = NominalGradientBoostingRegressor(n_estimators=5, min_samples_leaf=20)
+    d = estimator.validate_data_fit_regression(x, y.astype(float))
+    loss = RecordingLoss()
+    trainer = estimator.make_boosting_trainer(loss)
+    model = trainer.fit(d)
+    assert trainer.trainer.tree_creation_callback is None
+    np.testing.assert_allclose(loss.raw[0], np.tile(model.baseline, (d.n, 1)))
+    trees = model.trees
+    for i, raw in enumerate(loss.raw[1:], 1):
+        packed = PackedTrees.from_trees(trees[:i])
+        partial = GradientBoosting(model.baseline, packed, 0.1, loss)
+        np.testing.assert_allclose(partial.predict_raw(d), raw)
+
+
+def test_boosting_classifier():
+    x, y = make_data(1000, nominal=False, missing=0.1, noise=0.1)
+    x_test, y_test = make_data(1000, seed=1, nominal=False, missing=0.1, noise=0.1)
+    losses = []
+    for n_estimators in [1, 10, 50]:
+        estimator = NominalGradientBoostingClassifier(n_estimators=n_estimators)
+        p = estimator.fit(x, y).predict_proba(x)
+        np.testing.assert_allclose(p.sum(axis=1), 1)
+        losses.append(-np.mean(np.log(p[np.arange(len(y)), y])))
+    assert losses[0] > losses[1] > losses[2]
+    assert estimator.model_.n_trees() == 50
+    assert np.mean(estimator.predict(x_test) == y_test) > 0.85
+    loaded = pickle.loads(pickle.dumps(estimator))
+    np.testing.assert_allclose(
+        loaded.predict_proba(x_test), estimator.predict_proba(x_test)
+    )
+
+
+def test_boosting_classifier_multiclass():
+    x, y = make_data(1000, missing=0.1, noise=0.1)
+    y = y + 2 * (x["c"] == "u").to_numpy()
+    estimator = NominalGradientBoostingClassifier(max_depth=4).fit(x, y)
+    assert estimator.predict_proba(x).shape == (len(x), 4)
+    assert np.mean(estimator.predict(x) == y) > 0.85
+
+
+def test_boosting_regressor():
+    x, _ = make_data(1000, missing=0.1, noise=0.1)
+    y = np.stack([x["b"].fillna(0) * 2, (x["a"] == "x") * 3.0], axis=1)
+    # a single leaf predicts the mean
+    stump = NominalGradientBoostingRegressor(max_depth=1, learning_rate=1.0)
+    np.testing.assert_allclose(stump.fit(x, y).predict(x[:3]), [y.mean(axis=0)] * 3)
+    estimator = NominalGradientBoostingRegressor().fit(x, y)
+    p = estimator.predict(x)
+    assert p.shape == y.shape
+    assert np.all(np.mean((p - y) ** 2, axis=0) < 0.05 * y.var(axis=0))
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"n_estimators": 0}, {"learning_rate": 0}, {"l2_regularization": -1}],
+)
+def test_invalid_params(params):
+    x, y = make_data(100, missing=0.1, noise=0.1)
+    with pytest.raises(ValueError, match=list(params)[0]):
+        NominalGradientBoostingClassifier(**params).fit(x, y)
@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+
+from sklearnmodels.backend.budget import Budget, current_rss
+from sklearnmodels.backend.pandas import PandasDataset
+from sklearnmodels.scikit.rule_cn2 import CN2Classifier
+from sklearnmodels.scikit.rule_prism import PRISMClassifier
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.shared import DefaultSplitter, EntropyError
+from sklearnmodels.tests import make_data
+from sklearnmodels.tree import (
+    BaseTreeTrainer,
+    BestFirstTreeTrainer,
+    LevelTreeTrainer,
+    PruneCriteria,
+)
+
+
+@pytest.mark.parametrize(
+    "params", [{}, {"growth": "level"}, {"max_leaf_nodes": 30}], ids=str
+)
+def test_max_nodes(params):
+    x, y = make_data(noise=0.1)
+    full = TreeClassifier(max_depth=6, **params).fit(x, y)
+    assert full.truncation_ is None
+    model = TreeClassifier(max_depth=6, max_nodes=9, **params).fit(x, y)
+    truncation = model.truncation_
+    assert truncation.reason == "max_nodes"
+    assert truncation.open >= 1
+    assert model.model_.n_nodes() == truncation.nodes <= 9
+    assert model.model_.n_nodes() < full.model_.n_nodes()
+    assert model.predict(x).shape == y.shape
+
+
+def test_unlimited_budget():
+    x, y = make_data(noise=0.1)
+    model = TreeRegressor(max_depth=4).fit(x, y.astype(float))
+    limited = TreeRegressor(max_depth=4, max_nodes=10**6, time_limit=100)
+    limited.fit(x, y.astype(float))
+    assert limited.truncation_ is None
+    assert model.pretty_print() == limited.pretty_print()
+
+
+@pytest.mark.parametrize(
+    "params", [{}, {"growth": "level"}, {"max_leaf_nodes": 30}], ids=str
+)
+def test_time_limit(params):
+    x, y = make_data(noise=0.1)
+    model = TreeClassifier(time_limit=1e-9, **params).fit(x, y)
+    assert model.truncation_.reason == "time_limit"
+    assert model.truncation_.open >= 1
+    # only the root, which predicts the majority class
+    assert model.model_.n_nodes() == 1
+    assert len(np.unique(model.predict(x))) == 1
+
+
+@pytest.mark.parametrize(
+    "make_trainer",
+    [
+        BaseTreeTrainer,
+        LevelTreeTrainer,
+        lambda *args, **kwargs: BestFirstTreeTrainer(*args, 30, **kwargs),
+    ],
+    ids=["depth", "level", "best_first"],
+)
+def test_callback_after_budget(make_trainer):
+    # nodes that the budget keeps as leaves reach the callback once, as leaves
+    x, y = make_data(noise=0.1)
+    splitter = DefaultSplitter(EntropyError(2, np.ones(2)))
+    results = []
+    trainer = make_trainer(
+        splitter,
+        PruneCriteria(max_height=6),
+        tree_creation_callback=results.append,
+        budget=Budget(max_nodes=9),
+    )
+    root = trainer.fit(PandasDataset(x, y))
+    assert trainer.budget.truncation.reason == "max_nodes"
+    nodes = []
+
+    def walk(tree):
+        nodes.append(tree)
+        for branch in tree.branches.values():
+            walk(branch)
+
+    walk(root)
+    assert sorted(id(r.tree) for r in results) == sorted(id(t) for t in nodes)
+    for r in results:
+        assert r.prune == (len(r.tree.branches) == 0)
+
+
+@pytest.mark.parametrize("model", [CN2Classifier, PRISMClassifier])
+def test_rules_time_limit(model):
+    x, y = make_data(noise=0.1)
+    fitted = model(time_limit=1e-9).fit(x, y)
+    assert fitted.truncation_.reason == "time_limit"
+    assert len(fitted.model_.rules) == 0
+    assert fitted.predict(x).shape == y.shape
+    assert model().fit(x, y).truncation_ is None
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"time_limit": 0}, {"max_nodes": 0}, {"max_nodes": 2.5}, {"memory_limit": -1}],
+    ids=str,
+)
+def test_invalid_budget(params):
+    x, y = make_data(noise=0.1)
+    with pytest.raises(ValueError):
+        TreeClassifier(**params).fit(x, y)
+
+
+def test_memory_limit():
+    budget = Budget(memory_limit=1)
+    assert not budget.available()
+    assert budget.truncation.reason == "memory_limit"
+    assert not budget.spend(1)
+
+
+def test_memory_limit_ignores_freed_memory():
+    x, y = make_data(noise=0.1)
+    rss = current_rss()
+    # touch 256 MiB and free them before the fit, raising the peak RSS only
+    freed = np.ones(2**25)
+    assert current_rss() > rss + 2**27
+    del freed
+    limit = current_rss() + 2**26
+    assert limit < rss + 2**28
+    model = TreeClassifier(memory_limit=limit).fit(x, y)
+    assert model.truncation_ is None
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearnmodels.backend.conditions import (
+    AndCondition,
+    NotCondition,
+    RangeCondition,
+    TrueCondition,
+    ValueCondition,
+)
+from sklearnmodels.backend.factory import pyarrow_backed_pandas
+from sklearnmodels.backend.pandas import PandasDataset
+from sklearnmodels.scikit.rule_cn2 import CN2Classifier
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.tests import make_data
+
+conditions = [
+    ValueCondition("a", "x"),
+    RangeCondition("b", 2.0, True),
+    RangeCondition("b", 2.0, False),
+    NotCondition(ValueCondition("a", "y")),
+    NotCondition(RangeCondition("b", 2.0, True)),
+    AndCondition([ValueCondition("a", "y"), RangeCondition("b", 1.0, False)]),
+    TrueCondition(),
+    ValueCondition("a", "x", missing=True),
+    RangeCondition("b", 2.0, True, missing=True),
+    RangeCondition("b", 2.0, False, missing=True),
+]
+
+
+@pytest.mark.parametrize("condition", conditions, ids=repr)
+@pytest.mark.parametrize("pyarrow", [False, True])
+def test_mask_matches_rowwise(condition, pyarrow):
+    x = pd.DataFrame(
+        {
+            "a": ["x", "y", None, "x", "z", "y"],
+            "b": [1.0, np.nan, 3.0, 4.0, 0.5, 2.0],
+        }
+    )
+    if pyarrow:
+        pytest.importorskip("pyarrow")
+        x = pyarrow_backed_pandas(x)
+    d = PandasDataset(x, None)
+    expected = np.array([condition(row) for _, row in x.iterrows()], dtype=bool)
+    np.testing.assert_array_equal(condition.mask(d), expected)
+
+
+@pytest.mark.parametrize("model", [TreeClassifier(), CN2Classifier(min_rule_support=2)])
+def test_predict_matches_rowwise(model):
+    x, y = make_data(300, missing=0.1)
+    model.fit(x, y)
+    expected = np.stack([model.model_.predict_sample(row) for _, row in x.iterrows()])
+    np.testing.assert_allclose(model.model_.predict(x), expected)
+
+
+def test_conditions_compare_by_value():
+    assert ValueCondition("a", "x") == ValueCondition("a", "x")
+    assert ValueCondition("a", "x") != ValueCondition("a", "y")
+    assert RangeCondition("b", 1.0, True) != RangeCondition("b", 1.0, False)
+    assert ValueCondition("a", "x") != NotCondition(ValueCondition("a", "x"))
+    assert len({ValueCondition("a", "x"), ValueCondition("a", "x")}) == 1
+    c = ValueCondition("a", "x").intern()
+    assert ValueCondition("a", "x").intern() is c
+    assert not hasattr(c, "__dict__")
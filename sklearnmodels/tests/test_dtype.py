@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from sklearnmodels.scikit.rule_cn2 import CN2Regressor
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.tests import make_data
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [TreeRegressor(max_depth=5), CN2Regressor(min_rule_support=20)],
+    ids=repr,
+)
+def test_float32_regression(estimator):
+    x, y = make_data(nominal=False, numeric=1)
+    # integer columns are also stored as float32
+    x["c"] = (x["c"] * 3).astype(int)
+    y = y + x["b"].to_numpy()
+    expected = estimator.fit(x, y).predict(x)
+    estimator.set_params(dtype="float32")
+    d = estimator.validate_data_fit_regression(x, y)
+    assert d.y.dtype == np.float32
+    assert d.x["b"].dtype == np.float32 and d.x["c"].dtype == np.float32
+    p = estimator.fit(x, y).predict(x)
+    np.testing.assert_allclose(p, expected, rtol=1e-4, atol=1e-4)
+
+
+def test_float32_tree():
+    x, y = make_data(nominal=False, numeric=1)
+    expected = TreeClassifier().fit(x, y).predict_proba(x)
+    estimator = TreeClassifier(dtype="float32").fit(x, y)
+    tree = estimator.model_
+    assert tree.prediction.dtype == np.float32
+    assert all(t.prediction.dtype == np.float32 for t in tree.children())
+    np.testing.assert_allclose(estimator.predict_proba(x), expected, atol=1e-6)
+    compiled = tree.compile()
+    assert compiled.arrays["prediction"].dtype == np.float32
+    np.testing.assert_allclose(compiled.predict(x), tree.predict(x))
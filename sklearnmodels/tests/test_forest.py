@@ -0,0 +1,66 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from sklearnmodels.ensemble.forest import bootstrap
+from sklearnmodels.scikit.forest_classification import NominalRandomForestClassifier
+from sklearnmodels.scikit.forest_regression import NominalRandomForestRegressor
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.tests import make_data
+from sklearnmodels.tree import CompiledTree
+
+
+def test_bootstrap():
+    rows = bootstrap(100, 0)
+    assert len(rows) == 100
+    assert np.all(np.diff(rows) >= 0)
+    assert 0 <= rows.min() and rows.max() < 100
+    assert len(np.unique(rows)) < 100
+    np.testing.assert_array_equal(rows, bootstrap(100, 0))
+
+
+def test_forest_classifier():
+    x, y = make_data(1000, numeric=1, noise=0.1)
+    x_test, y_test = make_data(1000, seed=1, numeric=1, noise=0.1)
+    forest = NominalRandomForestClassifier(n_estimators=20, random_state=0)
+    forest.fit(x, y)
+    assert forest.model_.n_trees() == 20
+    assert all(isinstance(t, CompiledTree) for t in forest.model_.trees)
+    # bootstrap samples have the size of the dataset
+    assert all(t.arrays["samples"][0] == len(x) for t in forest.model_.trees)
+    p = forest.predict_proba(x_test)
+    np.testing.assert_allclose(p.sum(axis=1), 1)
+    accuracy = np.mean(forest.predict(x_test) == y_test)
+    tree_accuracy = np.mean(TreeClassifier().fit(x, y).predict(x_test) == y_test)
+    assert accuracy > tree_accuracy
+
+
+def test_forest_is_seeded():
+    x, y = make_data(1000, numeric=1, noise=0.1)
+    fit = lambda **kwargs: NominalRandomForestClassifier(n_estimators=5, **kwargs).fit(
+        x, y
+    )
+    expected = fit(random_state=0).predict_proba(x)
+    np.testing.assert_allclose(fit(random_state=0).predict_proba(x), expected)
+    np.testing.assert_allclose(fit(random_state=0, n_jobs=2).predict_proba(x), expected)
+    assert not np.allclose(fit(random_state=1).predict_proba(x), expected)
+
+
+def test_forest_regressor():
+    x, _ = make_data(1000, numeric=1, noise=0.1)
+    y = np.stack([x["b"] * 2, x["d"] - x["b"]], axis=1)
+    forest = NominalRandomForestRegressor(n_estimators=10, random_state=0).fit(x, y)
+    p = forest.predict(x)
+    assert p.shape == y.shape
+    assert np.corrcoef(p[:, 0], y[:, 0])[0, 1] > 0.9
+    loaded = pickle.loads(pickle.dumps(forest))
+    np.testing.assert_allclose(loaded.predict(x), p)
+    assert "tree 9" in forest.pretty_print()
+
+
+@pytest.mark.parametrize("n_estimators", [0, 2.5])
+def test_invalid_n_estimators(n_estimators):
+    x, y = make_data(1000, numeric=1, noise=0.1)
+    with pytest.raises(ValueError, match="n_estimators"):
+        NominalRandomForestClassifier(n_estimators=n_estimators).fit(x, y)
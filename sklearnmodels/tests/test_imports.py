@@ -0,0 +1,59 @@
+import re
+import subprocess
+import sys
+
+# optional or incidental dependencies that must not be loaded by importing
+# the package or its estimators
+lazy_modules = [
+    "matplotlib",
+    "pygraphviz",
+    "graphviz",
+    "h11",
+    "pyparsing",
+    "scipy.odr",
+    "sklearn.calibration",
+    "sklearn.dummy",
+    "sklearnmodels.tree.export",
+]
+
+import_estimators = (
+    "import sklearnmodels;"
+    "from sklearnmodels.scikit import naive_bayes, rule_cn2, rule_oner, rule_prism,"
+    " rule_zeror, tree_classification, tree_regression"
+)
+
+
+def run(code: str, *args) -> str:
+    result = subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout + result.stderr
+
+
+def test_import_is_lazy():
+    code = f"{import_estimators}; import sys; print(sorted(sys.modules))"
+    loaded = eval(run(code).splitlines()[-1])
+    assert [m for m in lazy_modules if m in loaded] == []
+
+
+def test_export_is_loaded_on_use():
+    code = "import sys, sklearnmodels.tree as t; t.export_dot;"
+    code += "print('sklearnmodels.tree.export' in sys.modules)"
+    assert run(code).splitlines()[-1] == "True"
+
+
+def test_import_time():
+    # time spent in the package's own modules, excluding its dependencies
+    output = run(import_estimators, "-X", "importtime")
+    own = [
+        int(self_us)
+        for self_us, name in re.findall(
+            r"import time:\s+(\d+) \|\s+\d+ \|\s+(.+)", output
+        )
+        if name.strip().startswith("sklearnmodels")
+    ]
+    assert len(own) > 0
+    assert sum(own) < 500_000
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from sklearn.utils.estimator_checks import parametrize_with_checks
+
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.shared import DefaultSplitter, RegressionError
+from sklearnmodels.tests import make_data
+from sklearnmodels.tree import LevelTreeTrainer, PruneCriteria
+
+
+@pytest.mark.parametrize("criterion", ["entropy", "gini", "gain_ratio"])
+def test_level_matches_depth_nominal(criterion):
+    x, y = make_data(1000, noise=0.1)
+    x = x.drop(columns=["b"])
+    depth = TreeClassifier(criterion=criterion).fit(x, y)
+    level = TreeClassifier(criterion=criterion, growth="level").fit(x, y)
+    assert level.model_.n_leafs() == depth.model_.n_leafs()
+    np.testing.assert_allclose(level.predict_proba(x), depth.predict_proba(x))
+
+
+@pytest.mark.parametrize("estimator", [TreeClassifier, TreeRegressor])
+def test_level_matches_depth_numeric(estimator):
+    x, y = make_data(1000, noise=0.1)
+    if estimator is TreeRegressor:
+        y = y + x["b"].to_numpy()
+    depth = estimator(max_depth=3).fit(x, y)
+    level = estimator(max_depth=3, growth="level").fit(x, y)
+    assert set(level.model_.branches) == set(depth.model_.branches)
+    assert level.model_.n_leafs() == depth.model_.n_leafs()
+    np.testing.assert_allclose(level.predict(x), depth.predict(x))
+
+
+@pytest.mark.parametrize("estimator", [TreeClassifier, TreeRegressor])
+def test_level_missing_values(estimator):
+    x, y = make_data(1000, noise=0.1)
+    x.loc[::7, "a"] = None
+    x.loc[::5, "b"] = np.nan
+    model = estimator(growth="level").fit(x, y).model_
+    leafs = []
+
+    def walk(t):
+        if len(t.branches) == 0:
+            leafs.append(t)
+        for child in t.branches.values():
+            walk(child)
+
+    walk(model)
+    assert sum(t.samples for t in leafs) == len(x)
+    np.testing.assert_allclose(model.compile().predict(x), model.predict(x))
+
+
+def test_invalid_growth():
+    x, y = make_data(1000, noise=0.1)
+    with pytest.raises(ValueError, match="growth"):
+        TreeClassifier(growth="width").fit(x, y)
+    with pytest.raises(ValueError, match="max_leaf_nodes"):
+        TreeClassifier(growth="level", max_leaf_nodes=4).fit(x, y)
+
+
+class MedianError(RegressionError):
+    # a target error without grouped statistics
+    def __call__(self, d):
+        return np.abs(d.y - np.median(d.y, axis=0)).mean()
+
+
+def test_level_requires_statistics():
+    with pytest.raises(ValueError, match="StatisticsError"):
+        LevelTreeTrainer(DefaultSplitter(MedianError()), PruneCriteria())
+
+
+def test_level_min_samples_leaf():
+    x, y = make_data(1000, noise=0.1)
+    model = TreeClassifier(growth="level", min_samples_leaf=5).fit(x, y).model_
+
+    def walk(t):
+        assert t.samples >= 5
+        for child in t.branches.values():
+            walk(child)
+
+    walk(model)
+
+
+@parametrize_with_checks(
+    [TreeClassifier(growth="level"), TreeRegressor(growth="level")]
+)
+def test_level_estimators(estimator, check):
+    check(estimator)
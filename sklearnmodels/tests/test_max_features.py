@@ -0,0 +1,44 @@
+import pytest
+
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.shared.global_error import n_features
+from sklearnmodels.tests import make_data
+
+
+@pytest.mark.parametrize(
+    "max_features,expected",
+    [(None, 100), ("sqrt", 10), ("log2", 6), (0.25, 25), (1e-6, 1), (7, 7), (500, 100)],
+)
+def test_n_features(max_features, expected):
+    assert n_features(max_features, 100) == expected
+
+
+@pytest.mark.parametrize("max_features", [0, -1, 0.0, 1.5, "all"])
+def test_invalid_max_features(max_features):
+    x, y = make_data(nominal=False, numeric=19)
+    with pytest.raises(ValueError, match="max_features"):
+        TreeClassifier(max_features=max_features).fit(x, y)
+
+
+@pytest.mark.parametrize("growth", ["depth", "level"])
+@pytest.mark.parametrize("estimator", [TreeClassifier, TreeRegressor])
+def test_max_features_is_seeded(estimator, growth):
+    x, y = make_data(nominal=False, numeric=19)
+    fit = lambda seed: estimator(
+        max_features="sqrt", random_state=seed, growth=growth, max_depth=4
+    ).fit(x, y)
+    assert fit(0).pretty_print() == fit(0).pretty_print()
+    printed = {fit(seed).pretty_print() for seed in range(5)}
+    assert len(printed) > 1
+
+
+def test_max_features_uses_subset():
+    x, y = make_data(nominal=False, numeric=19)
+    # with a single column per node, the root can't always find a or b
+    roots = set()
+    for seed in range(10):
+        model = TreeClassifier(max_features=1, random_state=seed, max_depth=2)
+        roots.add(model.fit(x, y).model_.column)
+    assert len(roots) > 2
+    assert TreeClassifier(max_features=1.0).fit(x, y).model_.column in ["a", "b"]
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.tests import make_data
+
+
+def leaf_samples(tree):
+    if tree.leaf:
+        return tree.samples
+    return sum(leaf_samples(t) for t in tree.children())
+
+
+@pytest.mark.parametrize("estimator", [TreeClassifier(), TreeRegressor()], ids=repr)
+def test_missing_values_are_routed(estimator):
+    x, y = make_data(1000, nominal=False, missing=0.2)
+    estimator.fit(x, y)
+    tree = estimator.model_
+    # no rows are dropped when splitting on columns with missing values
+    assert leaf_samples(tree) == len(x)
+    defaults = [c for c in tree.conditions() if c.missing]
+    assert len(defaults) == 1
+    assert "or NA" in estimator.pretty_print()
+
+    rowwise = np.stack([tree.predict_sample(row) for _, row in x.iterrows()])
+    np.testing.assert_allclose(tree.predict(x), rowwise)
+    np.testing.assert_allclose(tree.compile().predict(x), rowwise)
+
+
+def test_missing_values_default_branch():
+    x, y = make_data(1000, nominal=False, missing=0.2)
+    estimator = TreeClassifier(max_depth=3).fit(x, y)
+    x_test = pd.DataFrame({"a": ["y", "y"], "b": [np.nan, -1.0]})
+    np.testing.assert_array_equal(estimator.predict(x_test), [1, 0])
+    assert (estimator.predict(x) == y).mean() > 0.95
@@ -0,0 +1,67 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from sklearnmodels.backend.factory import as_dataset
+from sklearnmodels.scikit.forest_classification import NominalRandomForestClassifier
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.tests import make_data
+from sklearnmodels.tree import PackedTrees
+
+
+def make_trees():
+    # trees with different columns and categories
+    x, y = make_data(300)
+    trees = [
+        TreeClassifier().fit(x, y).model_,
+        TreeClassifier(max_depth=3).fit(x[["c", "b"]], y).model_,
+        TreeClassifier().fit(x[x["a"] != "z"], y[x["a"] != "z"]).model_.compile(),
+        TreeClassifier(max_depth=1).fit(x, y).model_,
+    ]
+    return trees
+
+
+@pytest.fixture
+def d():
+    # with missing and unseen values
+    x, _ = make_data(300, seed=1, missing=0.2)
+    x.loc[::11, "c"] = "t"
+    return as_dataset(x.astype({"a": "category", "c": "category"}))
+
+
+@pytest.mark.parametrize("batch_size", [2**16, 7, 1])
+def test_packed_predictions(batch_size, d):
+    trees = make_trees()
+    packed = PackedTrees.from_trees(trees, batch_size=batch_size)
+    assert packed.n_trees() == len(trees)
+    expected = sum(t.predict(d) for t in trees)
+    np.testing.assert_allclose(packed.predict(d), expected)
+    index = np.arange(d.n)[::-1]
+    predictions = np.zeros((d.n, 2))
+    packed.predict_dataset(d, index, predictions)
+    np.testing.assert_allclose(predictions[index], expected)
+
+
+def test_packed_trees(d):
+    trees = make_trees()
+    packed = PackedTrees.from_trees(trees)
+    for tree, unpacked in zip(trees, packed.trees()):
+        assert unpacked.pretty_print() == tree.pretty_print()
+    assert packed.complexity() == sum(t.complexity() for t in trees)
+    loaded = pickle.loads(pickle.dumps(packed))
+    np.testing.assert_allclose(loaded.predict(d), packed.predict(d))
+
+
+def test_forest_prediction(d):
+    x, y = make_data(300)
+    forest = NominalRandomForestClassifier(n_estimators=10, random_state=0).fit(x, y)
+    expected = np.mean([t.predict(d) for t in forest.model_.trees], axis=0)
+    np.testing.assert_allclose(forest.model_.predict(d), expected)
+
+
+def test_single_leaf(d):
+    x, y = make_data(300)
+    leaf = TreeClassifier(max_depth=1).fit(x, y).model_
+    packed = PackedTrees.from_trees([leaf, leaf])
+    np.testing.assert_allclose(packed.predict(d), 2 * leaf.predict(d))
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearnmodels.scikit.naive_bayes import NaiveBayesClassifier
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.tests import make_data
+
+
+def as_arrow(x: pd.DataFrame):
+    pa = pytest.importorskip("pyarrow")
+    return pa.Table.from_pandas(x, preserve_index=False)
+
+
+inputs = {
+    "dataframe": lambda x: x,
+    "shuffled_index": lambda x: x.set_axis(np.random.permutation(len(x))),
+    "ndarray": lambda x: x.to_numpy(),
+    "categorical": lambda x: x.astype({"a": "category"}),
+    "arrow": as_arrow,
+}
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+@pytest.mark.parametrize("kind", inputs.keys())
+def test_predict_input(kind, compiled):
+    x, y = make_data(300, nominal=False)
+    estimator = TreeClassifier().fit(x, y)
+    expected = estimator.predict_proba(x)
+    if compiled:
+        estimator.compile()
+    x_test = inputs[kind](x)
+    if kind == "ndarray":
+        with pytest.warns(UserWarning, match="feature names"):
+            p = estimator.predict_proba(x_test)
+    else:
+        p = estimator.predict_proba(x_test)
+    np.testing.assert_allclose(p, expected)
+
+
+def test_predict_keeps_dtypes():
+    x, y = make_data(300, nominal=False)
+    estimator = NaiveBayesClassifier().fit(x, y)
+    df = estimator.validate_data_predict(x)
+    assert df["b"].dtype == np.float64
+    assert isinstance(df["a"].dtype, pd.CategoricalDtype)
+    assert len(estimator.predict(x)) == len(x)
+
+
+def test_predict_fitted_without_names():
+    x, y = make_data(300, nominal=False)
+    x["a"] = (x["a"] == "x").astype(float)
+    estimator = TreeClassifier().fit(x.to_numpy(), y)
+    expected = estimator.predict_proba(x.to_numpy())
+    with pytest.warns(UserWarning, match="feature names"):
+        np.testing.assert_allclose(estimator.predict_proba(x), expected)
+
+
+def test_category_encoding():
+    x, y = make_data(300, nominal=False)
+    estimator = TreeClassifier().fit(x, y)
+    assert list(estimator.categories_) == ["a"]
+    assert list(estimator.categories_["a"]) == ["x", "y", "z"]
+    x_test = pd.DataFrame({"a": ["x", "w", None], "b": [0.0, 0.0, 0.0]})
+    codes = estimator.validate_data_predict(x_test)["a"].cat.codes
+    assert codes.dtype == np.int8
+    assert list(codes) == [0, -1, -1]
+    # unknown values are predicted like missing values
+    p = estimator.predict_proba(x_test)
+    np.testing.assert_allclose(p[1], p[2])
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from sklearnmodels.backend.profiling import FitStats
+from sklearnmodels.scikit.naive_bayes import NaiveBayesClassifier
+from sklearnmodels.scikit.rule_cn2 import CN2Classifier
+from sklearnmodels.scikit.rule_prism import PRISMClassifier
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.tests import make_data
+
+
+@pytest.mark.parametrize(
+    "params", [{}, {"growth": "level"}, {"max_leaf_nodes": 6}], ids=str
+)
+def test_tree_phases(params):
+    x, y = make_data(300, missing=0.1, noise=0.1)
+    model = TreeClassifier(max_depth=4, profile=True, **params).fit(x, y)
+    stats = model.fit_stats_
+    assert isinstance(stats, FitStats)
+    for phase in ["schema", "fit", "nodes", "pruning", "partitioning"]:
+        assert phase in stats
+    assert "split_search.numeric" in stats
+    assert "split_search.nominal" in stats
+    assert stats["nodes"].calls == model.model_.n_nodes()
+    assert stats["fit"].time >= stats["split_search.numeric"].time
+
+
+def test_profiling_off():
+    x, y = make_data(300, missing=0.1, noise=0.1)
+    model = TreeClassifier(max_depth=4).fit(x, y)
+    assert model.fit_stats_ is None
+    profiled = TreeClassifier(max_depth=4, profile=True).fit(x, y)
+    np.testing.assert_array_equal(model.predict(x), profiled.predict(x))
+    assert model.pretty_print() == profiled.pretty_print()
+
+
+def test_events():
+    x, y = make_data(300, missing=0.1, noise=0.1)
+    events = []
+    model = TreeRegressor(max_depth=3, profile=events.append).fit(x, y.astype(float))
+    stats = model.fit_stats_
+    assert len(events) == sum(s.calls for s in stats.phases.values())
+    assert set(events[0]) == {"phase", "start", "time", "rows"}
+    assert events[-1]["phase"] == "fit"
+    root = [e for e in events if e["phase"] == "nodes"][0]
+    assert root["rows"] == len(x)
+
+
+@pytest.mark.parametrize(
+    "model,phases",
+    [
+        (CN2Classifier, ["rules", "condition_search.nominal", "partitioning"]),
+        (PRISMClassifier, ["rules", "condition_search.numeric", "partitioning"]),
+        (NaiveBayesClassifier, ["classes", "columns.nominal", "columns.numeric"]),
+    ],
+)
+def test_other_trainers(model, phases):
+    x, y = make_data(300, noise=0.1)
+    stats = model().set_params(profile=True).fit(x, y).fit_stats_
+    for phase in phases:
+        assert phase in stats
+
+
+def test_instrument_restores_methods():
+    x, y = make_data(300, missing=0.1, noise=0.1)
+    model = TreeClassifier(max_depth=3)
+    d, class_weight = model.validate_data_fit_classification(x, y)
+    trainer = model.make_model(d, class_weight)
+    stats = FitStats()
+    with pytest.raises(RuntimeError):
+        with stats.instrument(trainer):
+            assert "split_columns" in vars(trainer.splitter)
+            raise RuntimeError()
+    assert "split_columns" not in vars(trainer.splitter)
+    assert "new_node" not in vars(trainer)
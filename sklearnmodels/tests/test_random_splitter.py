@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from sklearnmodels.backend.pandas import PandasDataset
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.shared import DeviationError, RandomNumericColumnError
+from sklearnmodels.tests import make_data
+
+
+def test_random_thresholds():
+    x, y = make_data(nominal=False, numeric=1)
+    x["d"] = 1.0
+    x.loc[::3, "b"] = np.nan
+    d = PandasDataset(x, y.astype(float))
+    error = RandomNumericColumnError(DeviationError(), n_thresholds=5, random_state=0)
+    thresholds = error.get_values(d, "b")
+    assert len(thresholds) == 5
+    assert np.all(thresholds >= x["b"].min()) and np.all(thresholds < x["b"].max())
+    assert len(error.get_values(d, "d")) == 0
+    assert error.error(d, "d") is None
+
+
+@pytest.mark.parametrize("growth", ["depth", "level"])
+@pytest.mark.parametrize("estimator", [TreeClassifier, TreeRegressor])
+def test_random_splitter(estimator, growth):
+    x, y = make_data(nominal=False, numeric=1)
+    x_test, y_test = make_data(seed=1, nominal=False, numeric=1)
+    fit = lambda seed: estimator(
+        splitter="random", random_state=seed, growth=growth
+    ).fit(x, y)
+    model = fit(0)
+    assert model.pretty_print() == fit(0).pretty_print()
+    assert model.pretty_print() != fit(1).pretty_print()
+    # thresholds are drawn, not taken from the values of the column
+    values = set(x["b"]) | set(x["c"])
+    thresholds = set()
+
+    def walk(t):
+        for c, child in t.branches.items():
+            if hasattr(c, "less"):
+                thresholds.add(c.value)
+            walk(child)
+
+    walk(model.model_)
+    assert len(thresholds) > 0
+    assert not values.intersection(thresholds)
+    if estimator is TreeClassifier:
+        assert np.mean(model.predict(x_test) == y_test) > 0.9
+
+
+def test_invalid_splitter():
+    x, y = make_data(nominal=False, numeric=1)
+    with pytest.raises(ValueError, match="splitter"):
+        TreeClassifier(splitter="fast").fit(x, y)
@@ -0,0 +1,94 @@
+import io
+import pickle
+
+import numpy as np
+import pytest
+
+from sklearnmodels.backend.serialization import load, save
+from sklearnmodels.scikit.naive_bayes import NaiveBayesClassifier
+from sklearnmodels.scikit.rule_cn2 import CN2Classifier, CN2Regressor
+from sklearnmodels.scikit.rule_oner import OneRClassifier
+from sklearnmodels.scikit.rule_prism import PRISMClassifier
+from sklearnmodels.scikit.rule_zeror import ZeroRClassifier
+from sklearnmodels.scikit.tree_classification import TreeClassifier
+from sklearnmodels.scikit.tree_regression import TreeRegressor
+from sklearnmodels.tests import make_data
+from sklearnmodels.tree import Tree
+
+classifiers = [
+    TreeClassifier(),
+    CN2Classifier(min_rule_support=5),
+    PRISMClassifier(min_rule_support=5, max_error_per_rule=0.2),
+    OneRClassifier(),
+    ZeroRClassifier(),
+    NaiveBayesClassifier(),
+]
+regressors = [TreeRegressor(max_depth=4), CN2Regressor(min_rule_support=5)]
+
+
+@pytest.mark.parametrize("estimator", classifiers + regressors, ids=repr)
+def test_save_load(estimator, tmp_path):
+    x, y = make_data(300)
+    if estimator in regressors:
+        y = y + x["b"].to_numpy()
+    estimator.fit(x, y)
+    model = estimator.model_
+    save(model, tmp_path / "model")
+    loaded = load(tmp_path / "model")
+    assert type(loaded) is type(model)
+    if not isinstance(estimator, NaiveBayesClassifier):
+        assert loaded.pretty_print() == model.pretty_print()
+    np.testing.assert_allclose(loaded.predict(x), model.predict(x))
+
+
+def test_load_is_memory_mapped(tmp_path):
+    x, y = make_data(300)
+    model = TreeClassifier().fit(x, y).model_
+    save(model, tmp_path / "model")
+    loaded = load(tmp_path / "model", mmap_mode="r")
+    assert isinstance(loaded.prediction.base, np.memmap)
+
+
+class NodePickler(pickle.Pickler):
+    # pickles trees node by node, as they would be without Tree.__reduce__
+    def reducer_override(self, obj):
+        if isinstance(obj, Tree):
+            state = {s: getattr(obj, s) for s in Tree.__slots__}
+            state["branches"] = dict(obj.branches)
+            return object.__new__, (Tree,), (None, state)
+        return NotImplemented
+
+
+def test_tree_pickle_is_compact():
+    x, y = make_data(n=2000, noise=0.2)
+    estimator = TreeClassifier().fit(x, y)
+    data = pickle.dumps(estimator)
+    loaded = pickle.loads(data)
+    np.testing.assert_allclose(loaded.predict_proba(x), estimator.predict_proba(x))
+    assert loaded.model_.pretty_print() == estimator.model_.pretty_print()
+    nodes = io.BytesIO()
+    NodePickler(nodes).dump(estimator)
+    assert len(data) < 0.7 * len(nodes.getvalue())
+
+
+@pytest.mark.parametrize("estimator", [TreeClassifier(), TreeRegressor(max_depth=4)])
+def test_compiled_tree(estimator, tmp_path):
+    x, y = make_data(300)
+    estimator.fit(x, y)
+    model = estimator.model_
+    # missing and unseen values stop at the last matching node
+    x_test, _ = make_data(300, seed=1, missing=0.2)
+    x_test.loc[::11, "c"] = "t"
+    compiled = model.compile()
+    np.testing.assert_allclose(compiled.predict(x_test), model.predict(x_test))
+    assert compiled.to_tree().pretty_print() == model.pretty_print()
+
+    save(compiled, tmp_path / "model")
+    loaded = load(tmp_path / "model", mmap_mode="r")
+    assert isinstance(loaded.arrays["prediction"], np.memmap)
+    np.testing.assert_allclose(loaded.predict(x_test), model.predict(x_test))
+
+    expected = estimator.predict(x_test)
+    estimator.compile()
+    np.testing.assert_allclose(estimator.predict(x_test), expected)
+    assert estimator.pretty_print() == model.pretty_print()
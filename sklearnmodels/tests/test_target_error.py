@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from sklearnmodels.backend.conditions import ValueCondition
+from sklearnmodels.backend.pandas import PandasDataset
+from sklearnmodels.shared.column_error import NominalColumnError
+from sklearnmodels.shared.target_error import (
+    AccuracyError,
+    DeviationError,
+    EntropyError,
+    FixedClassAccuracyError,
+    GiniError,
+    RegressionError,
+    StatisticsError,
+    TargetError,
+)
+from sklearnmodels.tests import make_data
+
+class_weight = np.array([1.0, 2.0, 0.5])
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        EntropyError(3, class_weight),
+        GiniError(3, class_weight),
+        AccuracyError(3, class_weight),
+        FixedClassAccuracyError(1, 3, class_weight),
+    ],
+)
+def test_classification_errors_by_value(error: TargetError):
+    x, y = make_data(200, missing=0.3)
+    d = PandasDataset(x[["a", "c"]], y)
+    for column in d.columns:
+        values, errors, counts = error.errors_by_value(d, column)
+        # same result as filtering the dataset with each value
+        expected = TargetError.errors_by_value(error, d, column)
+        assert list(values) == list(expected[0])
+        np.testing.assert_allclose(errors, expected[1])
+        np.testing.assert_array_equal(counts, expected[2])
+
+
+def test_regression_errors_by_value():
+    x, _ = make_data(200, missing=0.3)
+    y = np.random.default_rng(0).normal(size=(len(x), 2))
+    d = PandasDataset(x[["a", "c"]], y)
+    error = DeviationError()
+    for column in d.columns:
+        values, errors, counts = error.errors_by_value(d, column)
+        expected = TargetError.errors_by_value(error, d, column)
+        assert list(values) == list(expected[0])
+        np.testing.assert_allclose(errors, expected[1])
+        np.testing.assert_array_equal(counts, expected[2])
+
+
+@pytest.mark.parametrize(
+    "error,y",
+    [
+        (EntropyError(3, class_weight), np.arange(200) % 3),
+        (GiniError(3, class_weight), np.arange(200) % 3),
+        (DeviationError(), np.random.default_rng(0).normal(size=(200, 2))),
+    ],
+    ids=repr,
+)
+def test_statistics_error(error: TargetError, y):
+    x, _ = make_data(200)
+    d = PandasDataset(x, y)
+    partition = d.split([ValueCondition("a", v) for v in ["x", "y", "z"]])
+    statistics = np.stack([error.statistics(d_value) for d_value in partition])
+    expected = [error(d_value) for d_value in partition]
+    np.testing.assert_allclose(error.statistics_error(statistics), expected)
+    # statistics are additive
+    union = error.statistics_error(statistics.sum(axis=0, keepdims=True))
+    np.testing.assert_allclose(union, [error(d)])
+
+
+@pytest.mark.parametrize(
+    "error,y",
+    [
+        (EntropyError(3, class_weight), np.arange(200) % 3),
+        (AccuracyError(3, class_weight), np.arange(200) % 3),
+        (FixedClassAccuracyError(1, 3, class_weight), np.arange(200) % 3),
+        (DeviationError(), np.random.default_rng(0).normal(size=(200, 2))),
+    ],
+    ids=repr,
+)
+def test_split_errors(error: TargetError, y):
+    x, _ = make_data(200)
+    d = PandasDataset(x, y)
+    values = ["x", "y", "z", "w"]
+    partition = d.split([ValueCondition("a", v) for v in values])
+    errors, counts, predictions = error.split_errors(partition)
+    np.testing.assert_array_equal(counts, [d_value.n for d_value in partition])
+    # the error of the empty branch is infinite
+    expected = [error(d_value) for d_value in partition[:-1]] + [np.inf]
+    np.testing.assert_allclose(errors, expected)
+    assert error.average_split(partition) == TargetError.average_split(error, partition)
+    # statistics give the predictions along with the errors
+    assert predictions is not None
+    for prediction, d_value in zip(predictions, partition):
+        if d_value.n > 0:
+            np.testing.assert_allclose(prediction, error.prediction(d_value))
+
+
+class AbsoluteError(RegressionError):
+    # a target error without additive statistics
+    def __call__(self, d):
+        return np.abs(d.y - d.y.mean(axis=0)).mean()
+
+
+def test_missing_values_require_statistics():
+    assert not isinstance(AbsoluteError(), StatisticsError)
+    assert isinstance(DeviationError(), StatisticsError)
+    x, _ = make_data(200, missing=0.3)
+    d = PandasDataset(x, np.random.default_rng(0).normal(size=(200, 1)))
+    column_error = NominalColumnError(AbsoluteError())
+    assert column_error.missing_values(d.subset(~d.missing_mask("a")), "a") is None
+    with pytest.raises(ValueError, match="StatisticsError"):
+        column_error.missing_values(d, "a")
+    # the statistics of the mixin are abstract
+    with pytest.raises(TypeError):
+        type("Incomplete", (StatisticsError, AbsoluteError), {})()
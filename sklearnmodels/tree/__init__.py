@@ -7,9 +7,14 @@ from ..backend.conditions import (
 )
 
 from .tree import Tree
+from .compiled import CompiledTree
+from .packed import PackedTrees
 
 from .trainer import (
     BaseTreeTrainer,
+    BestFirstTreeTrainer,
+    EncodedDataset,
+    LevelTreeTrainer,
     TreeTrainer,
 )
 
@@ -18,4 +23,13 @@ from .trainer import (
     TreeCreationCallbackResult,
 )
 
-from .export import export_dot, export_dot_file, export_image, display
+# graphviz based exports are loaded on first use
+_exports = ["export_dot", "export_dot_file", "export_image", "display"]
+
+
+def __getattr__(name):
+    if name in _exports:
+        from . import export
+
+        return getattr(export, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
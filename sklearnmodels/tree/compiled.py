@@ -0,0 +1,291 @@
+import numpy as np
+import pandas as pd
+
+from sklearnmodels.backend.core import Dataset, Model
+from sklearnmodels.backend.serialization import Arrays, ConditionEncoder, ConditionKind
+
+from .tree import Tree
+
+
+def lookup_arrays(arrays: Arrays, encoder: ConditionEncoder) -> tuple[Arrays, int]:
+    """
+    Arrays used by CompiledTree to find the child of a node for each row without
+    iterating over the branches of the node. Numeric nodes have (at most) a `<=` and
+    a `>` edge with the same threshold; nominal nodes have value edges on a single
+    column, found by binary search on `node * n_codes + code`. Rows with missing
+    values follow the (single) edge of the node marked as default for them.
+    """
+    n_nodes = len(arrays["error"])
+    edge_start = np.asarray(arrays["edge_start"])
+    edge_node = np.repeat(np.arange(n_nodes), np.diff(edge_start))
+    kind = np.asarray(arrays["edge_kind"])
+    column = np.asarray(arrays["edge_column"])
+    threshold = np.asarray(arrays["edge_threshold"])
+    code = np.asarray(arrays["edge_code"])
+    missing = np.flatnonzero(arrays["edge_missing"])
+
+    range_edges = {}
+    for k, name in [
+        (ConditionKind.Less, "less_edge"),
+        (ConditionKind.Greater, "greater_edge"),
+    ]:
+        edges = np.flatnonzero(kind == k)
+        if len(np.unique(edge_node[edges])) != len(edges):
+            raise ValueError(f"Nodes can have a single {k.name} condition")
+        range_edges[name] = np.full(n_nodes, -1, dtype=np.int64)
+        range_edges[name][edge_node[edges]] = edges
+    less, greater = range_edges["less_edge"], range_edges["greater_edge"]
+    both = (less >= 0) & (greater >= 0)
+    if np.any(column[less[both]] != column[greater[both]]) or np.any(
+        threshold[less[both]] != threshold[greater[both]]
+    ):
+        raise ValueError("Range conditions of a node must use the same threshold")
+
+    value = np.flatnonzero(kind == ConditionKind.Value)
+    value_column = np.full(n_nodes, -1, dtype=np.int32)
+    value_column[edge_node[value]] = column[value]
+    if np.any(value_column[edge_node[value]] != column[value]):
+        raise ValueError("Value conditions of a node must use the same column")
+    if np.any((value_column >= 0) & ((less >= 0) | (greater >= 0))):
+        raise ValueError("Nodes can't mix Value and Range conditions")
+    if len(np.unique(edge_node[missing])) != len(missing):
+        raise ValueError("Nodes can have a single default branch for missing values")
+    missing_edge = np.full(n_nodes, -1, dtype=np.int64)
+    missing_edge[edge_node[missing]] = missing
+
+    n_codes = max([len(c) for c in encoder.categories], default=0) + 1
+    keys = edge_node[value] * n_codes + code[value]
+    order = np.argsort(keys)
+    result = {
+        **range_edges,
+        "missing_edge": missing_edge,
+        "value_column": value_column,
+        "value_key": keys[order],
+        "value_edge": value[order].astype(np.int64),
+    }
+    return result, n_codes
+
+
+# code of missing values; unknown values have code -1
+missing_code = -2
+
+
+def category_codes(values: pd.Series, categories: list) -> np.ndarray:
+    # codes of values in the fitted categories
+    index = pd.Index(categories)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # map the categories of the column once, then gather by code;
+        # missing values have code -1, which selects the trailing missing_code
+        mapping = np.append(index.get_indexer(values.cat.categories), missing_code)
+        return mapping[values.cat.codes.to_numpy()]
+    codes = index.get_indexer(values)
+    codes[values.isna().to_numpy()] = missing_code
+    return codes
+
+
+def numeric_values(values: pd.Series) -> np.ndarray:
+    # float32 columns are compared with the thresholds without upcasting them
+    dtype = np.float32 if values.dtype == np.float32 else np.float64
+    return values.to_numpy(dtype=dtype, na_value=np.nan)
+
+
+class CompiledTree(Model):
+    """
+    Array-backed form of a `Tree`, created with `Tree.compile()`.
+
+    Prediction runs directly on the arrays, advancing all rows one level per
+    iteration, so that no `Tree` or `Condition` objects are needed. When loaded with
+    `backend.serialization.load(path, mmap_mode="r")` the arrays are memory mapped,
+    so processes serving the same model share a single copy of it.
+    """
+
+    def __init__(self, arrays: Arrays, encoder: ConditionEncoder, n_codes: int):
+        self.arrays = arrays
+        self.encoder = encoder
+        self.n_codes = n_codes
+
+    @classmethod
+    def from_tree(cls, tree: Tree):
+        arrays, metadata = tree.to_arrays()
+        encoder = ConditionEncoder.from_metadata(metadata)
+        lookup, n_codes = lookup_arrays(arrays, encoder)
+        return cls({**arrays, **lookup}, encoder, n_codes)
+
+    def to_tree(self) -> Tree:
+        return Tree.from_arrays(self.arrays, self.encoder.metadata())
+
+    def to_arrays(self):
+        return self.arrays, {**self.encoder.metadata(), "n_codes": self.n_codes}
+
+    @classmethod
+    def from_arrays(cls, arrays, metadata):
+        encoder = ConditionEncoder.from_metadata(metadata)
+        return cls(arrays, encoder, metadata["n_codes"])
+
+    def output_size(self):
+        return self.arrays["prediction"].shape[1]
+
+    def n_nodes(self):
+        return len(self.arrays["error"])
+
+    def n_leafs(self):
+        return int(np.sum(np.diff(self.arrays["edge_start"]) == 0))
+
+    def complexity(self):
+        return self.n_leafs()
+
+    def pretty_print(self, height=0, max_height=np.inf, class_names=None):
+        return self.to_tree().pretty_print(height, max_height, class_names)
+
+    def __repr__(self):
+        return f"CompiledTree(nodes={self.n_nodes()})"
+
+    def predict_sample(self, x: pd.Series):
+        return self.predict(pd.DataFrame([x]))[0, :]
+
+    def predict_dataset(self, d: Dataset, index: np.ndarray, predictions: np.ndarray):
+        x = encode_input(self.arrays, self.encoder, d)
+        node = np.zeros(d.n, dtype=np.int64)
+        tables = node_tables(self.arrays, x)
+        leaf = traverse(self.arrays, tables, self.n_codes, x, np.arange(d.n), node)
+        predictions[index, :] = self.arrays["prediction"][leaf]
+
+
+type EncodedInput = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def encode_columns(
+    arrays: Arrays, encoder: ConditionEncoder, d: Dataset, kinds: list[ConditionKind]
+):
+    # matrix with the values of the columns used by edges of the given kinds
+    # numeric values as floats, nominal values as codes
+    edge_kind = np.asarray(arrays["edge_kind"])
+    used = np.unique(arrays["edge_column"][np.isin(edge_kind, kinds)])
+    index = np.full(len(encoder.columns), -1, dtype=np.int64)
+    index[used] = np.arange(len(used))
+    x = d.x
+    if ConditionKind.Value in kinds:
+        values = [
+            category_codes(x[encoder.columns[c]], encoder.categories[c]) for c in used
+        ]
+        dtype = np.int64
+    else:
+        values = [numeric_values(x[encoder.columns[c]]) for c in used]
+        dtype = np.float64
+    if len(values) == 0:
+        return np.zeros((d.n, 0), dtype=dtype), index
+    return np.column_stack(values), index
+
+
+def encode_input(arrays: Arrays, encoder: ConditionEncoder, d: Dataset) -> EncodedInput:
+    # numeric values and nominal codes of the columns used by the edges, with
+    # the position of each column in them
+    x_numeric, numeric_index = encode_columns(
+        arrays, encoder, d, [ConditionKind.Less, ConditionKind.Greater]
+    )
+    x_codes, nominal_index = encode_columns(arrays, encoder, d, [ConditionKind.Value])
+    return x_numeric, numeric_index, x_codes, nominal_index
+
+
+def node_tables(arrays: Arrays, x: EncodedInput) -> dict[str, np.ndarray]:
+    # per node: children taken by numeric conditions and missing values, and the
+    # threshold and position in the encoded input of the numeric column
+    a = arrays
+    _, numeric_index, _, nominal_index = x
+    # edge -1 has child -1
+    edge_child = np.append(a["edge_child"], -1)
+    less, greater = a["less_edge"], a["greater_edge"]
+    edge = np.where(less >= 0, less, greater)
+    numeric = edge >= 0
+    numeric_column = np.full(len(edge), -1, dtype=np.int64)
+    numeric_column[numeric] = numeric_index[a["edge_column"][edge[numeric]]]
+    threshold = np.full(len(edge), np.nan)
+    threshold[numeric] = a["edge_threshold"][edge[numeric]]
+    value_column = np.asarray(a["value_column"])
+    nominal = value_column >= 0
+    nominal_column = np.full(len(edge), -1, dtype=np.int64)
+    nominal_column[nominal] = nominal_index[value_column[nominal]]
+    return {
+        "less_child": edge_child[less],
+        "greater_child": edge_child[greater],
+        "missing_child": edge_child[a["missing_edge"]],
+        "numeric_column": numeric_column,
+        "threshold": threshold,
+        "nominal_column": nominal_column,
+        "value_child": edge_child[a["value_edge"]],
+    }
+
+
+def traverse(
+    arrays: Arrays,
+    tables: dict[str, np.ndarray],
+    n_codes: int,
+    x: EncodedInput,
+    row: np.ndarray,
+    node: np.ndarray,
+) -> np.ndarray:
+    """
+    Node where each (row, start node) pair stops, advancing all pairs one level
+    per iteration, with the `node_tables` of the arrays. Rows stop at a leaf, or at
+    the last node with a matching edge.
+    """
+    t = tables
+    x_numeric, _, x_codes, _ = x
+    # flat, column major inputs, indexed by column * n + row
+    n = len(x_numeric)
+    x_numeric = x_numeric.ravel(order="F")
+    x_codes = x_codes.ravel(order="F")
+    value_key = arrays["value_key"]
+    node = node.copy()
+    pairs = np.arange(len(node))
+    while len(pairs) > 0:
+        current = node[pairs]
+        rows = row[pairs]
+
+        # numeric nodes
+        column = t["numeric_column"][current]
+        r = np.flatnonzero(column >= 0)
+        if len(r) == len(current):
+            # all nodes are numeric, avoid selecting them
+            values = x_numeric[column * n + rows]
+            child = np.where(
+                values <= t["threshold"][current],
+                t["less_child"][current],
+                t["greater_child"][current],
+            )
+            missing = np.isnan(values)
+            child[missing] = t["missing_child"][current[missing]]
+        else:
+            child = np.full(len(pairs), -1, dtype=np.int64)
+            if len(r) > 0:
+                c = current[r]
+                values = x_numeric[column[r] * n + rows[r]]
+                taken = np.where(
+                    values <= t["threshold"][c],
+                    t["less_child"][c],
+                    t["greater_child"][c],
+                )
+                missing = np.isnan(values)
+                taken[missing] = t["missing_child"][c[missing]]
+                child[r] = taken
+
+            # nominal nodes
+            column = t["nominal_column"][current]
+            r = np.flatnonzero(column >= 0)
+            if len(r) > 0 and len(value_key) > 0:
+                c = current[r]
+                code = x_codes[column[r] * n + rows[r]]
+                key = c * n_codes + code
+                position = np.searchsorted(value_key, key)
+                position = np.minimum(position, len(value_key) - 1)
+                found = (value_key[position] == key) & (code >= 0)
+                taken = np.where(found, t["value_child"][position], -1)
+                missing = code == missing_code
+                taken[missing] = t["missing_child"][c[missing]]
+                child[r] = taken
+
+        # pairs without a matching branch stop at their current node
+        done = child < 0
+        node[pairs[~done]] = child[~done]
+        pairs = pairs[~done]
+    return node
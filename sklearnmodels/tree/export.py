@@ -1,7 +1,5 @@
 from pathlib import Path
 
-import pygraphviz
-
 from . import Condition, Tree
 
 
@@ -125,6 +123,8 @@ def html_escape(s: str) -> str:
 def export_image(
     tree: Tree, filepath: Path, title="", class_names: list[str] = None, prog="dot"
 ):
+    import pygraphviz
+
     if class_names is None:
         class_names = [f"Class '{i}'" for i in range(len(tree.prediction))]
 
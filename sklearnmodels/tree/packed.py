@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+
+from sklearnmodels.backend.core import Dataset, Model
+from sklearnmodels.backend.serialization import Arrays, ConditionEncoder, ConditionKind
+
+from .compiled import (
+    CompiledTree,
+    encode_input,
+    lookup_arrays,
+    node_tables,
+    traverse,
+)
+from .tree import Tree
+
+# arrays of the nodes and edges of a tree, concatenated by pack
+node_arrays = ["prediction", "error", "samples", "column"]
+edge_arrays = [
+    "edge_child",
+    "edge_kind",
+    "edge_column",
+    "edge_threshold",
+    "edge_code",
+    "edge_missing",
+]
+
+
+def pack(trees: list[CompiledTree]) -> tuple[Arrays, ConditionEncoder]:
+    # arrays of all trees, with node and edge indices offset by the previous
+    # trees, and columns and categories recoded with a common encoder
+    encoder = ConditionEncoder()
+    nodes, edges, roots, edge_start = [], [], [], []
+    n_nodes = n_edges = 0
+    for t in trees:
+        a = t.arrays
+        # common index of each column of the tree; leaves have column -1
+        columns = [encoder.column(c) for c in t.encoder.columns] + [-1]
+        columns = np.array(columns, dtype=np.int32)
+        edge_column = columns[a["edge_column"]]
+        edge_code = np.array(a["edge_code"])
+        for e in np.flatnonzero(np.asarray(a["edge_kind"]) == ConditionKind.Value):
+            value = t.encoder.categories[a["edge_column"][e]][edge_code[e]]
+            edge_code[e] = encoder.code(edge_column[e], value)
+        nodes.append({**{k: a[k] for k in node_arrays}, "column": columns[a["column"]]})
+        edges.append(
+            {
+                **{k: a[k] for k in edge_arrays},
+                "edge_child": a["edge_child"] + n_nodes,
+                "edge_column": edge_column,
+                "edge_code": edge_code,
+            }
+        )
+        roots.append(n_nodes)
+        edge_start.append(a["edge_start"][:-1] + n_edges)
+        n_nodes += t.n_nodes()
+        n_edges += len(a["edge_child"])
+    arrays = {k: np.concatenate([a[k] for a in nodes]) for k in node_arrays}
+    arrays |= {k: np.concatenate([a[k] for a in edges]) for k in edge_arrays}
+    arrays["edge_start"] = np.concatenate(edge_start + [[n_edges]]).astype(np.int64)
+    arrays["root"] = np.array(roots + [n_nodes], dtype=np.int64)
+    return arrays, encoder
+
+
+class PackedTrees(Model):
+    """
+    Many compiled trees in a single set of node and edge arrays, created with
+    `PackedTrees.from_trees`. Prediction encodes the input once for all trees,
+    and advances every (row, tree) pair of a batch of rows together, adding the
+    predictions of the leaves into the output. Memory grows with the number of
+    pairs of a batch, which is limited to `batch_size`, and not with the number
+    of rows times the number of trees. The prediction is the sum of the
+    predictions of the trees.
+    """
+
+    def __init__(
+        self,
+        arrays: Arrays,
+        encoder: ConditionEncoder,
+        n_codes: int,
+        batch_size: int = 2**16,
+    ):
+        self.arrays = arrays
+        self.encoder = encoder
+        self.n_codes = n_codes
+        self.batch_size = batch_size
+
+    @classmethod
+    def from_trees(cls, trees: list[Tree | CompiledTree], batch_size: int = 2**16):
+        assert len(trees) > 0
+        trees = [t.compile() if isinstance(t, Tree) else t for t in trees]
+        arrays, encoder = pack(trees)
+        lookup, n_codes = lookup_arrays(arrays, encoder)
+        return cls({**arrays, **lookup}, encoder, n_codes, batch_size)
+
+    def n_trees(self):
+        return len(self.arrays["root"]) - 1
+
+    def tree(self, i: int) -> CompiledTree:
+        # i-th tree, as a CompiledTree with the common encoder
+        a = self.arrays
+        start, end = a["root"][i], a["root"][i + 1]
+        edge_start, edge_end = a["edge_start"][start], a["edge_start"][end]
+        arrays = {k: a[k][start:end] for k in node_arrays}
+        arrays |= {k: a[k][edge_start:edge_end] for k in edge_arrays}
+        arrays["edge_child"] = arrays["edge_child"] - start
+        arrays["edge_start"] = a["edge_start"][start : end + 1] - edge_start
+        lookup, n_codes = lookup_arrays(arrays, self.encoder)
+        return CompiledTree({**arrays, **lookup}, self.encoder, n_codes)
+
+    def trees(self) -> list[CompiledTree]:
+        return [self.tree(i) for i in range(self.n_trees())]
+
+    def output_size(self):
+        return self.arrays["prediction"].shape[1]
+
+    def n_nodes(self):
+        return len(self.arrays["error"])
+
+    def complexity(self):
+        return int(np.sum(np.diff(self.arrays["edge_start"]) == 0))
+
+    def __repr__(self):
+        return f"PackedTrees(trees={self.n_trees()},nodes={self.n_nodes()})"
+
+    def pretty_print(self, class_names=None):
+        trees = [
+            f"tree {i}\n{t.pretty_print(class_names=class_names)}"
+            for i, t in enumerate(self.trees())
+        ]
+        return "\n".join(trees)
+
+    def predict_sample(self, x: pd.Series):
+        return self.predict(pd.DataFrame([x]))[0, :]
+
+    def predict_dataset(self, d: Dataset, index: np.ndarray, predictions: np.ndarray):
+        x = encode_input(self.arrays, self.encoder, d)
+        tables = node_tables(self.arrays, x)
+        roots = self.arrays["root"][:-1]
+        prediction = self.arrays["prediction"]
+        # blocks of rows and trees with at most batch_size pairs; with many rows,
+        # blocks have few trees, whose nodes stay in cache
+        n_rows = max(min(d.n, self.batch_size), 1)
+        n_trees = max(self.batch_size // n_rows, 1)
+        total = np.zeros((n_rows, self.output_size()))
+        for start in range(0, d.n, n_rows):
+            rows = np.arange(start, min(start + n_rows, d.n))
+            total[:] = 0
+            for tree_start in range(0, len(roots), n_trees):
+                block = roots[tree_start : tree_start + n_trees]
+                # pairs of each tree with each row, ordered by tree
+                row = np.tile(rows, len(block))
+                node = np.repeat(block, len(rows))
+                leaf = traverse(self.arrays, tables, self.n_codes, x, row, node)
+                leaves = prediction[leaf].reshape(len(block), len(rows), -1)
+                total[: len(rows)] += leaves.sum(axis=0, dtype=np.float64)
+            predictions[index[rows], :] = total[: len(rows)]
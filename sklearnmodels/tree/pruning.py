@@ -40,15 +40,18 @@ class PruneCriteria:
         return f"Prune({params_str})"
 
     def pre_split_prune(self, x: pd.DataFrame, y: np.ndarray, height: int, tree: Tree):
+        return self.prune_node(len(y), len(x.columns), height, tree)
+
+    def prune_node(self, n: int, columns: int, height: int, tree: Tree):
         # BASE CASE: max_height reached
         if self.max_height is not None and height == self.max_height:
             return True
         # BASE CASE: not enough samples to split
-        if len(y) < self.min_samples_split:
+        if n < self.min_samples_split:
             return True
 
         # BASE CASE: no more columns to split
-        if len(x.columns) == 0:
+        if columns == 0:
             return True
 
         # BASE CASE: the achieved error is within tolerance
@@ -1,15 +1,21 @@
 import abc
+import heapq
+import itertools
 from typing import Callable
 
 import numpy as np
 import pandas as pd
 
-from sklearnmodels.backend.core import Dataset
+from sklearnmodels.backend.budget import Budget
+from sklearnmodels.backend.conditions import RangeCondition, ValueCondition
+from sklearnmodels.backend.core import ColumnType, Dataset
+from sklearnmodels.backend.profiling import Profiled, dataset_rows
 from sklearnmodels.tree.pruning import PruneCriteria
 
-from ..shared.column_error import ColumnErrorResult
-from ..shared.global_error import Splitter
-from .tree import Condition, Tree
+from ..shared.column_error import ColumnErrorResult, RandomNumericColumnError
+from ..shared.global_error import DefaultSplitter, Splitter
+from ..shared.target_error import StatisticsError
+from .tree import Condition, Tree, no_branches
 
 from dataclasses import dataclass
 
@@ -28,11 +34,18 @@ class TreeTask:
         condition: Condition,
         d: Dataset,
         height: int,
+        n: int | None = None,
+        error: float | None = None,
+        prediction: np.ndarray | None = None,
     ):
         self.parent = parent
         self.condition = condition
         self.d = d
         self.height = height
+        # samples, error and prediction of the node, if known from its split
+        self.n = n
+        self.error = error
+        self.prediction = prediction
 
 
 type TreeCreationCallback = Callable[[TreeCreationCallbackResult], None]
@@ -53,46 +66,127 @@ class BaseTreeTrainer(TreeTrainer):
         error: Splitter,
         prune: PruneCriteria,
         tree_creation_callback: TreeCreationCallback | None = None,
+        dtype=None,
+        budget: Budget | None = None,
     ):
         self.prune = prune
         self.tree_creation_callback = tree_creation_callback
         self.splitter = error
+        # dtype of the predictions of the nodes, None to keep the splitter's
+        self.dtype = dtype
+        # nodes are not split once the budget runs out
+        self.budget = budget
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.splitter},{self.prune})"
 
     def fit(self, d: Dataset) -> Tree:
+        if self.budget is not None:
+            self.budget.start()
         return self.build(d, 1)
 
+    def profiled(self) -> list[Profiled]:
+        # methods timed as phases of the fit, see backend.profiling
+        phases = [
+            Profiled(self, "new_node", "nodes", lambda prediction, error, n: n),
+            Profiled(self.splitter, "global_error", "error", dataset_rows),
+            Profiled(self.splitter, "split_columns", "split_search", dataset_rows),
+            Profiled(self, "split", "partitioning", lambda tree, task, best: task.d.n),
+            Profiled(self.prune, "pre_split_prune", "pruning"),
+            Profiled(self.prune, "post_split_prune", "pruning"),
+        ]
+        column_splitters = getattr(self.splitter, "column_splitters", {})
+        for column_type, column_splitter in column_splitters.items():
+            phase = f"split_search.{column_type.name.lower()}"
+            phases.append(Profiled(column_splitter, "error", phase, dataset_rows))
+            phases.append(Profiled(column_splitter.metric, "split_errors", "error"))
+        return phases
+
     def do_creation_callback(self, r: TreeCreationCallbackResult):
         if self.tree_creation_callback is not None:
             self.tree_creation_callback(r)
 
+    def make_node(self, d: Dataset) -> Tree:
+        global_score = self.splitter.global_error(d)
+        return self.new_node(global_score.prediction, global_score.error, d.n)
+
+    def new_node(self, prediction: np.ndarray, error: float, n: int) -> Tree:
+        if self.dtype is not None:
+            prediction = prediction.astype(self.dtype)
+        return Tree(prediction, error, n)
+
     def build(self, d: Dataset, height: int) -> Tree:
         # ROOT
-        global_score = self.splitter.global_error(d)
-        root = Tree(global_score.prediction, global_score.error, d.n)
+        root = self.make_node(d)
         root_task = TreeTask(None, None, d, height)
         subtrees = self.make_tree(root, root_task)
 
         # OTHER NODES
         while len(subtrees) > 0:
             task = subtrees.pop()
-            global_score = self.splitter.global_error(task.d)
-            new_tree = Tree(global_score.prediction, global_score.error, task.d.n)
-            task.parent.branches[task.condition] = new_tree
+            new_tree = self.make_child(task)
             subtree_tasks = self.make_tree(new_tree, task)
-            # bfs
-            subtree_tasks.reverse()
-            subtrees = subtrees + subtree_tasks
+            # depth first, in the order of the branches
+            subtrees.extend(reversed(subtree_tasks))
         return root
 
+    def make_child(self, task: TreeTask) -> Tree:
+        if task.error is None:
+            tree = self.make_node(task.d)
+        else:
+            prediction = task.prediction
+            if prediction is None:
+                prediction = self.splitter.prediction(task.d)
+            tree = self.new_node(prediction, task.error, task.n)
+        task.parent.branches[task.condition] = tree
+        return tree
+
     def make_tree(self, tree: Tree, task: TreeTask) -> list[TreeTask]:
+        if self.out_of_budget(tree, task):
+            return []
+        best_column = self.evaluate(tree, task)
+        if best_column is None:
+            return []
+        subtasks = self.split(tree, task, best_column)
+        if not self.within_budget(tree, task, subtasks, best_column):
+            return []
+        return subtasks
+
+    def out_of_budget(self, tree: Tree, task: TreeTask) -> bool:
+        # whether the budget ran out before evaluating the node, which is then
+        # kept as a leaf
+        if self.budget is None or self.budget.available():
+            return False
+        self.budget.leave_open()
+        self.do_creation_callback(TreeCreationCallbackResult(tree, task, True))
+        return True
+
+    def within_budget(
+        self,
+        tree: Tree,
+        task: TreeTask,
+        subtasks: list[TreeTask],
+        best_column: ColumnErrorResult,
+    ) -> bool:
+        # whether the budget allows splitting tree into subtasks; if not, the
+        # tree is kept as a leaf. The callback gets the node in either case
+        if self.budget is None or self.budget.spend(len(subtasks)):
+            r = TreeCreationCallbackResult(tree, task, False, best_column)
+            self.do_creation_callback(r)
+            return True
+        tree.column = None
+        tree.branches = no_branches
+        self.budget.leave_open()
+        self.do_creation_callback(TreeCreationCallbackResult(tree, task, True))
+        return False
+
+    def evaluate(self, tree: Tree, task: TreeTask) -> ColumnErrorResult | None:
+        # best split of the node, or None if it must be a leaf
         # BASE CASE: pre_split_prune
         if self.prune.pre_split_prune(task.d.x, task.d.y, task.height, tree):
             r = TreeCreationCallbackResult(tree, task, True)
             self.do_creation_callback(r)
-            return []
+            return None
 
         # COMPUTE SPLITS
         best_column = self.splitter.split_columns(task.d)
@@ -101,32 +195,583 @@ class BaseTreeTrainer(TreeTrainer):
         if best_column is None:
             r = TreeCreationCallbackResult(tree, task)
             self.do_creation_callback(r)
-            return []
+            return None
 
         # BASE CASE: best gain is not enough to split tree
         if self.prune.post_split_prune(tree, best_column):
             r = TreeCreationCallbackResult(tree, task, True, best_column)
             self.do_creation_callback(r)
-            return []
+            return None
 
-        r = TreeCreationCallbackResult(tree, task, False, best_column)
-        self.do_creation_callback(r)
+        # the callback gets the split once the budget allows it, see within_budget
+        return best_column
 
+    def split(
+        self, tree: Tree, task: TreeTask, best_column: ColumnErrorResult
+    ) -> list[TreeTask]:
         # RECURSIVE CASE: use best column to split
         tree.column = best_column.column
+        tree.branches = {}
         subtrees = []
 
         for i, (d_branch, condition) in enumerate(
             zip(best_column.partition, best_column.conditions)
         ):
+            n = d_branch.n if best_column.counts is None else int(best_column.counts[i])
             # avoid branches with low samples
-            if d_branch.n < self.prune.min_samples_leaf:
+            if n < self.prune.min_samples_leaf:
                 continue
             # remove column from consideration
             if best_column.remove:
                 d_branch = d_branch.drop(columns=[best_column.column])
-            # create tree task
-            subtask = TreeTask(tree, condition, d_branch, task.height + 1)
+            # create tree task, reusing the statistics of the branch
+            subtask = TreeTask(tree, condition, d_branch, task.height + 1, n)
+            if best_column.errors is not None:
+                subtask.error = float(best_column.errors[i])
+            if best_column.predictions is not None:
+                subtask.prediction = best_column.predictions[i]
             subtrees.append(subtask)
 
         return subtrees
+
+
+class BestFirstTreeTrainer(BaseTreeTrainer):
+    """
+    Grows the tree by always splitting the leaf with the largest decrease of
+    the error (weighted by its number of samples), until the tree has
+    `max_leaf_nodes` leaves or no leaf can be split. The best split of each leaf
+    is computed once, when the leaf is created, and kept in a heap.
+    """
+
+    def __init__(
+        self,
+        error: Splitter,
+        prune: PruneCriteria,
+        max_leaf_nodes: int,
+        tree_creation_callback: TreeCreationCallback | None = None,
+        dtype=None,
+        budget: Budget | None = None,
+    ):
+        super().__init__(error, prune, tree_creation_callback, dtype, budget)
+        assert max_leaf_nodes > 1
+        self.max_leaf_nodes = max_leaf_nodes
+
+    def __repr__(self):
+        return f"{super().__repr__()[:-1]},max_leaf_nodes={self.max_leaf_nodes})"
+
+    def build(self, d: Dataset, height: int) -> Tree:
+        root = self.make_node(d)
+        # (-weighted error decrease, creation order, node, task, best split)
+        heap = []
+        order = itertools.count()
+        self.push(heap, order, root, TreeTask(None, None, d, height))
+        leaves = 1
+        while len(heap) > 0 and leaves < self.max_leaf_nodes:
+            _, _, tree, task, best_column = heapq.heappop(heap)
+            subtasks = self.split(tree, task, best_column)
+            if leaves - 1 + len(subtasks) > self.max_leaf_nodes:
+                # too many branches, keep the node as a leaf
+                tree.column = None
+                tree.branches = no_branches
+                self.do_creation_callback(TreeCreationCallbackResult(tree, task, True))
+                continue
+            if not self.within_budget(tree, task, subtasks, best_column):
+                # the remaining leaves have the smallest error decreases
+                self.budget.leave_open(len(heap))
+                break
+            leaves += max(len(subtasks), 1) - 1
+            for subtask in subtasks:
+                self.push(heap, order, self.make_child(subtask), subtask)
+        # the nodes that were not split are kept as leaves
+        for _, _, tree, task, _ in heap:
+            self.do_creation_callback(TreeCreationCallbackResult(tree, task, True))
+        return root
+
+    def push(self, heap: list, order: itertools.count, tree: Tree, task: TreeTask):
+        if self.out_of_budget(tree, task):
+            return
+        best_column = self.evaluate(tree, task)
+        if best_column is not None:
+            decrease = (tree.error - best_column.error) * tree.samples
+            entry = (-decrease, next(order), tree, task, best_column)
+            heapq.heappush(heap, entry)
+
+
+def group_argmin(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    # index of the first minimum of values in each group, -1 for empty groups
+    order = np.lexsort((values, groups))
+    present, first = np.unique(groups[order], return_index=True)
+    result = np.full(n_groups, -1, dtype=np.int64)
+    result[present] = order[first]
+    return result
+
+
+def segments(groups: np.ndarray, n_groups: int) -> tuple[np.ndarray, np.ndarray]:
+    # start and end of each group in a sorted array of groups
+    index = np.arange(n_groups)
+    return np.searchsorted(groups, index), np.searchsorted(groups, index, "right")
+
+
+class EncodedDataset:
+    """
+    Columns of a `Dataset` encoded once for `LevelTreeTrainer`: the code of the
+    value of each row in each column (with sorted values for numeric columns) and
+    the target. Trees can be grown from any array of its rows, with repetitions,
+    so that the members of an ensemble share a single encoding.
+    """
+
+    def __init__(self, d: Dataset):
+        self.columns = list(d.columns)
+        self.types = d.types
+        self.encoded = [
+            d.codes(c, sorted=t == ColumnType.Numeric)
+            for c, t in zip(self.columns, self.types)
+        ]
+        self.y = d.y
+        self.n = d.n
+
+
+class LevelTask(TreeTask):
+    # rows of the training dataset that reach a node, and columns that can be used
+    # to split it; the dataset of the node is only built on demand, if available
+    def __init__(
+        self,
+        parent: Tree,
+        condition: Condition,
+        dataset: Dataset,
+        rows: np.ndarray,
+        columns: np.ndarray,
+        height: int,
+    ):
+        self.parent = parent
+        self.condition = condition
+        self.dataset = dataset
+        self.rows = rows
+        self.columns = columns
+        self.height = height
+
+    @property
+    def d(self) -> Dataset:
+        if self.dataset is None:
+            raise ValueError("The dataset of the node is not available")
+        # repeated rows are included once
+        mask = np.zeros(self.dataset.n, dtype=bool)
+        mask[self.rows] = True
+        return self.dataset.subset(mask)
+
+
+class NumericLevelSplit:
+    remove = False
+
+    def __init__(
+        self,
+        column: str,
+        error: np.ndarray,
+        threshold: np.ndarray,
+        value: np.ndarray,
+        missing_less: np.ndarray,
+        missing: np.ndarray,
+    ):
+        self.column = column
+        self.error = error
+        # code of the largest value <= the threshold, and the threshold
+        self.threshold = threshold
+        self.value = value
+        self.missing_less = missing_less
+        self.missing = missing
+
+    def conditions(self, i: int):
+        missing_less = bool(self.missing_less[i]) if self.missing[i] else None
+        return RangeCondition.make(self.column, self.value[i], missing_less)
+
+    def branches(self, i: int, codes: np.ndarray):
+        branch = (codes > self.threshold[i]).astype(np.int64)
+        branch[codes < 0] = 0 if self.missing_less[i] else 1
+        return branch
+
+
+class NominalLevelSplit:
+    remove = True
+
+    def __init__(
+        self,
+        column: str,
+        values: np.ndarray,
+        error: np.ndarray,
+        codes: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        default: np.ndarray,
+    ):
+        self.column = column
+        self.values = values
+        self.error = error
+        self.codes = codes
+        self.starts = starts
+        self.ends = ends
+        self.default = default
+
+    def conditions(self, i: int):
+        conditions = [
+            ValueCondition(self.column, self.values[c]).intern()
+            for c in self.codes[self.starts[i] : self.ends[i]]
+        ]
+        if self.default[i] >= 0:
+            default = self.default[i] - self.starts[i]
+            conditions[default] = conditions[default].with_missing()
+        return conditions
+
+    def branches(self, i: int, codes: np.ndarray):
+        branch = np.searchsorted(self.codes[self.starts[i] : self.ends[i]], codes)
+        branch[codes < 0] = self.default[i] - self.starts[i]
+        return branch
+
+
+type LevelSplit = NumericLevelSplit | NominalLevelSplit
+
+
+class LevelTreeTrainer(BaseTreeTrainer):
+    """
+    Grows the tree one level at a time, evaluating the splits of all the nodes of a
+    level together. For each column, the statistics of the target (eg, class
+    counts) of every (node, value) pair are computed with a single grouped
+    bincount over the rows of the level, and the errors of all the candidate
+    splits are derived from them; numeric thresholds use cumulative statistics
+    over the sorted values of each node.
+
+    Requires a `DefaultSplitter` whose target error is a `StatisticsError`, such
+    as `EntropyError`, `GiniError` or `DeviationError`. Splits are chosen
+    with the same criteria as `BaseTreeTrainer`, but ties between thresholds or
+    columns may be broken differently.
+    """
+
+    def __init__(
+        self,
+        error: DefaultSplitter,
+        prune: PruneCriteria,
+        tree_creation_callback: TreeCreationCallback | None = None,
+        dtype=None,
+        budget: Budget | None = None,
+    ):
+        super().__init__(error, prune, tree_creation_callback, dtype, budget)
+        if not isinstance(error.target_error, StatisticsError):
+            raise ValueError(
+                "Level-wise growth requires a target error with grouped statistics"
+                f" (a StatisticsError), but got {error.target_error}"
+            )
+        self.target_error = error.target_error
+        self.column_splitters = error.column_splitters
+
+    def build(self, d: Dataset, height: int) -> Tree:
+        return self.build_rows(EncodedDataset(d), np.arange(d.n), height, d)
+
+    def profiled(self) -> list[Profiled]:
+        def code_rows(column, codes, *args):
+            return len(codes)
+
+        def level_rows(y, tasks):
+            return sum(len(t.rows) for t in tasks)
+
+        def partition_rows(data, task, *args):
+            return len(task.rows)
+
+        return [
+            Profiled(self, "new_node", "nodes", lambda prediction, error, n: n),
+            Profiled(self, "make_nodes", "error", level_rows),
+            Profiled(self, "numeric_split", "split_search.numeric", code_rows),
+            Profiled(self, "nominal_split", "split_search.nominal", code_rows),
+            Profiled(self, "partition", "partitioning", partition_rows),
+            Profiled(self.prune, "prune_node", "pruning"),
+            Profiled(self.prune, "post_split_prune", "pruning"),
+        ]
+
+    def build_rows(
+        self,
+        data: EncodedDataset,
+        rows: np.ndarray,
+        height: int,
+        d: Dataset | None = None,
+    ) -> Tree:
+        # tree of the given rows of data, which may be repeated (eg, a bootstrap)
+        available = np.ones(len(data.columns), dtype=bool)
+        tasks = [LevelTask(None, None, d, rows, available, height)]
+        root = None
+        while len(tasks) > 0:
+            trees = self.make_nodes(data.y, tasks)
+            if root is None:
+                root = trees[0]
+            tasks = self.split_level(data, tasks, trees)
+        return root
+
+    def make_nodes(self, y: np.ndarray, tasks: list[LevelTask]) -> list[Tree]:
+        # nodes of a level, from the statistics of their rows
+        e = self.target_error
+        rows = np.concatenate([t.rows for t in tasks])
+        node = np.repeat(np.arange(len(tasks)), [len(t.rows) for t in tasks])
+        statistics = e.grouped_statistics(y[rows], node, len(tasks))
+        predictions = e.statistics_prediction(statistics)
+        errors = e.statistics_error(statistics)
+        trees = []
+        for task, prediction, error in zip(tasks, predictions, errors):
+            tree = self.new_node(prediction, float(error), len(task.rows))
+            if task.parent is not None:
+                task.parent.branches[task.condition] = tree
+            trees.append(tree)
+        return trees
+
+    def split_level(
+        self, data: EncodedDataset, tasks: list[LevelTask], trees: list[Tree]
+    ) -> list[LevelTask]:
+        columns, encoded = data.columns, data.encoded
+        # BASE CASE: pre_split_prune
+        active = []
+        for task, tree in zip(tasks, trees):
+            n_columns = int(task.columns.sum())
+            if self.prune.prune_node(len(task.rows), n_columns, task.height, tree):
+                self.do_creation_callback(TreeCreationCallbackResult(tree, task, True))
+            else:
+                active.append((task, tree))
+        if len(active) == 0:
+            return []
+        if self.budget is not None and not self.budget.available():
+            for task, tree in active:
+                self.out_of_budget(tree, task)
+            return []
+
+        # COMPUTE SPLITS of all nodes, one column at a time
+        m = len(active)
+        rows = np.concatenate([t.rows for t, _ in active])
+        node = np.repeat(np.arange(m), [len(t.rows) for t, _ in active])
+        y_rows = data.y[rows]
+        # columns evaluated for each node
+        node_columns = np.stack([t.columns for t, _ in active])
+        if self.splitter.max_features is not None:
+            for i, available in enumerate(node_columns):
+                sampled = self.splitter.sample_columns(np.flatnonzero(available))
+                available[:] = False
+                available[sampled] = True
+        best_error = np.full(m, np.inf)
+        best_split = np.full(m, -1)
+        splits: list[LevelSplit] = []
+        for j, (column, column_type) in enumerate(zip(columns, data.types)):
+            uses = node_columns[node, j]
+            if not uses.any():
+                continue
+            codes, values = encoded[j]
+            args = (column, codes[rows[uses]], values, y_rows[uses], node[uses], m)
+            if column_type == ColumnType.Numeric:
+                split = self.numeric_split(*args)
+            else:
+                split = self.nominal_split(*args)
+            better = split.error < best_error
+            best_error[better] = split.error[better]
+            best_split[better] = len(splits)
+            splits.append(split)
+
+        subtasks = []
+        for i, (task, tree) in enumerate(active):
+            # BASE CASE: no splits available
+            if best_split[i] < 0:
+                self.do_creation_callback(TreeCreationCallbackResult(tree, task))
+                continue
+            split = splits[best_split[i]]
+            best_column = ColumnErrorResult(
+                split.column, best_error[i], split.conditions(i), None, split.remove
+            )
+            # BASE CASE: best gain is not enough to split tree
+            if self.prune.post_split_prune(tree, best_column):
+                r = TreeCreationCallbackResult(tree, task, True, best_column)
+                self.do_creation_callback(r)
+                continue
+            branches = self.partition(data, task, tree, split, i, best_column)
+            if self.within_budget(tree, task, branches, best_column):
+                subtasks += branches
+        return subtasks
+
+    def partition(
+        self,
+        data: EncodedDataset,
+        task: LevelTask,
+        tree: Tree,
+        split: LevelSplit,
+        i: int,
+        best_column: ColumnErrorResult,
+    ) -> list[LevelTask]:
+        # RECURSIVE CASE: use best column to split
+        tree.column = best_column.column
+        tree.branches = {}
+        j = data.columns.index(split.column)
+        branch = split.branches(i, data.encoded[j][0][task.rows])
+        columns_branch = task.columns
+        if split.remove:
+            columns_branch = columns_branch.copy()
+            columns_branch[j] = False
+        subtasks = []
+        for b, condition in enumerate(best_column.conditions):
+            rows_branch = task.rows[branch == b]
+            # avoid branches with low samples
+            if len(rows_branch) < self.prune.min_samples_leaf:
+                continue
+            subtask = LevelTask(
+                tree,
+                condition,
+                task.dataset,
+                rows_branch,
+                columns_branch,
+                task.height + 1,
+            )
+            subtasks.append(subtask)
+        return subtasks
+
+    def group_statistics(
+        self,
+        codes: np.ndarray,
+        n_values: int,
+        y: np.ndarray,
+        node: np.ndarray,
+        m: int,
+    ):
+        # statistics of each (node, value) pair present in the level, sorted by
+        # node and value, and of the rows of each node with missing values
+        e = self.target_error
+        present = codes >= 0
+        missing = e.grouped_statistics(y[~present], node[~present], m)
+        keys = node[present] * n_values + codes[present]
+        keys, groups = np.unique(keys, return_inverse=True)
+        statistics = e.grouped_statistics(y[present], groups, len(keys))
+        return keys // n_values, keys % n_values, statistics, missing
+
+    def nominal_split(
+        self,
+        column: str,
+        codes: np.ndarray,
+        values: np.ndarray,
+        y: np.ndarray,
+        node: np.ndarray,
+        m: int,
+    ) -> NominalLevelSplit:
+        e = self.target_error
+        penalization = self.column_splitters[ColumnType.Nominal].penalization
+        group_node, group_code, statistics, missing = self.group_statistics(
+            codes, len(values), y, node, m
+        )
+        starts, ends = segments(group_node, m)
+        n = e.statistics_n(statistics).astype(np.float64)
+        n_missing = e.statistics_n(missing)
+        weighted = n * e.statistics_error(statistics)
+        total = np.bincount(group_node, weights=weighted, minlength=m)
+        n_node = np.bincount(group_node, weights=n, minlength=m)
+        # total error when adding the missing rows to the branch of each value
+        with_missing = statistics + missing[group_node]
+        options = total[group_node] - weighted
+        options += e.statistics_n(with_missing) * e.statistics_error(with_missing)
+        options /= n_node[group_node] + n_missing[group_node]
+
+        error = np.full(m, np.inf)
+        has_values = ends > starts
+        error[has_values] = total[has_values] / n_node[has_values]
+        default = group_argmin(options, group_node, m)
+        has_missing = has_values & (n_missing > 0)
+        default[~has_missing] = -1
+        error[has_missing] = options[default[has_missing]]
+        n[default[has_missing]] += n_missing[has_missing]
+        for i in np.flatnonzero(has_values):
+            error[i] /= penalization.penalize_counts(n[starts[i] : ends[i]])
+        return NominalLevelSplit(
+            column, values, error, group_code, starts, ends, default
+        )
+
+    def numeric_split(
+        self,
+        column: str,
+        codes: np.ndarray,
+        values: np.ndarray,
+        y: np.ndarray,
+        node: np.ndarray,
+        m: int,
+    ) -> NumericLevelSplit:
+        e = self.target_error
+        numeric = self.column_splitters[ColumnType.Numeric]
+        group_node, group_code, statistics, missing = self.group_statistics(
+            codes, len(values), y, node, m
+        )
+        starts, ends = segments(group_node, m)
+        # statistics of the values <= each value of the node, from cumulative sums
+        cumulative = np.cumsum(statistics, axis=0)
+        cumulative = np.concatenate([np.zeros_like(cumulative[:1]), cumulative])
+        before = cumulative[starts]
+        total = cumulative[ends] - before
+
+        if isinstance(numeric, RandomNumericColumnError):
+            candidates, thresholds = self.random_candidates(
+                numeric, values, group_node, group_code, starts, ends
+            )
+        else:
+            # candidate thresholds: all values of each node but the largest
+            position = np.arange(len(group_node)) - starts[group_node]
+            count = (ends - starts)[group_node]
+            step = np.maximum(count // numeric.max_evals, 1)
+            candidates = (position < count - 1) & (position % step == 0)
+            candidates = np.flatnonzero(candidates)
+            thresholds = values[group_code[candidates]]
+        candidate_node = group_node[candidates]
+        less = cumulative[candidates + 1] - before[candidate_node]
+        greater = total[candidate_node] - less
+        missing_branch = missing[candidate_node]
+
+        n_less = e.statistics_n(less)
+        n_greater = e.statistics_n(greater)
+        n_missing = e.statistics_n(missing_branch)
+        error_less = n_less * e.statistics_error(less)
+        error_greater = n_greater * e.statistics_error(greater)
+        # total error when adding the missing rows to each branch
+        with_less = less + missing_branch
+        with_greater = greater + missing_branch
+        option_less = e.statistics_n(with_less) * e.statistics_error(with_less)
+        option_less += error_greater
+        option_greater = e.statistics_n(with_greater) * e.statistics_error(with_greater)
+        option_greater += error_less
+        missing_less = option_less <= option_greater
+        options = np.minimum(option_less, option_greater)
+        options /= n_less + n_greater + n_missing
+        counts = np.stack(
+            [n_less + n_missing * missing_less, n_greater + n_missing * ~missing_less],
+            axis=-1,
+        )
+        options /= numeric.penalization.penalize_counts(counts)
+
+        best = group_argmin(options, candidate_node, m)
+        found = best >= 0
+        error = np.full(m, np.inf)
+        error[found] = options[best[found]]
+        threshold = np.full(m, -1)
+        threshold[found] = group_code[candidates[best[found]]]
+        value = np.full(m, np.nan)
+        value[found] = thresholds[best[found]]
+        best_missing_less = np.zeros(m, dtype=bool)
+        best_missing_less[found] = missing_less[best[found]]
+        has_missing = e.statistics_n(missing) > 0
+        return NumericLevelSplit(
+            column, error, threshold, value, best_missing_less, has_missing
+        )
+
+    def random_candidates(
+        self,
+        numeric: RandomNumericColumnError,
+        values: np.ndarray,
+        group_node: np.ndarray,
+        group_code: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # thresholds drawn between the minimum and maximum values of each node,
+        # and the groups with the largest value <= each threshold
+        nodes = np.flatnonzero(ends - starts > 1)
+        low = np.repeat(values[group_code[starts[nodes]]], numeric.n_thresholds)
+        high = np.repeat(values[group_code[ends[nodes] - 1]], numeric.n_thresholds)
+        nodes = np.repeat(nodes, numeric.n_thresholds)
+        thresholds = numeric.rng.uniform(low, high)
+        codes = np.searchsorted(values, thresholds, "right") - 1
+        keys = group_node * len(values) + group_code
+        candidates = np.searchsorted(keys, nodes * len(values) + codes, "right") - 1
+        return candidates, thresholds
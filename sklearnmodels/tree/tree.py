@@ -1,9 +1,12 @@
+from types import MappingProxyType
+
 import numpy as np
 import pandas as pd
 
-from sklearnmodels.backend.core import Model
+from sklearnmodels.backend.core import Dataset, Model
 
 from ..backend.conditions import Condition
+from ..backend.serialization import ConditionEncoder
 
 type Branches = dict[Condition, Tree]
 
@@ -16,7 +19,13 @@ class TreeInfo:
         self.categorical_values = categorical_values
 
 
+# Leaves share a single read-only empty set of branches
+no_branches: Branches = MappingProxyType({})
+
+
 class Tree(Model):
+    __slots__ = ("branches", "prediction", "samples", "column", "error")
+
     def __init__(
         self,
         prediction: np.ndarray,
@@ -25,13 +34,72 @@ class Tree(Model):
         branches: Branches = None,
     ):
         if branches is None:
-            branches = {}
+            branches = no_branches
         self.branches = branches
         self.prediction = prediction
         self.samples = samples
         self.column: str = None
         self.error = error
 
+    def __reduce__(self):
+        # pickle the whole subtree in its compact array form
+        arrays, metadata = self.to_arrays()
+        return (type(self).from_arrays, (arrays, metadata))
+
+    def compile(self):
+        # array-backed form of the tree for fast and memory mapped prediction
+        from .compiled import CompiledTree
+
+        return CompiledTree.from_tree(self)
+
+    def to_arrays(self):
+        encoder = ConditionEncoder()
+        # breadth first order, children of each node are contiguous
+        nodes: list[Tree] = [self]
+        conditions: list[Condition] = []
+        edge_child = []
+        edge_start = [0]
+        i = 0
+        while i < len(nodes):
+            for condition, child in nodes[i].branches.items():
+                conditions.append(condition)
+                edge_child.append(len(nodes))
+                nodes.append(child)
+            edge_start.append(len(edge_child))
+            i += 1
+        column = [-1 if t.column is None else encoder.column(t.column) for t in nodes]
+        arrays = {
+            "prediction": np.stack([t.prediction for t in nodes]),
+            "error": np.array([t.error for t in nodes], dtype=np.float64),
+            "samples": np.array([t.samples for t in nodes], dtype=np.int64),
+            "column": np.array(column, dtype=np.int32),
+            "edge_start": np.array(edge_start, dtype=np.int64),
+            "edge_child": np.array(edge_child, dtype=np.int64),
+            **encoder.encode(conditions, prefix="edge_"),
+        }
+        return arrays, encoder.metadata()
+
+    @classmethod
+    def from_arrays(cls, arrays, metadata):
+        encoder = ConditionEncoder.from_metadata(metadata)
+        conditions = encoder.decode(arrays, prefix="edge_")
+        # node predictions are views of the (possibly memory mapped) array
+        prediction = arrays["prediction"]
+        errors = arrays["error"].tolist()
+        samples = arrays["samples"].tolist()
+        nodes = [
+            cls(prediction[i], e, n) for i, (e, n) in enumerate(zip(errors, samples))
+        ]
+        edge_start = arrays["edge_start"].tolist()
+        edge_child = arrays["edge_child"].tolist()
+        for i, (t, column) in enumerate(zip(nodes, arrays["column"].tolist())):
+            if column >= 0:
+                t.column = encoder.columns[column]
+            edges = range(edge_start[i], edge_start[i + 1])
+            if len(edges) > 0:
+                t.branches = {conditions[e]: nodes[edge_child[e]] for e in edges}
+        return nodes[0]
+
     def output_size(self):
         return len(self.prediction)
 
@@ -42,6 +110,16 @@ class Tree(Model):
                 return child.predict_sample(x)
         return self.prediction
 
+    def predict_dataset(self, d: Dataset, index: np.ndarray, predictions: np.ndarray):
+        # as in predict_sample, each row follows the first branch it satisfies
+        remaining = np.ones(len(index), dtype=bool)
+        for condition, child in self.branches.items():
+            mask = condition.mask(d) & remaining
+            if mask.any():
+                child.predict_dataset(d.subset(mask), index[mask], predictions)
+                remaining &= ~mask
+        predictions[index[remaining], :] = self.prediction
+
     def children(self):
         return list(self.branches.values())
 